@@ -0,0 +1,381 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Binary serialization of token and block chains
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Binary serialization of token and block chains.
+
+The format stores the columns of a :class:`~pyVHDLParser.Columnar.ColumnarDocument`. It starts with a magic number and
+a format version, followed by tables of class names and token values, the optional source code and the columns.
+Strings are stored as UTF-8 prefixed by their length. Integers are stored as unsigned LEB128 varints. Positions and
+indices are stored as zigzag-encoded differences, so most values fit into a single byte. A column, whose values all
+fit into a byte, is stored as raw bytes and read without decoding each value.
+
+Layout::
+
+   magic          b"VHDB"
+   version        varint
+   flags          varint        bit 0: source code is included
+   token classes  varint count, strings "module:qualname"
+   block classes  varint count, strings "module:qualname"
+   strings        varint count, strings
+   source         string        if flag bit 0 is set
+   columns        line starts, token kinds, starts, lengths, values, blocks, block kinds, start tokens, token counts,
+                  multi-part flags
+
+   column         varint count, byte encoding (0 = bytes, 1 = varints), payload
+
+A document is read back as a columnar document. Its token and block views or its linked objects (see
+:meth:`~pyVHDLParser.Columnar.ColumnarDocument.ToBlocks`) are used like the results of the tokenizer and block parser.
+"""
+from array                  import array
+from importlib              import import_module
+from itertools              import accumulate
+from operator               import add
+from pathlib                import Path
+from typing                 import BinaryIO, Dict, Iterable, List, Tuple, Union
+
+from pydecor.decorators     import export
+
+from pyVHDLParser.Base      import ParserException
+from pyVHDLParser.Token     import Token, ValuedToken, StartOfToken, EndOfToken
+from pyVHDLParser.Blocks    import Block, StartOfBlock, EndOfBlock
+from pyVHDLParser.Columnar  import ColumnarDocument
+
+__all__ = []
+__api__ = __all__
+
+
+MAGIC =           b"VHDB"   #: Magic number at the beginning of a serialized document.
+FORMAT_VERSION =  1         #: Version of the format written by :func:`Dump`. Other versions aren't read.
+
+_FLAG_SOURCE =    1
+_BYTES =          0
+_VARINTS =        1
+
+
+@export
+class BinaryFormatException(ParserException):
+	"""Raised, if serialized data is damaged, has an unknown version or references unknown or foreign classes."""
+
+
+def _WriteVarint(buffer: bytearray, value: int):
+	while value > 0x7F:
+		buffer.append((value & 0x7F) | 0x80)
+		value >>= 7
+	buffer.append(value)
+
+
+def _WriteString(buffer: bytearray, value: str):
+	data = value.encode("utf-8", "surrogatepass")
+	_WriteVarint(buffer, len(data))
+	buffer += data
+
+
+def _WriteColumn(buffer: bytearray, values: Iterable[int]):
+	values = list(values)
+	_WriteVarint(buffer, len(values))
+	if all(value < 0x100 for value in values):
+		buffer.append(_BYTES)
+		buffer += bytes(values)
+	else:
+		buffer.append(_VARINTS)
+		for value in values:
+			_WriteVarint(buffer, value)
+
+
+def _ZigZag(values: Iterable[int]) -> List[int]:
+	return [(value << 1) if (value >= 0) else ((-value << 1) - 1) for value in values]
+
+
+def _Differences(values: Iterable[int]) -> List[int]:
+	previous =    0
+	differences = []
+	for value in values:
+		differences.append(value - previous)
+		previous = value
+	return _ZigZag(differences)
+
+
+def _ClassName(cls: type) -> str:
+	return "{0}:{1}".format(cls.__module__, cls.__qualname__)
+
+
+@export
+def Dump(document: Union[ColumnarDocument, Iterable[Block]], includeSource: bool = True) -> bytes:
+	"""
+	Serializes a columnar document or a block stream (see :meth:`~pyVHDLParser.Columnar.ColumnarDocument.FromBlocks`).
+
+	If ``includeSource`` is set, the document's source code is stored, if it's available.
+	"""
+	if not isinstance(document, ColumnarDocument):
+		document = ColumnarDocument.FromBlocks(document)
+
+	source =  document.Source if includeSource else None
+	buffer =  bytearray(MAGIC)
+	_WriteVarint(buffer, FORMAT_VERSION)
+	_WriteVarint(buffer, _FLAG_SOURCE if (source is not None) else 0)
+
+	for table in (
+		[_ClassName(cls) for cls in document.TokenClasses],
+		[_ClassName(cls) for cls in document.BlockClasses],
+		document.Strings
+	):
+		_WriteVarint(buffer, len(table))
+		for item in table:
+			_WriteString(buffer, item)
+
+	if source is not None:
+		_WriteString(buffer, source)
+
+	starts =      document.TokenStarts
+	startTokens = document.BlockStartTokens
+	_WriteColumn(buffer, _Differences(document.LineStarts))
+	_WriteColumn(buffer, document.TokenKinds)
+	_WriteColumn(buffer, _Differences(starts))
+	_WriteColumn(buffer, _ZigZag(map(int.__sub__, document.TokenEnds, starts)))
+	_WriteColumn(buffer, (value + 1 for value in document.TokenValues))
+	_WriteColumn(buffer, _Differences(document.TokenBlocks))
+	_WriteColumn(buffer, document.BlockKinds)
+	_WriteColumn(buffer, _Differences(startTokens))
+	_WriteColumn(buffer, _ZigZag(map(int.__sub__, document.BlockEndTokens, startTokens)))
+	_WriteColumn(buffer, document.BlockMultiParts)
+
+	return bytes(buffer)
+
+
+class _Reader:
+	"""Reads the items of a serialized document."""
+
+	_data:     bytes
+	_offset:   int
+
+	def __init__(self, data: bytes):
+		self._data =    data
+		self._offset =  0
+
+	def ReadBytes(self, count: int) -> bytes:
+		offset = self._offset
+		end =    offset + count
+		if (end > len(self._data)):
+			raise BinaryFormatException("Unexpected end of data at byte {0}.".format(offset))
+		self._offset = end
+		return self._data[offset:end]
+
+	def ReadVarint(self) -> int:
+		data =   self._data
+		offset = self._offset
+		value =  0
+		shift =  0
+		try:
+			while True:
+				byte = data[offset]
+				offset += 1
+				value |= (byte & 0x7F) << shift
+				if (byte < 0x80):
+					break
+				shift += 7
+		except IndexError:
+			raise BinaryFormatException("Unexpected end of data at byte {0}.".format(offset)) from None
+
+		self._offset = offset
+		return value
+
+	def ReadString(self) -> str:
+		return self.ReadBytes(self.ReadVarint()).decode("utf-8", "surrogatepass")
+
+	def ReadStrings(self) -> List[str]:
+		return [self.ReadString() for _ in range(self.ReadVarint())]
+
+	def ReadColumn(self) -> List[int]:
+		count =    self.ReadVarint()
+		encoding = self.ReadBytes(1)[0]
+		if (encoding == _BYTES):
+			return list(self.ReadBytes(count))
+		elif (encoding != _VARINTS):
+			raise BinaryFormatException("Unknown column encoding {0} at byte {1}.".format(encoding, self._offset - 1))
+
+		data =   self._data
+		offset = self._offset
+		values = [0] * count
+		try:
+			for index in range(count):
+				byte = data[offset]
+				offset += 1
+				if (byte < 0x80):
+					values[index] = byte
+					continue
+
+				value = byte & 0x7F
+				shift = 7
+				while True:
+					byte = data[offset]
+					offset += 1
+					value |= (byte & 0x7F) << shift
+					if (byte < 0x80):
+						break
+					shift += 7
+				values[index] = value
+		except IndexError:
+			raise BinaryFormatException("Unexpected end of data at byte {0}.".format(offset)) from None
+
+		self._offset = offset
+		return values
+
+	def ReadSigned(self) -> List[int]:
+		return [(value >> 1) ^ -(value & 1) for value in self.ReadColumn()]
+
+	def ReadSums(self) -> List[int]:
+		return list(accumulate(self.ReadSigned()))
+
+
+_PACKAGE =                 __name__.partition(".")[0] + "."
+_classes: Dict[str, type] = {}
+
+
+def _LoadClass(name: str, baseClass: type) -> type:
+	"""Returns a token or block class by name. Only classes derived from ``baseClass`` in this package are loaded."""
+	cls = _classes.get(name)
+	if cls is None:
+		moduleName, _, qualifiedName = name.partition(":")
+		if not moduleName.startswith(_PACKAGE):
+			raise BinaryFormatException("Class '{0}' isn't part of package '{1}'.".format(name, _PACKAGE[:-1]))
+
+		try:
+			cls = import_module(moduleName)
+			for part in qualifiedName.split("."):
+				cls = getattr(cls, part)
+		except (ImportError, AttributeError) as ex:
+			raise BinaryFormatException("Unknown class '{0}'.".format(name)) from ex
+
+		_classes[name] = cls
+	if not (isinstance(cls, type) and issubclass(cls, baseClass)):
+		raise BinaryFormatException("'{0}' isn't a {1} class.".format(name, baseClass.__name__))
+	return cls
+
+
+def _CheckIndices(values: array, count: int, name: str):
+	"""Checks that all indices of a column reference an item or are -1."""
+	if values and ((min(values) < -1) or (max(values) >= count)):
+		raise BinaryFormatException("Column '{0}' references an index out of range.".format(name))
+
+
+def _CheckPositions(document: ColumnarDocument):
+	"""Checks that all tokens, except start and end of document tokens, have a position within the source code."""
+	length =     len(document.Source) + 1 if (document.Source is not None) else 1 << 62
+	positioned = [not issubclass(cls, (StartOfToken, EndOfToken)) for cls in document.TokenClasses]
+	for kind, start, end in zip(document.TokenKinds, document.TokenStarts, document.TokenEnds):
+		if not ((0 <= start <= end + 1 <= length) if positioned[kind] else (-1 <= end < length)):
+			raise BinaryFormatException("Token at {0} has an invalid position.".format(start))
+
+
+def _CheckColumns(document: ColumnarDocument):
+	"""Checks that all columns have the same length and only reference existing classes, strings, tokens and blocks."""
+	tokenCount = len(document.TokenKinds)
+	blockCount = len(document.BlockKinds)
+	if not (len(document.TokenStarts) == len(document.TokenEnds) == len(document.TokenValues) == tokenCount and
+			len(document.TokenBlocks) in (0, tokenCount) and
+			len(document.BlockStartTokens) == len(document.BlockEndTokens) == len(document.BlockMultiParts) == blockCount):
+		raise BinaryFormatException("Columns have different lengths.")
+	if ((tokenCount > 0) and (max(document.TokenKinds) >= len(document.TokenClasses))) or \
+			((blockCount > 0) and (max(document.BlockKinds) >= len(document.BlockClasses))):
+		raise BinaryFormatException("Column references an unknown class.")
+
+	_CheckIndices(document.TokenValues, len(document.Strings), "TokenValues")
+	_CheckIndices(document.TokenBlocks, blockCount, "TokenBlocks")
+	_CheckIndices(document.BlockStartTokens, tokenCount, "BlockStartTokens")
+	_CheckIndices(document.BlockEndTokens, tokenCount, "BlockEndTokens")
+
+	valued = [issubclass(cls, ValuedToken) for cls in document.TokenClasses]
+	if any(valued[kind] is (value < 0) for kind, value in zip(document.TokenKinds, document.TokenValues)):
+		raise BinaryFormatException("Column 'TokenValues' doesn't match the token classes.")
+
+	bounded = [not issubclass(cls, (StartOfBlock, EndOfBlock)) for cls in document.BlockClasses]
+	if any(bounded[kind] and ((start < 0) or (end < 0)) for kind, start, end in zip(document.BlockKinds, document.BlockStartTokens, document.BlockEndTokens)):
+		raise BinaryFormatException("Block has no start or end token.")
+
+	_CheckPositions(document)
+
+
+@export
+def Load(data: bytes) -> ColumnarDocument:
+	"""
+	Reads a document serialized by :func:`Dump`.
+
+	Only token and block classes of this package are loaded. Column values are checked, so damaged data raises a
+	:exc:`BinaryFormatException` instead of failing when the document is used.
+	"""
+	reader = _Reader(data)
+	if (reader.ReadBytes(len(MAGIC)) != MAGIC):
+		raise BinaryFormatException("Data isn't a serialized document.")
+
+	version = reader.ReadVarint()
+	if (version != FORMAT_VERSION):
+		raise BinaryFormatException("Unsupported format version {0} (expected {1}).".format(version, FORMAT_VERSION))
+
+	flags =    reader.ReadVarint()
+	document = ColumnarDocument()
+	try:
+		document.TokenClasses =     [_LoadClass(name, Token) for name in reader.ReadStrings()]
+		document.BlockClasses =     [_LoadClass(name, Block) for name in reader.ReadStrings()]
+		document.Strings =          reader.ReadStrings()
+		document.Source =           reader.ReadString() if (flags & _FLAG_SOURCE) else None
+
+		document.LineStarts =       array("L", reader.ReadSums())
+		document.TokenKinds =       array("H", reader.ReadColumn())
+		starts =                    reader.ReadSums()
+		document.TokenStarts =      array("q", starts)
+		document.TokenEnds =        array("q", map(add, starts, reader.ReadSigned()))
+		document.TokenValues =      array("l", (value - 1 for value in reader.ReadColumn()))
+		document.TokenBlocks =      array("l", reader.ReadSums())
+		document.BlockKinds =       array("H", reader.ReadColumn())
+		startTokens =               reader.ReadSums()
+		document.BlockStartTokens = array("l", startTokens)
+		document.BlockEndTokens =   array("l", map(add, startTokens, reader.ReadSigned()))
+		document.BlockMultiParts =  array("B", reader.ReadColumn())
+	except (ValueError, OverflowError) as ex:
+		# undecodable strings and values, which don't fit into a column's array
+		raise BinaryFormatException("Data is damaged: {0}".format(ex)) from ex
+
+	_CheckColumns(document)
+
+	return document
+
+
+@export
+def Write(document: Union[ColumnarDocument, Iterable[Block]], file: Union[Path, BinaryIO], includeSource: bool = True):
+	"""Writes a serialized document (see :func:`Dump`) to a path or a binary file object."""
+	data = Dump(document, includeSource)
+	if isinstance(file, Path):
+		file.write_bytes(data)
+	else:
+		file.write(data)
+
+
+@export
+def Read(file: Union[Path, BinaryIO]) -> ColumnarDocument:
+	"""Reads a serialized document (see :func:`Load`) from a path or a binary file object."""
+	return Load(file.read_bytes() if isinstance(file, Path) else file.read())
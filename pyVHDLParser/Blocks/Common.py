@@ -29,7 +29,7 @@
 from pydecor.decorators       import export
 
 from pyVHDLParser.Token       import SpaceToken, IndentationToken
-from pyVHDLParser.Blocks      import ParserState, SkipableBlock
+from pyVHDLParser.Blocks      import ParserState, SkipableBlock, BlockCategory
 
 __all__ = []
 __api__ = __all__
@@ -37,6 +37,8 @@ __api__ = __all__
 
 @export
 class WhitespaceBlock(SkipableBlock):
+	CATEGORY = BlockCategory.Whitespace
+
 	def __init__(self, previousBlock, startToken):
 		super().__init__(previousBlock, startToken, startToken)
 
@@ -51,6 +53,8 @@ class WhitespaceBlock(SkipableBlock):
 
 @export
 class LinebreakBlock(WhitespaceBlock):
+	CATEGORY = BlockCategory.Linebreak
+
 	@classmethod
 	def stateLinebreak(cls, parserState: ParserState):
 		token = parserState.Token
@@ -70,11 +74,12 @@ class LinebreakBlock(WhitespaceBlock):
 
 @export
 class EmptyLineBlock(LinebreakBlock):
-	pass
+	CATEGORY = BlockCategory.EmptyLine
 
 
 @export
 class IndentationBlock(WhitespaceBlock):
+	CATEGORY =    BlockCategory.Indentation
 	__TABSIZE__ = 2
 
 	def __repr__(self):
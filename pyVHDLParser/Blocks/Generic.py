@@ -28,7 +28,7 @@
 # load dependencies
 from pydecor.decorators                   import export
 
-from pyVHDLParser.Token                   import LinebreakToken, WordToken, SpaceToken, CommentToken, IndentationToken
+from pyVHDLParser.Token                   import TokenCategory
 from pyVHDLParser.Token.Keywords          import AssertKeyword, EndKeyword, ProcessKeyword, ReportKeyword, IfKeyword, ForKeyword, ReturnKeyword, NextKeyword, NullKeyword
 from pyVHDLParser.Token.Keywords          import ExitKeyword, UseKeyword, SignalKeyword, ConstantKeyword, SharedKeyword, FunctionKeyword, ProcedureKeyword
 from pyVHDLParser.Token.Keywords          import ImpureKeyword, PureKeyword, VariableKeyword, BeginKeyword, CaseKeyword
@@ -70,30 +70,31 @@ class DeclarativeRegion(metaclass=MetaBlock):
 
 	@classmethod
 	def stateDeclarativeRegion(cls, parserState: ParserState):
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =                 IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
+		token =    parserState.Token
+		category = token.CATEGORY
+		if (category & TokenCategory.Space):
+			blockType =                 IndentationBlock if (category & TokenCategory.Indentation) else WhitespaceBlock
 			parserState.NewBlock =      blockType(parserState.LastBlock, token)
 			parserState.TokenMarker =   None
 			return
-		elif isinstance(token, LinebreakToken):
+		elif (category & TokenCategory.Linebreak):
 			parserState.NewBlock =      LinebreakBlock(parserState.LastBlock, token)
 			parserState.TokenMarker =   None
 			return
-		elif isinstance(token, CommentToken):
+		elif (category & TokenCategory.Comment):
 			parserState.NewBlock =      CommentBlock(parserState.LastBlock, token)
 			parserState.TokenMarker =   None
 			return
-		elif isinstance(token, WordToken):
+		elif (category & TokenCategory.Word):
 			tokenValue = token.Value.lower()
 
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =  BeginKeyword(token)
@@ -167,27 +168,28 @@ class ConcurrentBeginBlock(BeginBlock):
 
 	@classmethod
 	def stateConcurrentRegion(cls, parserState: ParserState):
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
+		token =    parserState.Token
+		category = token.CATEGORY
+		if (category & TokenCategory.Space):
+			blockType =               IndentationBlock if (category & TokenCategory.Indentation) else WhitespaceBlock
 			parserState.NewBlock =    blockType(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (category & (TokenCategory.Linebreak | TokenCategory.Comment)):
+			block =                   LinebreakBlock if (category & TokenCategory.Linebreak) else CommentBlock
 			parserState.NewBlock =    block(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
-		elif isinstance(token, WordToken):
+		elif (category & TokenCategory.Word):
 			tokenValue = token.Value.lower()
 
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken = keyword(token)
-					parserState.PushState = cls.KEYWORDS[keyword]
-					parserState.NewToken = newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "end"):
 				parserState.NewToken =  EndKeyword(token)
@@ -240,27 +242,28 @@ class SequentialBeginBlock(BeginBlock):
 
 	@classmethod
 	def stateAnyRegion(cls, parserState: ParserState):
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
+		token =    parserState.Token
+		category = token.CATEGORY
+		if (category & TokenCategory.Space):
+			blockType =               IndentationBlock if (category & TokenCategory.Indentation) else WhitespaceBlock
 			parserState.NewBlock =    blockType(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (category & (TokenCategory.Linebreak | TokenCategory.Comment)):
+			block =                   LinebreakBlock if (category & TokenCategory.Linebreak) else CommentBlock
 			parserState.NewBlock =    block(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
-		elif isinstance(token, WordToken):
+		elif (category & TokenCategory.Word):
 			tokenValue = token.Value.lower()
 
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "end"):
 				parserState.NewToken =  EndKeyword(token)
@@ -163,13 +163,13 @@ class NameBlock(Block):
 			return
 		elif isinstance(token, WordToken):
 			tokenValue = token.Value.lower()
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "end"):
 				parserState.NewToken =    EndKeyword(token)
@@ -119,14 +119,14 @@ class OpenBlock(Block):
 
 			parserState.NewBlock =      cls(parserState.LastBlock, parserState.TokenMarker, endToken=token.PreviousToken)
 
-			for keyword in OpenBlock2.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken = keyword(token)
-					parserState.NextState =  DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = OpenBlock2.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =    BeginKeyword(token)
@@ -168,14 +168,14 @@ class OpenBlock2(Block):
 		if isinstance(token, WordToken):
 			tokenValue = token.Value.lower()
 
-			for keyword in OpenBlock2.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   OpenBlock2.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = OpenBlock2.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =    BeginKeyword(token)
@@ -209,14 +209,14 @@ class OpenBlock2(Block):
 		if isinstance(token, WordToken):
 			tokenValue = token.Value.lower()
 
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.NextState =   DeclarativeRegion.stateDeclarativeRegion
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =    BeginKeyword(token)
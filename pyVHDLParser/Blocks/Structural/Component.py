@@ -167,13 +167,13 @@ class NameBlock(Block):
 		elif isinstance(token, WordToken):
 			tokenValue = token.Value.lower()
 
-			for keyword in cls.__KEYWORDS__:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.__KEYWORDS__[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "end"):
 				parserState.NewToken =  EndKeyword(token)
@@ -183,7 +183,7 @@ class NameBlock(Block):
 		raise BlockParserException(
 			"Expected one of these keywords: END, {keywords}. Found: '{tokenValue}'.".format(
 				keywords=", ".join(
-					[kw.__KEYWORD__.upper() for kw in cls.__KEYWORDS__]
+					[kw.__KEYWORD__.upper() for kw in cls.KEYWORDS]
 				),
 				tokenValue=token.Value
 			), token)
@@ -169,13 +169,13 @@ class NameBlock(Block):
 		elif isinstance(token, WordToken):
 			tokenValue = token.Value.lower()
 
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.KEYWORDS):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 			if (tokenValue == "begin"):
 				parserState.NewToken =  BeginKeyword(token)
@@ -25,16 +25,20 @@
 # limitations under the License.
 # ==============================================================================
 #
+from enum                           import Enum
+from functools                      import wraps
 from types                          import FunctionType
-from typing                         import List, Callable, Iterator, Generator
+from typing                         import List, Callable, Iterator, Generator, Dict, Tuple
 
 from pydecor.decorators             import export
-from pyTerminalUI                   import LineTerminal
 
 from pyVHDLParser                   import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
+from pyVHDLParser                   import Debug
+from pyVHDLParser.Debug             import TraceEvent, Trace
 from pyVHDLParser.Base              import ParserException
-from pyVHDLParser.Token             import CharacterToken, Token, SpaceToken, IndentationToken, LinebreakToken, CommentToken, TokenIterator
-from pyVHDLParser.Token             import WordToken, EndOfDocumentToken, StartOfDocumentToken
+from pyVHDLParser.Token             import CharacterToken, Token, TokenIterator, TokenCategory, GetSourceText
+from pyVHDLParser.Token             import EndOfDocumentToken, StartOfDocumentToken
+from pyVHDLParser.Token.Parser      import Tokenizer
 from pyVHDLParser.Token.Keywords    import LibraryKeyword, UseKeyword, ContextKeyword, EntityKeyword, ArchitectureKeyword, PackageKeyword
 
 __all__ = []
@@ -61,13 +65,139 @@ class BlockParserException(ParserException):
 class TokenToBlockParser:
 	"""Wrapping class to offer some class methods."""
 
+	class WhitespaceMode(Enum):
+		"""Selects how whitespace, indentation and linebreak blocks are emitted."""
+		Emit =      0   #: Emit one block per whitespace, indentation or linebreak token.
+		Coalesce =  1   #: Emit one block per run of whitespace, indentation and linebreak tokens.
+		Skip =      2   #: Don't emit whitespace, indentation and linebreak blocks.
+
 	@staticmethod
-	def Transform(tokenGenerator: Iterator[Token]) -> Generator['Block', Token, None]:
-		"""Returns a generator, that reads from a token generator and emits a chain of blocks."""
+	def Transform(tokenGenerator: Iterator[Token], whitespaceMode: 'TokenToBlockParser.WhitespaceMode' = WhitespaceMode.Emit, release: bool = False) -> Generator['Block', Token, None]:
+		"""
+		Returns a generator, that reads from a token generator and emits a chain of blocks.
+
+		A trivia-attached token stream (see :meth:`~pyVHDLParser.Token.Parser.Tokenizer.AttachTrivia`) is expanded
+		on the fly, because blocks begin and end at whitespace, linebreak and comment tokens.
+
+		The ``whitespaceMode`` parameter selects, if whitespace blocks are emitted as is, coalesced or skipped (see
+		:class:`WhitespaceMode`). The token chain is not changed, and neighbouring blocks are linked to each other.
 
-		state = ParserState(tokenGenerator)
+		If ``release`` is set, the back-links of consumed blocks and tokens are removed (see :meth:`ReleaseBlocks`).
+		"""
+
+		state = ParserState(tokenGenerator, whitespaceMode)
+		if release:
+			return TokenToBlockParser.ReleaseBlocks(state.GetGenerator())
 		return state.GetGenerator()
 
+	@staticmethod
+	def ReleaseBlocks(blockGenerator: Iterator['Block']) -> Generator['Block', None, None]:
+		"""
+		Returns a generator, that forwards a block stream and removes the back-links of consumed blocks and tokens.
+
+		When the next block is requested, the previously emitted block is unlinked from its predecessor and all tokens up
+		to the block's first token are unlinked from their predecessors. Neither chain is a reference cycle anymore, so
+		blocks and tokens are freed as soon as the consumer drops them and a scan over a large source runs in constant
+		memory. The consumer must not follow :attr:`Block.PreviousBlock` or
+		:attr:`~pyVHDLParser.Token.Token.PreviousToken` beyond the last block read. The links needed by the block
+		parser itself are kept.
+		"""
+		lastBlock = None
+		lastToken = None    #: Last token unlinked from its predecessor.
+		for block in blockGenerator:
+			if lastBlock is not None:
+				stopToken = lastBlock.StartToken
+				token =     lastToken
+				while ((token is not stopToken) and (token is not block.StartToken)):
+					token = token.NextToken
+					if token is None:
+						break
+					token._previousToken = None
+				lastToken = stopToken
+				lastBlock._previousBlock = None
+			else:
+				lastToken = block.StartToken
+
+			yield block
+			lastBlock = block
+
+
+@export
+class ParserCheckpoint:
+	"""
+	An immutable snapshot of a :class:`ParserState` at a block boundary.
+
+	A checkpoint is taken before the parser reads :attr:`Token`, after all blocks in front of it were emitted. The
+	parser is resumed from a checkpoint by :meth:`ParserState.FromCheckpoint`.
+	"""
+
+	__slots__ = ("_token", "_nextState", "_stack", "_counter", "_tokenMarker", "_lastBlock", "_blockCount")
+
+	def __init__(self, token: Token, nextState: Callable, stack: Tuple, counter: int, tokenMarker: Token, lastBlock: 'Block', blockCount: int):
+		self._token =       token
+		self._nextState =   nextState
+		self._stack =       stack
+		self._counter =     counter
+		self._tokenMarker = tokenMarker
+		self._lastBlock =   lastBlock
+		self._blockCount =  blockCount
+
+	@property
+	def Token(self) -> Token:
+		"""Returns the token, which is read next by a resumed parser."""
+		return self._token
+
+	@property
+	def NextState(self) -> Callable:
+		return self._nextState
+
+	@property
+	def Stack(self) -> Tuple:
+		"""Returns the pushed states and counters as a tuple of pairs."""
+		return self._stack
+
+	@property
+	def Counter(self) -> int:
+		return self._counter
+
+	@property
+	def TokenMarker(self) -> Token:
+		return self._tokenMarker
+
+	@property
+	def LastBlock(self) -> 'Block':
+		"""Returns the last block emitted in front of the checkpoint."""
+		return self._lastBlock
+
+	@property
+	def BlockCount(self) -> int:
+		"""Returns the number of blocks emitted in front of the checkpoint."""
+		return self._blockCount
+
+	def Matches(self, other: 'ParserCheckpoint') -> bool:
+		"""
+		Returns true, if parsers resumed from both checkpoints emit the same blocks for the same tokens.
+
+		Both checkpoints must be taken at the same token with the same states, counters and token marker. Block states
+		only check the class and the first token of the last block, so the last blocks may be different objects.
+		"""
+		return (
+			(self._token is other._token) and
+			(self._tokenMarker is other._tokenMarker) and
+			(self._counter == other._counter) and
+			(self._nextState == other._nextState) and
+			(self._stack == other._stack) and
+			(self._lastBlock.__class__ is other._lastBlock.__class__) and
+			(self._lastBlock.StartToken is other._lastBlock.StartToken)
+		)
+
+	def __repr__(self) -> str:
+		return "<ParserCheckpoint {state} at {token!s} after {count} blocks>".format(
+			state=self._nextState.__func__.__qualname__,
+			token=self._token,
+			count=self._blockCount
+		)
+
 
 @export
 class ParserState:
@@ -76,6 +206,8 @@ class ParserState:
 	_iterator:     Iterator[Token]
 	_stack:        List[Callable]
 	_tokenMarker:  Token
+	_whitespaceMode: TokenToBlockParser.WhitespaceMode
+	_checkpointInterval: int
 
 	Token:         Token
 	NextState:     Callable
@@ -84,19 +216,32 @@ class ParserState:
 	NewBlock:      'Block'
 	LastBlock:     'Block'
 	Counter:       int
+	BlockCount:    int                       #: Number of emitted blocks.
+	Checkpoints:   List[ParserCheckpoint]    #: Checkpoints recorded by :meth:`GetGenerator`.
 
-	def __init__(self, tokenGenerator):
-		"""Initializes the parser state."""
+	def __init__(self, tokenGenerator, whitespaceMode: TokenToBlockParser.WhitespaceMode = TokenToBlockParser.WhitespaceMode.Emit, checkpointInterval: int = 0):
+		"""
+		Initializes the parser state.
+
+		If ``checkpointInterval`` is set, a :class:`ParserCheckpoint` is recorded in :attr:`Checkpoints` at the first
+		block boundary after every ``checkpointInterval`` emitted blocks.
+		"""
 
 		self._iterator =    iter(tokenGenerator)
 		self._stack =       []
 		self._tokenMarker = None
+		self._whitespaceMode = whitespaceMode
+		self._checkpointInterval = checkpointInterval
+		self.BlockCount =   0
+		self.Checkpoints =  []
 
 		startToken =        next(self._iterator)
 		startBlock =        StartOfDocumentBlock(startToken)
 
 		if (not isinstance(startToken, StartOfDocumentToken)):
 			raise BlockParserException("First token is not a StartOfDocumentToken.", startToken)
+		if (startToken._trivia is not None):
+			self._iterator =  Tokenizer.ExpandTrivia(self._iterator, startToken)
 
 		self.Token =        startBlock.StartToken
 		self.NextState =    StartOfDocumentBlock.stateDocument
@@ -106,6 +251,38 @@ class ParserState:
 		self.LastBlock =    None
 		self.Counter =      0
 
+	@classmethod
+	def FromCheckpoint(cls, checkpoint: ParserCheckpoint, tokenGenerator, whitespaceMode: TokenToBlockParser.WhitespaceMode = TokenToBlockParser.WhitespaceMode.Emit, checkpointInterval: int = 0) -> 'ParserState':
+		"""
+		Returns a parser state resumed from a checkpoint.
+
+		The token generator continues with the checkpoint's token (or a token replacing it) and its successors, which
+		are not specialized by a previous block parser yet. The first emitted block is linked to the checkpoint's last
+		block.
+		"""
+		state = cls.__new__(cls)
+		state._iterator =    iter(tokenGenerator)
+		state._stack =       list(checkpoint._stack)
+		# a marker at the checkpoint's token is set to the first token read
+		state._tokenMarker = None if (checkpoint._tokenMarker is checkpoint._token) else checkpoint._tokenMarker
+		state._whitespaceMode = whitespaceMode
+		state._checkpointInterval = checkpointInterval
+		state.BlockCount =   checkpoint._blockCount
+		state.Checkpoints =  []
+
+		state.Token =        checkpoint._token
+		state.NextState =    checkpoint._nextState
+		state.ReIssue =      False
+		state.NewToken =     None
+		state.NewBlock =     None
+		state.LastBlock =    checkpoint._lastBlock
+		state.Counter =      checkpoint._counter
+		return state
+
+	def GetCheckpoint(self) -> ParserCheckpoint:
+		"""Returns a snapshot of the parser state. It's only valid at a block boundary (see :class:`ParserCheckpoint`)."""
+		return ParserCheckpoint(self.Token, self.NextState, tuple(self._stack), self.Counter, self._tokenMarker, self.LastBlock, self.BlockCount)
+
 
 	@property
 	def PushState(self) -> Callable:
@@ -116,14 +293,16 @@ class ParserState:
 			self.NextState,
 			self.Counter
 		))
-		LineTerminal().WriteDebug("  pushed: " + str(self.NextState))
+		if Debug.TRACING:
+			Trace(TraceEvent.PushState, self, self.NextState)
 		self.NextState =    value
 		self._tokenMarker =  None
 
 	@property
 	def TokenMarker(self) -> Token:
 		if ((self.NewToken is not None) and (self._tokenMarker is self.Token)):
-			LineTerminal().WriteDebug("  {DARK_GREEN}@TokenMarker: {0!s} => {GREEN}{1!s}{NOCOLOR}".format(self._tokenMarker, self.NewToken, **LineTerminal.Foreground))
+			if Debug.TRACING:
+				Trace(TraceEvent.TokenMarker, self, self._tokenMarker, self.NewToken)
 			self._tokenMarker = self.NewToken
 		return self._tokenMarker
 	@TokenMarker.setter
@@ -152,7 +331,8 @@ class ParserState:
 		top = None
 		for i in range(n):
 			top = self._stack.pop()
-			LineTerminal().WriteDebug("popped: " + str(top[0]))
+			if Debug.TRACING:
+				Trace(TraceEvent.PopState, self, top[0])
 		self.NextState =    top[0]
 		self.Counter =      top[1]
 		self._tokenMarker = tokenMarker
@@ -163,28 +343,67 @@ class ParserState:
 		from pyVHDLParser.Blocks            import BlockParserException, EndOfDocumentBlock
 		from pyVHDLParser.Blocks.Common     import LinebreakBlock, EmptyLineBlock
 
+		emitWhitespace =  self._whitespaceMode is TokenToBlockParser.WhitespaceMode.Emit
+		coalesce =        self._whitespaceMode is TokenToBlockParser.WhitespaceMode.Coalesce
+		pendingBlock =    None    #: Coalesced run of whitespace blocks, which is emitted before the next block.
+		interval =        self._checkpointInterval
+		nextCheckpoint =  self.BlockCount + interval
+
 		for token in self._iterator:
 			# set parserState.Token to current token
 			self.Token = token
 
 			# overwrite an existing token and connect the next token with the new one
+			# (a token specialized in place is already linked)
 			if (self.NewToken is not None):
 				# print("{MAGENTA}NewToken: {token}{NOCOLOR}".format(token=self.NewToken, **Console.Foreground))
-				# update topmost TokenMarker
-				if (self._tokenMarker is token.PreviousToken):
-					# XXX: LineTerminal().WriteDebug("  update token marker: {0!s} -> {1!s}".format(self._tokenMarker, self.NewToken))
-					self._tokenMarker = self.NewToken
+				if (self.NewToken is not token.PreviousToken):
+					# update topmost TokenMarker
+					if (self._tokenMarker is token.PreviousToken):
+						# XXX: LineTerminal().WriteDebug("  update token marker: {0!s} -> {1!s}".format(self._tokenMarker, self.NewToken))
+						self._tokenMarker = self.NewToken
 
-				token.PreviousToken = self.NewToken
+					token.PreviousToken = self.NewToken
 				self.NewToken =       None
 
 			# an empty marker means: fill on next yield run
 			if (self._tokenMarker is None):
-				LineTerminal().WriteDebug("  new token marker: None -> {0!s}".format(token))
+				if Debug.TRACING:
+					Trace(TraceEvent.NewTokenMarker, self, token)
 				self._tokenMarker = token
 
 			# a new block is assembled
 			while (self.NewBlock is not None):
+				if (not emitWhitespace):
+					# whitespace blocks are coalesced or skipped, following blocks are linked to the last emitted block
+					block =         self.NewBlock
+					self.NewBlock = block.NextBlock
+					if (block.CATEGORY & BlockCategory.Whitespace):
+						if not coalesce:
+							continue
+						if (pendingBlock is None):
+							pendingBlock = block
+							if (block.PreviousBlock is not self.LastBlock):
+								block.PreviousBlock = self.LastBlock
+						else:
+							pendingBlock.EndToken = block.EndToken
+							if (block.CATEGORY & BlockCategory.Linebreak):
+								pendingBlock.__class__ = EmptyLineBlock if (pendingBlock.CATEGORY & BlockCategory.Linebreak) else LinebreakBlock
+						pendingBlock.NextBlock = None
+						self.LastBlock =         pendingBlock
+						continue
+
+					if (pendingBlock is not None):
+						self.BlockCount += 1
+						yield pendingBlock
+						pendingBlock = None
+					if (block.PreviousBlock is not self.LastBlock):
+						block.PreviousBlock = self.LastBlock
+					self.LastBlock = block
+					self.BlockCount += 1
+					yield block
+					continue
+
 				if (isinstance(self.NewBlock, LinebreakBlock) and isinstance(self.LastBlock, (LinebreakBlock, EmptyLineBlock))):
 					self.LastBlock = EmptyLineBlock(self.LastBlock, self.NewBlock.StartToken)
 					self.LastBlock.NextBlock = self.NewBlock.NextBlock
@@ -192,8 +411,14 @@ class ParserState:
 					self.LastBlock = self.NewBlock
 
 				self.NewBlock =  self.NewBlock.NextBlock
+				self.BlockCount += 1
 				yield self.LastBlock
 
+			# all blocks in front of the current token are emitted
+			if (interval and (self.BlockCount >= nextCheckpoint) and (pendingBlock is None)):
+				self.Checkpoints.append(self.GetCheckpoint())
+				nextCheckpoint = self.BlockCount + interval
+
 			# if self.debug: print("{MAGENTA}------ iteration end ------{NOCOLOR}".format(**Console.Foreground))
 			# XXX: LineTerminal().WriteDebug("    {DARK_GRAY}state={state!s: <50}  token={token!s: <40}{NOCOLOR}   ".format(state=self, token=token, **LineTerminal.Foreground))
 			# execute a state
@@ -201,11 +426,41 @@ class ParserState:
 
 		else:
 			if (isinstance(self.Token, EndOfDocumentToken) and isinstance(self.NewBlock, EndOfDocumentBlock)):
+				if (not emitWhitespace):
+					if (pendingBlock is not None):
+						self.BlockCount += 1
+						yield pendingBlock
+					if (self.NewBlock.PreviousBlock is not self.LastBlock):
+						self.NewBlock.PreviousBlock = self.LastBlock
+				self.BlockCount += 1
 				yield self.NewBlock
 			else:
 				raise BlockParserException("Unexpected end of document.", self.Token)
 
 
+@export
+class BlockCategory:
+	"""
+	Bit flags describing the category of a block class.
+
+	Each block class carries the union of its categories in :attr:`Block.CATEGORY`. A flag
+	is set, if and only if the block is an instance of the corresponding base-class, so
+	``block.CATEGORY & BlockCategory.Comment`` is equivalent to ``isinstance(block, CommentBlock)``.
+	All flags are plain integers.
+	"""
+
+	Meta =        0x0001   #: :class:`StartOfBlock` or :class:`EndOfBlock`
+	Skipable =    0x0002   #: :class:`SkipableBlock`
+	Final =       0x0004   #: :class:`FinalBlock`
+	Comment =     0x0008   #: :class:`CommentBlock`
+	Whitespace =  0x0010   #: :class:`~pyVHDLParser.Blocks.Common.WhitespaceBlock`
+	Linebreak =   0x0020   #: :class:`~pyVHDLParser.Blocks.Common.LinebreakBlock`
+	EmptyLine =   0x0040   #: :class:`~pyVHDLParser.Blocks.Common.EmptyLineBlock`
+	Indentation = 0x0080   #: :class:`~pyVHDLParser.Blocks.Common.IndentationBlock`
+
+	Trivia =      Whitespace | Linebreak | Indentation | Comment   #: Blocks without meaning for the VHDL grammar.
+
+
 @export
 class MetaBlock(type):
 	"""
@@ -215,6 +470,12 @@ class MetaBlock(type):
 
 	* Register all classes of type :class:`Block` or derived variants in a class field :attr:`Block.BLOCKS` in this meta-class.
 	* Register all method of name `state....` in the constructed class' attribute :attr:`Block.__STATES__`.
+	* Add an empty :attr:`__slots__` declaration to all classes not declaring their own slots, so
+	  no block instance carries a ``__dict__``.
+	* Wrap a class' ``__cls_init__`` method, so a class field :attr:`Block.KEYWORD_DISPATCH` is built
+	  from :attr:`Block.KEYWORDS` at class-init time. It maps a lowercased keyword to a tuple of
+	  keyword token class and transition.
+	* Merge the :attr:`Block.CATEGORY` flags of all base-classes into the class' own flags.
 	"""
 
 	BLOCKS: List['Block'] = []     #: List of all classes of type :class:`Block` or derived variants
@@ -228,11 +489,33 @@ class MetaBlock(type):
 				states.append(memberObject)
 
 		classMembers['__STATES__'] = states
+		classMembers.setdefault("__slots__", ())
+
+		category = classMembers.get("CATEGORY", 0)
+		for baseClass in baseClasses:
+			category |= getattr(baseClass, "CATEGORY", 0)
+		classMembers["CATEGORY"] = category
+
+		initializer = classMembers.get("__cls_init__")
+		if isinstance(initializer, classmethod):
+			classMembers["__cls_init__"] = classmethod(cls._WrapInitializer(initializer.__func__))
 
 		block = super().__new__(cls, className, baseClasses, classMembers)
 		cls.BLOCKS.append(block)
 		return block
 
+	@staticmethod
+	def _WrapInitializer(initializer: Callable) -> Callable:
+		@wraps(initializer)
+		def __cls_init__(blockClass):
+			initializer(blockClass)
+
+			keywords = blockClass.KEYWORDS
+			if (keywords is not None):
+				blockClass.KEYWORD_DISPATCH = {keyword.__KEYWORD__: (keyword, transition) for keyword, transition in keywords.items()}
+
+		return __cls_init__
+
 
 @export
 class BlockIterator:
@@ -316,13 +599,19 @@ class Block(metaclass=MetaBlock):
 	Base-class for all :term:`block` classes.
 	"""
 
+	__slots__ = ("_previousBlock", "NextBlock", "StartToken", "EndToken", "MultiPart")
+
 	__STATES__:      List =   None   #: List of all `state...` methods in this class.
+	CATEGORY:        int =    0      #: Category flags of this block class (see :class:`BlockCategory`).
 
-	_previousBlock: 'Block' = None   #: Reference to the previous block.
-	NextBlock:      'Block' = None   #: Reference to the next block.
-	StartToken:     Token =   None   #: Reference to the first token in the scope of this block.
-	EndToken:       Token =   None   #: Reference to the last token in the scope of this block.
-	MultiPart:      bool =    None   #: True, if this block has multiple parts.
+	KEYWORDS:         Dict[type, Callable] =              None   #: Map of keyword token classes to transitions.
+	KEYWORD_DISPATCH: Dict[str, Tuple[type, Callable]] =  None   #: Map of lowercased keywords to keyword token classes and transitions (built from :attr:`KEYWORDS`).
+
+	_previousBlock: 'Block'          #: Reference to the previous block.
+	NextBlock:      'Block'          #: Reference to the next block.
+	StartToken:     Token            #: Reference to the first token in the scope of this block.
+	EndToken:       Token            #: Reference to the last token in the scope of this block.
+	MultiPart:      bool             #: True, if this block has multiple parts.
 
 	def __init__(self, previousBlock, startToken, endToken=None, multiPart=False):
 		"""Base-class constructor for a new block instance."""
@@ -336,7 +625,7 @@ class Block(metaclass=MetaBlock):
 
 	def __len__(self) -> int:
 		"""Returns the length of a block in characters from :attr:`~Block.StartToken` to :attr:`~Block.EndToken`."""
-		return self.EndToken.End.Absolute - self.StartToken.Start.Absolute + 1
+		return self.EndToken.EndAbsolute - self.StartToken.StartAbsolute + 1
 
 	def __iter__(self) -> TokenIterator:
 		"""Returns a token iterator that iterates from :attr:`~Block.StartToken` to :attr:`~Block.EndToken`."""
@@ -386,6 +675,11 @@ class Block(metaclass=MetaBlock):
 		"""Returns the length of a block in characters from :attr:`~Block.StartToken` to :attr:`~Block.EndToken`."""
 		return len(self)
 
+	@property
+	def Text(self) -> str:
+		"""Returns the source code from :attr:`~Block.StartToken` to :attr:`~Block.EndToken` (see :func:`~pyVHDLParser.Token.GetSourceText`)."""
+		return GetSourceText(self.StartToken, self.EndToken)
+
 	@property
 	def States(self) -> List[Callable]:
 		"""Returns a list of all `state...` methods in this class."""
@@ -400,23 +694,25 @@ class Block(metaclass=MetaBlock):
 @export
 class SkipableBlock(Block):
 	"""Base-class for blocks that can be skipped in fast-forward scanning."""
-	pass
+	CATEGORY = BlockCategory.Skipable
 
 @export
 class FinalBlock(Block):
 	"""Base-class for blocks that are final in a fast-forward scanning."""
-	pass
+	CATEGORY = BlockCategory.Final
 
 @export
 class CommentBlock(SkipableBlock):
 	"""Base-class for all comment blocks."""
-	pass
+	CATEGORY = BlockCategory.Comment
 
 
 @export
 class StartOfBlock(Block):
 	"""Base-class for a first block in a sequence of double-linked blocks."""
 
+	CATEGORY = BlockCategory.Meta
+
 	def __init__(self, startToken):
 		self._previousBlock =     None
 		self.NextBlock =          None
@@ -441,6 +737,8 @@ class StartOfBlock(Block):
 class EndOfBlock(Block):
 	"""Base-class for a last block in a sequence of double-linked blocks."""
 
+	CATEGORY = BlockCategory.Meta
+
 	def __init__(self, endToken):
 		self._previousBlock =     None
 		self.NextBlock =          None
@@ -488,27 +786,28 @@ class StartOfDocumentBlock(StartOfBlock, StartOfDocument):
 	def stateDocument(cls, parserState: ParserState):
 		from pyVHDLParser.Blocks.Common     import IndentationBlock, WhitespaceBlock, LinebreakBlock
 
-		token = parserState.Token
-		if isinstance(token, SpaceToken):
-			blockType =               IndentationBlock if isinstance(token, IndentationToken) else WhitespaceBlock
+		token =    parserState.Token
+		category = token.CATEGORY
+		if (category & TokenCategory.Space):
+			blockType =               IndentationBlock if (category & TokenCategory.Indentation) else WhitespaceBlock
 			parserState.NewBlock =    blockType(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
-		elif isinstance(token, (LinebreakToken, CommentToken)):
-			block =                   LinebreakBlock if isinstance(token, LinebreakToken) else CommentBlock
+		elif (category & (TokenCategory.Linebreak | TokenCategory.Comment)):
+			block =                   LinebreakBlock if (category & TokenCategory.Linebreak) else CommentBlock
 			parserState.NewBlock =    block(parserState.LastBlock, token)
 			parserState.TokenMarker = None
 			return
-		elif isinstance(token, WordToken):
+		elif (category & TokenCategory.Word):
 			tokenValue = token.Value.lower()
 
-			for keyword in cls.KEYWORDS:
-				if (tokenValue == keyword.__KEYWORD__):
-					newToken =                keyword(token)
-					parserState.PushState =   cls.KEYWORDS[keyword]
-					parserState.NewToken =    newToken
-					parserState.TokenMarker = newToken
-					return
+			keyword, transition = cls.KEYWORD_DISPATCH.get(tokenValue, (None, None))
+			if (keyword is not None):
+				newToken =                keyword(token)
+				parserState.PushState =   transition
+				parserState.NewToken =    newToken
+				parserState.TokenMarker = newToken
+				return
 
 		elif isinstance(token, EndOfDocumentToken):
 			parserState.NewBlock =    EndOfDocumentBlock(token)
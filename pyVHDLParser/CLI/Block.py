@@ -51,10 +51,7 @@ class BlockStreamHandlers:
 		if (not file.exists()):
 			print("File '{0!s}' does not exist.".format(file))
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
-		tokenStream = Tokenizer.GetVHDLTokenizer(content)
+		tokenStream = Tokenizer.GetVHDLTokenizer(file)
 		blockStream = TokenToBlockParser.Transform(tokenStream)
 
 		try:
@@ -98,10 +95,7 @@ class BlockStreamHandlers:
 		if (not file.exists()):
 			print("File '{0!s}' does not exist.".format(file))
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
-		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(file)
 		vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream)
 
 		try:
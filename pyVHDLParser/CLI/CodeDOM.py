@@ -44,9 +44,6 @@ class CodeDOMHandlers:
 		if (not file.exists()):
 			print("File '{0!s}' does not exist.".format(file)) # raise error
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
 		try:
 			document = Document(file)
 			document.Parse()
@@ -50,14 +50,11 @@ class GroupStreamHandlers:
 		if (not file.exists()):
 			print("File '{0!s}' does not exist.".format(file))
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
 		buffered = True
 		if buffered:
 			self.WriteVerbose("Reading and buffering tokens...")
 			try:
-				tokenStream = [token for token in Tokenizer.GetVHDLTokenizer(content)]
+				tokenStream = [token for token in Tokenizer.GetVHDLTokenizer(file)]
 			except ParserException as ex:
 				self.WriteError("{RED}ERROR: {0!s}{NOCOLOR}".format(ex, **self.Foreground))
 			except NotImplementedError as ex:
@@ -71,7 +68,7 @@ class GroupStreamHandlers:
 			except NotImplementedError as ex:
 				print("{RED}NotImplementedError: {0!s}{NOCOLOR}".format(ex, **self.Foreground))
 		else:
-			tokenStream = Tokenizer.GetVHDLTokenizer(content)
+			tokenStream = Tokenizer.GetVHDLTokenizer(file)
 			blockStream = TokenToBlockParser.Transform(tokenStream)
 
 		self.WriteVerbose("Transforming blocks to groups...")
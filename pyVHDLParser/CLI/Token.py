@@ -47,10 +47,7 @@ class TokenStreamHandlers:
 		if (not file.exists()):
 			print("File '{0!s}' does not exist.".format(file))
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
-		tokenStream =   Tokenizer.GetVHDLTokenizer(content)
+		tokenStream =   Tokenizer.GetVHDLTokenizer(file)
 		tokenIterator = iter(tokenStream)
 		firstToken =    next(tokenIterator)
 
@@ -172,10 +169,7 @@ class TokenStreamHandlers:
 		if (not file.exists()):
 			print("File '{0!s}' does not exist.".format(file))
 
-		with file.open('r') as fileHandle:
-			content = fileHandle.read()
-
-		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
+		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(file)
 
 		try:
 			tokenIterator = iter(vhdlTokenStream)
@@ -30,6 +30,7 @@ from pyMetaClasses                    import Singleton
 from pyTerminalUI                     import LineTerminal, Severity
 
 from pyVHDLParser.Blocks              import MetaBlock
+from pyVHDLParser.Debug               import EnableTracing, LineTerminalTracer
 
 from pyVHDLParser.CLI.Token           import TokenStreamHandlers
 from pyVHDLParser.CLI.Block           import BlockStreamHandlers
@@ -75,6 +76,8 @@ class Application(LineTerminal, ArgParseMixin, TokenStreamHandlers, BlockStreamH
 		# Initialize the Terminal class
 		# --------------------------------------------------------------------------
 		Singleton.Register(LineTerminal, self)
+		if debug:
+			EnableTracing(LineTerminalTracer(self))
 
 		# Late-initialize Block classes
 		# --------------------------------------------------------------------------
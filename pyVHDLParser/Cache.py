@@ -0,0 +1,224 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		On-disk cache of parse results
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+On-disk cache of parse results.
+
+A :class:`ParseCache` stores parse results in a local directory. An entry's key is a SHA-256 hash of the source's
+content, the kind of result and the parser version (see :func:`GetParserVersion`), so unchanged files aren't parsed
+again and entries of a modified parser aren't reused. The least recently used entries are removed, when the cache
+exceeds its maximum size.
+
+The cache is used by :meth:`pyVHDLParser.DocumentModel.Document.Parse` and by :meth:`ParseCache.GetBlocks`. Token and
+block chains are stored in the binary format of :mod:`pyVHDLParser.BinaryFormat`, which only loads classes of this
+package, so a cache directory can be shared between processes and jobs.
+"""
+from hashlib                  import sha256
+from os                       import environ, replace, utime
+from pathlib                  import Path
+from tempfile                 import NamedTemporaryFile
+from typing                   import Any, Optional, Union
+
+from pydecor.decorators       import export
+
+from pyVHDLParser.Token.Parser import Tokenizer
+from pyVHDLParser.Blocks      import TokenToBlockParser
+from pyVHDLParser.Columnar    import ColumnarDocument
+from pyVHDLParser.BinaryFormat import Dump, Load, BinaryFormatException
+
+__all__ = []
+__api__ = __all__
+
+
+FORMAT_VERSION = 2              #: Version of the cache entries' layout. It's part of each key.
+ENTRY_SUFFIX =   ".entry"       #: File suffix of cache entries.
+
+_parserVersion: str = None
+
+
+@export
+def GetParserVersion() -> str:
+	"""
+	Returns a fingerprint of the parser's implementation.
+
+	The fingerprint is a hash of all source files of the ``pyVHDLParser`` package, so it changes with every release and
+	with every local modification. It's computed once per process.
+	"""
+	global _parserVersion
+
+	if (_parserVersion is None):
+		package = Path(__file__).parent
+		digest =  sha256()
+		for file in sorted(package.rglob("*.py")):
+			digest.update(file.relative_to(package).as_posix().encode("utf-8"))
+			digest.update(file.read_bytes())
+		_parserVersion = digest.hexdigest()
+
+	return _parserVersion
+
+
+@export
+class ParseCache:
+	"""
+	A directory of cached parse results with a least recently used eviction policy.
+
+	Each entry is a file named by its key. Reading an entry updates the file's modification time, which is used to
+	find the least recently used entries. Entries are written to a temporary file and renamed, so processes can share
+	a cache directory.
+	"""
+
+	Directory:  Path    #: Directory of the cache entries.
+	MaxSize:    int     #: Maximum size of all entries in bytes.
+
+	_size:      Optional[int]
+
+	def __init__(self, directory: Union[Path, str] = None, maxSize: int = 256 * 1024**2):
+		if (directory is None):
+			directory = Path(environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pyVHDLParser"
+
+		self.Directory = Path(directory)
+		self.MaxSize =   maxSize
+		self._size =     None
+
+	def __getstate__(self):
+		return {"Directory": self.Directory, "MaxSize": self.MaxSize, "_size": None}
+
+	@staticmethod
+	def ReadContent(content: Any) -> Optional[bytes]:
+		"""Returns the bytes to hash for a source (a path, string or bytes-like object) or ``None``, if a source can't be cached (e.g. a file-like object)."""
+		if isinstance(content, Path):
+			return content.read_bytes()
+		elif isinstance(content, str):
+			return content.encode("utf-8", "surrogatepass")
+		elif isinstance(content, (bytes, bytearray, memoryview)):
+			return bytes(content)
+		else:
+			return None
+
+	def GetKey(self, kind: str, content: bytes) -> str:
+		"""Returns the key of a kind of result (e.g. ``"Blocks"``) for a source's content."""
+		digest = sha256("{0}\0{1}\0{2}\0".format(FORMAT_VERSION, GetParserVersion(), kind).encode("utf-8"))
+		digest.update(content)
+		return digest.hexdigest()
+
+	def _GetPath(self, key: str) -> Path:
+		return self.Directory / (key + ENTRY_SUFFIX)
+
+	def Load(self, key: str) -> Optional[bytes]:
+		"""Returns the data of an entry or ``None``, if the key isn't cached."""
+		path = self._GetPath(key)
+		try:
+			data = path.read_bytes()
+			utime(path)
+		except OSError:
+			return None
+
+		return data
+
+	def Store(self, key: str, data: bytes):
+		"""
+		Writes an entry and evicts the least recently used entries, if the cache exceeds :attr:`MaxSize`.
+
+		If the entry can't be written, the temporary file is removed and the exception is raised.
+		"""
+		self.Directory.mkdir(parents=True, exist_ok=True)
+		path = self._GetPath(key)
+		file = NamedTemporaryFile(dir=self.Directory, suffix=".tmp", delete=False)
+		try:
+			with file:
+				file.write(data)
+			try:
+				oldSize = path.stat().st_size
+			except OSError:
+				oldSize = 0
+			replace(file.name, path)
+		except BaseException:
+			Path(file.name).unlink(missing_ok=True)
+			raise
+
+		if (self._size is None):
+			self._size = self.Size
+		else:
+			# an existing entry (damaged or written by another process) is replaced
+			self._size += len(data) - oldSize
+
+		if (self._size > self.MaxSize):
+			self.Evict(self.MaxSize)
+
+	@property
+	def Size(self) -> int:
+		"""Returns the size of all entries in bytes."""
+		return sum(path.stat().st_size for path in self.Directory.glob("*" + ENTRY_SUFFIX))
+
+	def Evict(self, maxSize: int = 0):
+		"""Removes the least recently used entries, until all remaining entries fit into ``maxSize`` bytes."""
+		entries = []
+		for path in self.Directory.glob("*" + ENTRY_SUFFIX):
+			try:
+				entries.append((path.stat(), path))
+			except OSError:
+				pass
+
+		size = sum(stat.st_size for stat, _ in entries)
+		for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+			if (size <= maxSize):
+				break
+			try:
+				path.unlink()
+			except OSError:
+				pass
+			size -= stat.st_size
+
+		self._size = size
+
+	def Clear(self):
+		"""Removes all entries."""
+		self.Evict(0)
+
+	def GetBlocks(self, content: Any) -> ColumnarDocument:
+		"""
+		Returns the token and block chains of a source as a :class:`~pyVHDLParser.Columnar.ColumnarDocument`.
+
+		On a cache miss, the source is tokenized and split into blocks by :meth:`~pyVHDLParser.Blocks.TokenToBlockParser.Transform`
+		and the result is stored. Sources, which can't be hashed, are parsed without the cache.
+		"""
+		data = self.ReadContent(content)
+		if (data is None):
+			return ColumnarDocument.FromBlocks(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(content)))
+
+		key =    self.GetKey("Blocks", data)
+		cached = self.Load(key)
+		if (cached is not None):
+			try:
+				return Load(cached)
+			except BinaryFormatException:
+				pass    # a damaged entry is replaced
+
+		# a file is tokenized from the bytes read for the key
+		document = ColumnarDocument.FromBlocks(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(data if isinstance(content, Path) else content)))
+		self.Store(key, Dump(document))
+		return document
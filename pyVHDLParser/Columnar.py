@@ -0,0 +1,499 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Index-based storage of token and block chains
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Index-based storage of token and block chains.
+
+A :class:`ColumnarDocument` stores a token chain and a block chain in parallel columns (:class:`array.array`), so a
+document contains no reference cycles, is pickled as a handful of flat arrays and offers O(1) random access by index.
+Tokens and blocks are handed out as read-only views, which are instances of the stored token and block classes and
+implement the same API (:attr:`~pyVHDLParser.Token.Token.NextToken`, :attr:`~pyVHDLParser.Blocks.Block.StartToken`,
+iteration, ...). Their links are looked up in the columns on demand.
+"""
+from array                  import array
+from typing                 import Dict, Iterable, Iterator, List, Optional
+from weakref                import WeakValueDictionary
+
+from pydecor.decorators     import export
+
+from pyVHDLParser           import SourceCodeLineIndex, SourceCodePosition
+from pyVHDLParser.Base      import ParserException
+from pyVHDLParser.Token     import Token, ValuedToken, StartOfToken, EndOfToken
+from pyVHDLParser.Blocks    import Block
+
+__all__ = []
+__api__ = __all__
+
+
+@export
+class TokenView:
+	"""
+	Mixin for read-only token views of a :class:`ColumnarDocument`.
+
+	A view class is derived from this mixin and a token class (see :meth:`ColumnarDocument.GetTokenViewClass`). The
+	links to neighbouring tokens are properties overriding the token's slots.
+	"""
+
+	__slots__ = ()
+
+	@property
+	def _previousToken(self) -> Optional[Token]:
+		index = self._index
+		return None if (index == 0) else self._document.GetToken(index - 1)
+
+	@property
+	def NextToken(self) -> Optional[Token]:
+		index =    self._index + 1
+		document = self._document
+		return None if (index == len(document.TokenKinds)) else document.GetToken(index)
+
+	@property
+	def Index(self) -> int:
+		"""Index of this token in its document."""
+		return self._index
+
+
+@export
+class BlockView:
+	"""
+	Mixin for read-only block views of a :class:`ColumnarDocument`.
+
+	A view class is derived from this mixin and a block class (see :meth:`ColumnarDocument.GetBlockViewClass`). The
+	links to neighbouring blocks are properties overriding the block's slots.
+	"""
+
+	__slots__ = ()
+
+	@property
+	def _previousBlock(self) -> Optional[Block]:
+		index = self._index
+		return None if (index == 0) else self._document.GetBlock(index - 1)
+
+	@property
+	def NextBlock(self) -> Optional[Block]:
+		index =    self._index + 1
+		document = self._document
+		return None if (index == len(document.BlockKinds)) else document.GetBlock(index)
+
+	@property
+	def Index(self) -> int:
+		"""Index of this block in its document."""
+		return self._index
+
+
+@export
+class ColumnarDocument:
+	"""
+	Stores a token chain and a block chain in parallel columns.
+
+	Token ``i`` is an instance of ``TokenClasses[TokenKinds[i]]`` and spans the absolute (1-based) character positions
+	``TokenStarts[i]`` to ``TokenEnds[i]``. A valued token's value is ``Strings[TokenValues[i]]``. Block ``i`` is an
+	instance of ``BlockClasses[BlockKinds[i]]`` and spans the tokens ``BlockStartTokens[i]`` to ``BlockEndTokens[i]``.
+	``TokenBlocks[i]`` is the index of the block containing token ``i``. Missing positions, values, tokens and blocks
+	are stored as -1.
+
+	The chains are in index order, so the previous and next token or block of index ``i`` are at ``i - 1`` and
+	``i + 1``. Views are cached as long as they are referenced, so links can be compared by identity.
+	"""
+
+	_viewClasses:     Dict[type, type] = {}   #: View classes by token or block class, shared by all documents.
+
+	Source:           Optional[str]      #: The document's source code, if it's available as a string.
+	LineStarts:       array              #: 0-based index of the first character in each row.
+	Strings:          List[str]          #: Table of distinct token values.
+
+	TokenClasses:     List[type]         #: Table of token classes.
+	TokenKinds:       array              #: Index into :attr:`TokenClasses` per token.
+	TokenStarts:      array              #: Absolute start position per token.
+	TokenEnds:        array              #: Absolute end position per token.
+	TokenValues:      array              #: Index into :attr:`Strings` per token.
+	TokenBlocks:      array              #: Index of the containing block per token.
+
+	BlockClasses:     List[type]         #: Table of block classes.
+	BlockKinds:       array              #: Index into :attr:`BlockClasses` per block.
+	BlockStartTokens: array              #: Index of the first token per block.
+	BlockEndTokens:   array              #: Index of the last token per block.
+	BlockMultiParts:  array              #: 1, if a block has multiple parts.
+
+	_lineIndex:       SourceCodeLineIndex
+	_tokenViews:      WeakValueDictionary
+	_blockViews:      WeakValueDictionary
+
+	def __init__(self):
+		"""Initializes an empty document."""
+
+		self.Source =           None
+		self.LineStarts =       array("L", (0,))
+		self.Strings =          []
+
+		self.TokenClasses =     []
+		self.TokenKinds =       array("H")
+		self.TokenStarts =      array("q")
+		self.TokenEnds =        array("q")
+		self.TokenValues =      array("l")
+		self.TokenBlocks =      array("l")
+
+		self.BlockClasses =     []
+		self.BlockKinds =       array("H")
+		self.BlockStartTokens = array("l")
+		self.BlockEndTokens =   array("l")
+		self.BlockMultiParts =  array("B")
+
+		self._ResetViews()
+
+	def _ResetViews(self):
+		self._lineIndex =       None
+		self._tokenViews =      WeakValueDictionary()
+		self._blockViews =      WeakValueDictionary()
+
+	def __getstate__(self) -> dict:
+		"""Returns the columns only. Views and the line index are rebuilt on demand."""
+		state = self.__dict__.copy()
+		del state["_lineIndex"], state["_tokenViews"], state["_blockViews"]
+		return state
+
+	def __setstate__(self, state: dict):
+		self.__dict__.update(state)
+		self._ResetViews()
+
+	@classmethod
+	def FromTokens(cls, startToken: Token) -> 'ColumnarDocument':
+		"""Converts a linked token chain beginning at ``startToken`` into a columnar document without blocks."""
+		document = cls()
+		document._AddTokens(startToken)
+		return document
+
+	@classmethod
+	def FromBlocks(cls, blocks: Iterable[Block]) -> 'ColumnarDocument':
+		"""
+		Converts a block stream (or a list of blocks) and the token chain of its first block into a columnar document.
+
+		The blocks are stored in emission order, which is also the order of the :attr:`~pyVHDLParser.Blocks.Block.NextBlock`
+		links of the views.
+		"""
+		blocks =       list(blocks)
+		document =     cls()
+		tokenIndices = document._AddTokens(blocks[0].StartToken)
+
+		classIndices =  {}
+		classes =       document.BlockClasses
+		kinds =         document.BlockKinds
+		startTokens =   document.BlockStartTokens
+		endTokens =     document.BlockEndTokens
+		multiParts =    document.BlockMultiParts
+		tokenBlocks =   array("l", (-1,)) * len(document.TokenKinds)
+		document.TokenBlocks = tokenBlocks
+
+		for block in blocks:
+			blockClass = block.__class__
+			kind =       classIndices.get(blockClass)
+			if kind is None:
+				kind = classIndices[blockClass] = len(classes)
+				classes.append(blockClass)
+
+			startIndex = cls._GetTokenIndex(tokenIndices, block.StartToken, block)
+			endIndex =   cls._GetTokenIndex(tokenIndices, block.EndToken, block)
+			blockIndex = len(kinds)
+			for index in range(startIndex if (startIndex >= 0) else endIndex, (endIndex if (endIndex >= 0) else startIndex) + 1):
+				tokenBlocks[index] = blockIndex
+
+			kinds.append(kind)
+			startTokens.append(startIndex)
+			endTokens.append(endIndex)
+			multiParts.append(1 if block.MultiPart else 0)
+
+		return document
+
+	@classmethod
+	def Join(cls, source: str, documents: List['ColumnarDocument'], offsets: List[int]) -> 'ColumnarDocument':
+		"""
+		Joins documents of consecutive parts of ``source`` into a single document of the whole source.
+
+		Part ``i`` begins at 0-based character offset ``offsets[i]`` (the first part at 0). Token positions are shifted accordingly. The start
+		of document token and block of each part but the first and the end of document token and block of each part but
+		the last are dropped. All parts must be cut between two blocks.
+		"""
+		document =      cls()
+		document.Source = source
+		document.LineStarts = array("L", SourceCodeLineIndex(source)._BuildIndex())
+
+		kinds =         document.TokenKinds
+		starts =        document.TokenStarts
+		ends =          document.TokenEnds
+		values =        document.TokenValues
+		tokenBlocks =   document.TokenBlocks
+		blockKinds =    document.BlockKinds
+		startTokens =   document.BlockStartTokens
+		endTokens =     document.BlockEndTokens
+		multiParts =    document.BlockMultiParts
+
+		tokenClasses =  {}
+		blockClasses =  {}
+		strings =       {}
+		last =          len(documents) - 1
+		for number, (part, offset) in enumerate(zip(documents, offsets)):
+			tokenKindMap =  [cls._GetTableIndex(tokenClasses, document.TokenClasses, tokenClass) for tokenClass in part.TokenClasses]
+			blockKindMap =  [cls._GetTableIndex(blockClasses, document.BlockClasses, blockClass) for blockClass in part.BlockClasses]
+			stringMap =     [cls._GetTableIndex(strings, document.Strings, string) for string in part.Strings]
+
+			firstToken =    0 if (number == 0) else 1
+			stopToken =     len(part.TokenKinds) - (0 if (number == last) else 1)
+			firstBlock =    0 if (number == 0) else 1
+			stopBlock =     len(part.BlockKinds) - (0 if (number == last) else 1)
+			tokenShift =    len(kinds) - firstToken
+			blockShift =    len(blockKinds) - firstBlock
+
+			for index in range(firstToken, stopToken):
+				start = part.TokenStarts[index]
+				end =   part.TokenEnds[index]
+				value = part.TokenValues[index]
+				block = part.TokenBlocks[index] if part.TokenBlocks else -1
+				kinds.append(tokenKindMap[part.TokenKinds[index]])
+				starts.append(start if (start < 0) else (start + offset))
+				ends.append(end if (end < 0) else (end + offset))
+				values.append(-1 if (value < 0) else stringMap[value])
+				tokenBlocks.append(-1 if (block < 0) else (block + blockShift))
+
+			for index in range(firstBlock, stopBlock):
+				startToken = part.BlockStartTokens[index]
+				endToken =   part.BlockEndTokens[index]
+				blockKinds.append(blockKindMap[part.BlockKinds[index]])
+				startTokens.append(-1 if (startToken < 0) else (startToken + tokenShift))
+				endTokens.append(-1 if (endToken < 0) else (endToken + tokenShift))
+				multiParts.append(part.BlockMultiParts[index])
+
+		return document
+
+	@staticmethod
+	def _GetTableIndex(indices: Dict, table: List, item) -> int:
+		"""Returns the index of ``item`` in ``table`` and appends it, if it's new."""
+		index = indices.get(item)
+		if index is None:
+			index = indices[item] = len(table)
+			table.append(item)
+		return index
+
+	@staticmethod
+	def _GetTokenIndex(tokenIndices: Dict[int, int], token: Token, block: Block) -> int:
+		if token is None:
+			return -1
+		try:
+			return tokenIndices[id(token)]
+		except KeyError:
+			raise ParserException("Block '{0!r}' references a token, which is not in the token chain.".format(block)) from None
+
+	def _AddTokens(self, startToken: Token) -> Dict[int, int]:
+		"""Appends a linked token chain to the token columns and returns a map of token ids to indices."""
+		lineIndex = startToken._lineIndex
+		if lineIndex is not None:
+			source =          lineIndex.Source
+			self.Source =     source if isinstance(source, str) else None
+			lineStarts =      lineIndex._lineStarts
+			self.LineStarts = array("L", lineIndex._BuildIndex() if (lineStarts is None) else lineStarts)
+
+		indices =       {}
+		classIndices =  {}
+		stringIndices = {}
+		classes =       self.TokenClasses
+		strings =       self.Strings
+		kinds =         self.TokenKinds
+		starts =        self.TokenStarts
+		ends =          self.TokenEnds
+		values =        self.TokenValues
+
+		token = startToken
+		while token is not None:
+			tokenClass = token.__class__
+			kind =       classIndices.get(tokenClass)
+			if kind is None:
+				kind = classIndices[tokenClass] = len(classes)
+				classes.append(tokenClass)
+
+			if isinstance(token, ValuedToken):
+				value = token.Value
+				stringIndex = stringIndices.get(value)
+				if stringIndex is None:
+					stringIndex = stringIndices[value] = len(strings)
+					strings.append(value)
+			else:
+				stringIndex = -1
+
+			indices[id(token)] = len(kinds)
+			kinds.append(kind)
+			starts.append(-1 if (token._start is None) else token.StartAbsolute)
+			ends.append(-1 if (token._end is None) else token.EndAbsolute)
+			values.append(stringIndex)
+			token = token.NextToken
+
+		return indices
+
+	@property
+	def LineIndex(self) -> SourceCodeLineIndex:
+		"""Line index to derive rows and columns of all tokens."""
+		lineIndex = self._lineIndex
+		if lineIndex is None:
+			lineIndex = self._lineIndex = SourceCodeLineIndex(self.Source)
+			lineIndex._lineStarts = self.LineStarts
+		return lineIndex
+
+	@property
+	def TokenCount(self) -> int:
+		return len(self.TokenKinds)
+
+	@property
+	def BlockCount(self) -> int:
+		return len(self.BlockKinds)
+
+	@classmethod
+	def GetTokenViewClass(cls, tokenClass: type) -> type:
+		"""Returns the view class for a token class."""
+		return cls._GetViewClass(tokenClass, TokenView)
+
+	@classmethod
+	def GetBlockViewClass(cls, blockClass: type) -> type:
+		"""Returns the view class for a block class."""
+		return cls._GetViewClass(blockClass, BlockView)
+
+	@classmethod
+	def _GetViewClass(cls, baseClass: type, viewMixin: type) -> type:
+		viewClass = cls._viewClasses.get(baseClass)
+		if viewClass is None:
+			# the meta-class' __new__ is bypassed, so view classes aren't registered like parser classes
+			viewClass = type.__new__(type(baseClass), baseClass.__name__, (viewMixin, baseClass), {
+				"__slots__":    ("_document", "_index", "__weakref__"),
+				"__module__":   baseClass.__module__,
+				"__qualname__": baseClass.__qualname__
+			})
+			cls._viewClasses[baseClass] = viewClass
+		return viewClass
+
+	def _SetTokenFields(self, token: Token, index: int, lineIndex: SourceCodeLineIndex):
+		start = self.TokenStarts[index]
+		end =   self.TokenEnds[index]
+		if isinstance(token, StartOfToken):
+			token._start = SourceCodePosition(1, 1, 1)
+			token._end =   None
+		elif isinstance(token, EndOfToken):
+			token._start = token._end = lineIndex.GetEndPosition(end)
+		else:
+			token._start = None if (start < 0) else start
+			token._end =   None if (end < 0) else end
+		token._lineIndex = lineIndex
+		token._trivia =    None
+
+		value = self.TokenValues[index]
+		if value >= 0:
+			token.Value = self.Strings[value]
+
+	def GetToken(self, index: int) -> Token:
+		"""Returns a view of token ``index``."""
+		token = self._tokenViews.get(index)
+		if token is None:
+			if not (0 <= index < len(self.TokenKinds)):
+				raise IndexError("Token index {0} out of range.".format(index))
+
+			viewClass =       self.GetTokenViewClass(self.TokenClasses[self.TokenKinds[index]])
+			token =           object.__new__(viewClass)
+			token._document = self
+			token._index =    index
+			self._SetTokenFields(token, index, self.LineIndex)
+			self._tokenViews[index] = token
+		return token
+
+	def GetBlock(self, index: int) -> Block:
+		"""Returns a view of block ``index``."""
+		block = self._blockViews.get(index)
+		if block is None:
+			if not (0 <= index < len(self.BlockKinds)):
+				raise IndexError("Block index {0} out of range.".format(index))
+
+			viewClass =       self.GetBlockViewClass(self.BlockClasses[self.BlockKinds[index]])
+			block =           object.__new__(viewClass)
+			block._document = self
+			block._index =    index
+			startToken =      self.BlockStartTokens[index]
+			endToken =        self.BlockEndTokens[index]
+			block.StartToken = None if (startToken < 0) else self.GetToken(startToken)
+			block.EndToken =   None if (endToken < 0) else self.GetToken(endToken)
+			block.MultiPart =  self.BlockMultiParts[index] == 1
+			self._blockViews[index] = block
+		return block
+
+	def GetTokenBlock(self, index: int) -> Optional[Block]:
+		"""Returns a view of the block containing token ``index`` or None."""
+		blockIndex = self.TokenBlocks[index] if self.TokenBlocks else -1
+		return None if (blockIndex < 0) else self.GetBlock(blockIndex)
+
+	def GetTokens(self) -> Iterator[Token]:
+		"""Returns an iterator of all token views."""
+		return map(self.GetToken, range(len(self.TokenKinds)))
+
+	def GetBlocks(self) -> Iterator[Block]:
+		"""Returns an iterator of all block views."""
+		return map(self.GetBlock, range(len(self.BlockKinds)))
+
+	def ToTokens(self) -> List[Token]:
+		"""Converts the token columns into a linked chain of token objects. Returns a list of all tokens."""
+		lineIndex =     SourceCodeLineIndex(self.Source)
+		lineIndex._lineStarts = array("L", self.LineStarts)
+
+		tokens =        []
+		previousToken = None
+		for index, kind in enumerate(self.TokenKinds):
+			tokenClass = self.TokenClasses[kind]
+			token =      object.__new__(tokenClass)
+			self._SetTokenFields(token, index, lineIndex)
+			token._previousToken = previousToken
+			token.NextToken =      None
+			if previousToken is not None:
+				previousToken.NextToken = token
+			tokens.append(token)
+			previousToken = token
+
+		return tokens
+
+	def ToBlocks(self) -> List[Block]:
+		"""Converts the block and token columns into linked chains of block and token objects. Returns a list of all blocks."""
+		tokens =        self.ToTokens()
+		blocks =        []
+		previousBlock = None
+		for index, kind in enumerate(self.BlockKinds):
+			blockClass = self.BlockClasses[kind]
+			block =      object.__new__(blockClass)
+			startToken = self.BlockStartTokens[index]
+			endToken =   self.BlockEndTokens[index]
+			block._previousBlock = previousBlock
+			block.NextBlock =      None
+			block.StartToken =     None if (startToken < 0) else tokens[startToken]
+			block.EndToken =       None if (endToken < 0) else tokens[endToken]
+			block.MultiPart =      self.BlockMultiParts[index] == 1
+			if previousBlock is not None:
+				previousBlock.NextBlock = block
+			blocks.append(block)
+			previousBlock = block
+
+		return blocks
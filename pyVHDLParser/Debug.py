@@ -0,0 +1,105 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		TODO:
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Tracing of parser state transitions.
+
+Tracing is disabled by default. The parser states check the module-level flag
+:data:`TRACING` before calling :func:`Trace`, so a disabled tracer costs a single
+attribute lookup and no string formatting. A tracer is any callable accepting a
+:class:`TraceEvent`, the parser state and the event's arguments.
+"""
+from enum                   import Enum, unique
+from typing                 import Callable
+
+from pydecor.decorators     import export
+from pyTerminalUI           import LineTerminal
+
+__all__ = []
+__api__ = __all__
+
+
+TRACING: bool =                 False   #: True, if a tracer is installed.
+_tracer:  Callable[..., None] = None
+
+
+@export
+@unique
+class TraceEvent(Enum):
+	"""Events reported to a tracer."""
+
+	PushState =       0   #: A block-parser state was pushed. Argument: the pushed state.
+	PopState =        1   #: A block-parser state was popped. Argument: the popped state.
+	TokenMarker =     2   #: The token marker was moved to a replacement token. Arguments: old marker, new token.
+	NewTokenMarker =  3   #: An empty token marker was set. Argument: the token.
+	ReIssue =         4   #: A group-parser state is (re)issued. Argument: the current block.
+
+
+@export
+def Trace(event: TraceEvent, parserState, *args):
+	"""Forwards an event to the installed tracer. Callers check :data:`TRACING` first."""
+	_tracer(event, parserState, *args)
+
+
+@export
+def EnableTracing(tracer: Callable[..., None] = None):
+	"""Installs a tracer. Without an argument, events are written to the :class:`~pyTerminalUI.LineTerminal`."""
+	global TRACING, _tracer
+
+	_tracer = LineTerminalTracer() if (tracer is None) else tracer
+	TRACING = True
+
+
+@export
+def DisableTracing():
+	"""Removes the installed tracer."""
+	global TRACING, _tracer
+
+	TRACING = False
+	_tracer = None
+
+
+@export
+class LineTerminalTracer:
+	"""Tracer writing all events as debug (or dry-run) messages to a :class:`~pyTerminalUI.LineTerminal`."""
+
+	_terminal: LineTerminal
+
+	def __init__(self, terminal: LineTerminal = None):
+		self._terminal = LineTerminal() if (terminal is None) else terminal
+
+	def __call__(self, event: TraceEvent, parserState, *args):
+		if (event is TraceEvent.PushState):
+			self._terminal.WriteDebug("  pushed: " + str(args[0]))
+		elif (event is TraceEvent.PopState):
+			self._terminal.WriteDebug("popped: " + str(args[0]))
+		elif (event is TraceEvent.TokenMarker):
+			self._terminal.WriteDebug("  {DARK_GREEN}@TokenMarker: {0!s} => {GREEN}{1!s}{NOCOLOR}".format(*args, **LineTerminal.Foreground))
+		elif (event is TraceEvent.NewTokenMarker):
+			self._terminal.WriteDebug("  new token marker: None -> {0!s}".format(args[0]))
+		elif (event is TraceEvent.ReIssue):
+			self._terminal.WriteDryRun("{DARK_GRAY}reissue state={state!s: <50}  block={block!s: <40}     {NOCOLOR}".format(state=parserState, block=args[0], **LineTerminal.Foreground))
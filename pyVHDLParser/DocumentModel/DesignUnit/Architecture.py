@@ -36,7 +36,9 @@ from pyVHDLParser.Blocks                    import BlockParserException
 from pyVHDLParser.Blocks.Object.Constant    import ConstantDeclarationBlock
 from pyVHDLParser.Blocks.Structural         import Architecture as ArchitectureBlocks
 from pyVHDLParser.Groups                    import ParserState
+from pyVHDLParser.Groups.DesignUnit         import ArchitectureGroup
 from pyVHDLParser.DocumentModel.Reference   import Library, PackageReference
+from pyVHDLParser.DocumentModel             import RegisterModel
 
 __all__ = []
 __api__ = __all__
@@ -44,6 +46,7 @@ __api__ = __all__
 DEBUG = True
 
 @export
+@RegisterModel(ArchitectureGroup)
 class Architecture(ArchitectureVHDLModel):
 	def __init__(self, architectureName, entityName):
 		super().__init__()
@@ -34,7 +34,9 @@ from pyVHDLParser.Token.Keywords            import IdentifierToken
 from pyVHDLParser.Blocks                    import BlockParserException
 from pyVHDLParser.Blocks.Reference          import Context as ContextBlocks
 from pyVHDLParser.Groups                    import ParserState
+from pyVHDLParser.Groups.DesignUnit         import ContextGroup
 from pyVHDLParser.DocumentModel.Reference   import Library, PackageReference
+from pyVHDLParser.DocumentModel             import RegisterModel
 
 __all__ = []
 __api__ = __all__
@@ -42,6 +44,7 @@ __api__ = __all__
 DEBUG = True
 
 @export
+@RegisterModel(ContextGroup)
 class Context(ContextVHDLModel):
 	def __init__(self, contextName):
 		super().__init__(contextName)
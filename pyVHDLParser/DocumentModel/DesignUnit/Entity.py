@@ -39,7 +39,9 @@ import pyVHDLParser.Blocks.InterfaceObject
 from pyVHDLParser.Blocks.Structural         import Entity as EntityBlocks
 from pyVHDLParser.Groups                    import ParserState
 from pyVHDLParser.Groups.List               import GenericListGroup, PortListGroup
+from pyVHDLParser.Groups.DesignUnit         import EntityGroup
 from pyVHDLParser.DocumentModel.Reference   import Library, PackageReference
+from pyVHDLParser.DocumentModel             import RegisterModel
 
 __all__ = []
 __api__ = __all__
@@ -47,6 +49,7 @@ __api__ = __all__
 DEBUG = True
 
 @export
+@RegisterModel(EntityGroup)
 class Entity(EntityVHDLModel):
 	def __init__(self, entityName):
 		super().__init__()
@@ -39,7 +39,9 @@ from pyVHDLParser.Blocks.Object.Constant    import ConstantDeclarationBlock
 from pyVHDLParser.Blocks.Sequential         import Package as PackageBlock
 from pyVHDLParser.Groups                    import ParserState
 from pyVHDLParser.Groups.List               import GenericListGroup
+from pyVHDLParser.Groups.DesignUnit         import PackageGroup
 from pyVHDLParser.DocumentModel.Reference   import Library, PackageReference
+from pyVHDLParser.DocumentModel             import RegisterModel
 
 __all__ = []
 __api__ = __all__
@@ -47,6 +49,7 @@ __api__ = __all__
 DEBUG = True
 
 @export
+@RegisterModel(PackageGroup)
 class Package(PackageVHDLModel):
 	def __init__(self, packageName):
 		super().__init__()
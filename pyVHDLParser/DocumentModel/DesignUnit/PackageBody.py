@@ -38,7 +38,9 @@ from pyVHDLParser.Blocks.List               import GenericList as GenericListBlo
 from pyVHDLParser.Blocks.Object.Constant    import ConstantDeclarationBlock
 from pyVHDLParser.Blocks.Sequential         import PackageBody as PackageBodyBlock
 from pyVHDLParser.Groups                    import ParserState
+from pyVHDLParser.Groups.DesignUnit         import PackageBodyGroup
 from pyVHDLParser.DocumentModel.Reference   import Library, PackageReference
+from pyVHDLParser.DocumentModel             import RegisterModel
 
 __all__ = []
 __api__ = __all__
@@ -46,6 +48,7 @@ __api__ = __all__
 DEBUG = True
 
 @export
+@RegisterModel(PackageBodyGroup)
 class PackageBody(PackageBodyVHDLModel):
 	def __init__(self, packageBodyName):
 		super().__init__()
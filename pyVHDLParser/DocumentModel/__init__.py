@@ -25,8 +25,11 @@
 # limitations under the License.
 # ==============================================================================
 #
+from importlib                            import import_module
+from io                                   import BytesIO
 from pathlib                              import Path
-from typing                               import List, Union
+from pickle                               import Pickler, Unpickler, UnpicklingError, HIGHEST_PROTOCOL
+from typing                               import Callable, Dict, Iterable, Iterator, List, Union
 
 from pydecor.decorators                   import export
 from pyVHDLModel.VHDLModel                import Document as DocumentModel
@@ -34,9 +37,8 @@ from pyVHDLModel.VHDLModel                import Document as DocumentModel
 from pyVHDLParser.Base                    import ParserException
 from pyVHDLParser.Token.Parser            import Tokenizer
 from pyVHDLParser.Blocks                  import TokenToBlockParser, BlockParserException
+from pyVHDLParser.Cache                   import ParseCache
 from pyVHDLParser.Groups import StartOfDocumentGroup, EndOfDocumentGroup, BlockToGroupParser, Group, GroupParserException
-from pyVHDLParser.Groups.Comment          import WhitespaceGroup
-from pyVHDLParser.Groups.DesignUnit       import ContextGroup, EntityGroup, ArchitectureGroup, PackageBodyGroup, PackageGroup
 from pyVHDLParser.Groups.Reference        import LibraryGroup, UseGroup
 from pyVHDLParser.DocumentModel.Reference import Library, PackageReference
 
@@ -44,6 +46,53 @@ __all__ = []
 __api__ = __all__
 
 
+GROUP_TO_MODEL: Dict[type, type] = {}   #: Map of group classes to the DocumentModel classes building a node from such a group.
+
+#: Modules registering the DocumentModel classes of design units. They are imported on first use.
+MODEL_MODULES: List[str] = [
+	"pyVHDLParser.DocumentModel.DesignUnit.Context",
+	"pyVHDLParser.DocumentModel.DesignUnit.Entity",
+	"pyVHDLParser.DocumentModel.DesignUnit.Architecture",
+	"pyVHDLParser.DocumentModel.DesignUnit.Package",
+	"pyVHDLParser.DocumentModel.DesignUnit.PackageBody"
+]
+_modelModulesLoaded: bool = False
+
+_STATE_PACKAGES = ("pyVHDLParser", "pyVHDLModel")   #: Packages, whose classes are loaded from a cached document state.
+
+
+@export
+def RegisterModel(groupClass: type, modelClass: type = None) -> Union[type, Callable[[type], type]]:
+	"""
+	Registers a DocumentModel class as builder for a group class.
+
+	The model's ``stateParse(document, group)`` class method is called for each group of this exact class found on
+	document level. Without a model class, a class decorator is returned.
+	"""
+	if (modelClass is None):
+		def decorator(cls: type) -> type:
+			GROUP_TO_MODEL[groupClass] = cls
+			return cls
+
+		return decorator
+
+	GROUP_TO_MODEL[groupClass] = modelClass
+	return modelClass
+
+
+@export
+def LoadModels() -> Dict[type, type]:
+	"""Imports all modules listed in :data:`MODEL_MODULES` once and returns the registered group to model map."""
+	global _modelModulesLoaded
+
+	if not _modelModulesLoaded:
+		for moduleName in MODEL_MODULES:
+			import_module(moduleName)
+		_modelModulesLoaded = True
+
+	return GROUP_TO_MODEL
+
+
 @export
 class DOMParserException(ParserException):
 	def __init__(self, message, group):
@@ -51,6 +100,17 @@ class DOMParserException(ParserException):
 		self._group = group
 
 
+class _StateUnpickler(Unpickler):
+	"""Unpickles a document's nodes from a (shared) cache. Only classes of the parser and model packages are loaded."""
+
+	def find_class(self, module: str, name: str):
+		if (module.partition(".")[0] in _STATE_PACKAGES):
+			cls = super().find_class(module, name)
+			if (isinstance(cls, type) and (cls.__module__.partition(".")[0] in _STATE_PACKAGES)):
+				return cls
+		raise UnpicklingError("Class '{0}.{1}' can't be loaded from a document state.".format(module, name))
+
+
 @export
 class Document(DocumentModel):
 	__libraries:  List[Library]
@@ -69,68 +129,162 @@ class Document(DocumentModel):
 		self.__libraries =  []
 		self.__uses  =      []
 
-	def Parse(self, content=None):  # FIXME: parameter type
+	def Parse(self, content=None, release: bool=False, cache: ParseCache=None):  # FIXME: parameter type
+		"""
+		Parses a VHDL source and builds the document's nodes.
+
+		The group stream is consumed incrementally. Each group on document level (a library or use clause or a design
+		unit) is handed to its model (see :func:`RegisterModel`) as soon as the group is complete, and it's not kept in
+		the :class:`~pyVHDLParser.Groups.StartOfDocumentGroup`. If ``release`` is set, the group's tokens, blocks and
+		groups are unlinked afterwards (see :meth:`ParseGroups`).
+
+		If a :class:`~pyVHDLParser.Cache.ParseCache` is given, the nodes of a source parsed before (same content, parser
+		version and registered models) are loaded from the cache instead. A new parse result is stored in the cache.
+		"""
 		if (content is None):
 			if (not self._path.exists()):
 				raise DOMParserException("File '{0!s}' does not exist.".format(self._path))\
 					from FileNotFoundError(str(self._path))
 
-			with self._path.open('r') as fileHandle:
-				content = fileHandle.read()
+			content = self._path
+
+		key = None
+		if (cache is not None):
+			data = cache.ReadContent(content)
+			if (data is not None):
+				key =    cache.GetKey(self._GetCacheKind(), data)
+				cached = cache.Load(key)
+				if ((cached is not None) and self._LoadState(cached)):
+					return
+
+				# a file is tokenized from the bytes read for the key
+				if isinstance(content, Path):
+					content = data
 
 		vhdlTokenStream = Tokenizer.GetVHDLTokenizer(content)
 		vhdlBlockStream = TokenToBlockParser.Transform(vhdlTokenStream)
 		vhdlGroupStream = BlockToGroupParser.Transform(vhdlBlockStream)
+
+		self.ParseGroups(vhdlGroupStream, release)
+
+		if (key is not None):
+			cache.Store(key, self._DumpState())
+
+	@staticmethod
+	def _GetCacheKind() -> str:
+		"""Returns the kind of cache entries, which depends on the registered models."""
+		groupToModel = GROUP_TO_MODEL if _modelModulesLoaded else LoadModels()
+		return "Document:" + ",".join(sorted(
+			"{0.__module__}.{0.__qualname__}={1.__module__}.{1.__qualname__}".format(group, model) for group, model in groupToModel.items()
+		))
+
+	def _DumpState(self) -> bytes:
+		"""Serializes the document's nodes. References to the document itself are restored as references to the loading document."""
+		state = {name: value for name, value in vars(self).items() if name != "_path"}
+
+		buffer =  BytesIO()
+		pickler = Pickler(buffer, HIGHEST_PROTOCOL)
+		pickler.persistent_id = lambda item: "document" if (item is self) else None
+		pickler.dump(state)
+		return buffer.getvalue()
+
+	def _LoadState(self, data: bytes) -> bool:
+		"""Replaces the document's nodes by serialized nodes. Returns false, if the data can't be read."""
+		unpickler = _StateUnpickler(BytesIO(data))
+		unpickler.persistent_load = lambda persistentID: self
 		try:
-			groups =          [group for group in vhdlGroupStream]
-		except BlockParserException as ex:
-			raise DOMParserException("Error while parsing and indexing the source code.", ex.Group) from ex
-		except GroupParserException as ex:
-			raise DOMParserException("Unexpected ParserException.", ex.Block) from ex
-		except ParserException as ex:
-			raise DOMParserException("Unexpected ParserException.", ex.Position) from ex
-		except Exception as ex:
-			raise DOMParserException("Unexpected exception.", None) from ex
-
-		firstGroup =      groups[0]
-		lastGroup =       groups[-1]
+			state = unpickler.load()
+		except Exception:
+			return False
+
+		vars(self).update(state)
+		return True
+
+	def ParseGroups(self, groupStream: Iterable[Group], release: bool=False):
+		"""
+		Consumes a group stream and hands each completed group on document level to its model.
+
+		If ``release`` is set, all tokens, blocks and groups up to the end of a group on document level are unlinked in
+		both directions, after the group was handed to its model. The chains aren't reference cycles anymore and aren't
+		reachable from the start of the document, so they are freed without the cyclic garbage collector and a large
+		source is parsed in memory bounded by its largest design unit.
+		"""
+		groups =     self._GetGroups(groupStream)
+		firstGroup = next(groups, None)
 
 		if (not isinstance(firstGroup, StartOfDocumentGroup)):
 			raise DOMParserException("Expected group is not a StartOfDocumentGroup.", firstGroup)
-		elif (not isinstance(lastGroup, EndOfDocumentGroup)):
+
+		subGroups =     firstGroup._subGroups
+		lastGroup =     firstGroup
+		releasedGroup = firstGroup
+		releasedBlock = firstGroup.StartBlock
+		releasedToken = releasedBlock.StartToken
+		for lastGroup in groups:
+			# a group is on document level, if the parser appended it to the StartOfDocumentGroup
+			siblings = subGroups.get(lastGroup.__class__)
+			if (siblings and (siblings[-1] is lastGroup)):
+				siblings.pop()
+				self.stateParseGroup(self, lastGroup)
+
+				if release:
+					endBlock =      lastGroup.EndBlock
+					self._Unlink(releasedGroup, lastGroup, "_previousGroup", "NextGroup")
+					self._Unlink(releasedBlock, endBlock, "_previousBlock", "NextBlock")
+					self._Unlink(releasedToken, endBlock.EndToken, "_previousToken", "NextToken")
+					firstGroup.InnerGroup = None
+					releasedGroup = lastGroup
+					releasedBlock = endBlock
+					releasedToken = endBlock.EndToken
+
+		if (not isinstance(lastGroup, EndOfDocumentGroup)):
 			raise DOMParserException("Expected group is not an EndOfDocumentGroup.", lastGroup)
 
-		# run recursively (node, group)
-		self.stateParse(self, firstGroup)
+	@staticmethod
+	def _Unlink(item, lastItem, previousAttribute: str, nextAttribute: str):
+		"""Removes the links between all items of a chain from ``item`` up to ``lastItem``. The link to the item following ``lastItem`` is kept."""
+		while (item is not lastItem):
+			nextItem = getattr(item, nextAttribute)
+			if (nextItem is None):
+				break
+			setattr(item, nextAttribute, None)
+			setattr(nextItem, previousAttribute, None)
+			item = nextItem
+
+	@staticmethod
+	def _GetGroups(groupStream: Iterable[Group]) -> Iterator[Group]:
+		"""Forwards a group stream and translates parser exceptions into :class:`DOMParserException`."""
+		iterator = iter(groupStream)
+		while True:
+			try:
+				group = next(iterator)
+			except StopIteration:
+				return
+			except BlockParserException as ex:
+				raise DOMParserException("Error while parsing and indexing the source code.", ex.Group) from ex
+			except GroupParserException as ex:
+				raise DOMParserException("Unexpected ParserException.", ex.Block) from ex
+			except ParserException as ex:
+				raise DOMParserException("Unexpected ParserException.", ex.Position) from ex
+			except Exception as ex:
+				raise DOMParserException("Unexpected exception.", None) from ex
+
+			yield group
 
 	@classmethod
 	def stateParse(cls, document, startOfDocumentGroup: Group):
-		from pyVHDLParser.DocumentModel.Reference               import Library as LibraryModel, PackageReference as UseModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Context      import Context as ContextModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Entity       import Entity as EntityModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Architecture import Architecture as ArchitectureModel
-		from pyVHDLParser.DocumentModel.DesignUnit.Package      import Package as PackageModel
-		from pyVHDLParser.DocumentModel.DesignUnit.PackageBody  import PackageBody as PackageBodyModel
-
-		GROUP_TO_MODEL = {
-			LibraryGroup:       LibraryModel,
-			UseGroup:           UseModel,
-			ContextGroup:       ContextModel,
-			EntityGroup:        EntityModel,
-			ArchitectureGroup:  ArchitectureModel,
-			PackageGroup:       PackageModel,
-			PackageBodyGroup:   PackageBodyModel,
-			# ConfigurationModel
-		}
-
+		"""Builds the nodes for all groups on document level by the registered models (see :func:`RegisterModel`). Other groups like whitespace or comments are skipped."""
 		for subGroup in startOfDocumentGroup.GetSubGroups():
-			if isinstance(subGroup, (WhitespaceGroup)):
-				pass
-			for group in GROUP_TO_MODEL:
-				# TODO: compare to a direct dictionary match with exception fallback on whitespace
-				if isinstance(subGroup, group):
-					GROUP_TO_MODEL[group].stateParse(document, subGroup)
-					break
+			cls.stateParseGroup(document, subGroup)
+
+	@classmethod
+	def stateParseGroup(cls, document, group: Group):
+		"""Builds the node for a group on document level by its registered model. Unregistered groups are skipped."""
+		groupToModel = GROUP_TO_MODEL if _modelModulesLoaded else LoadModels()
+
+		model = groupToModel.get(group.__class__)
+		if (model is not None):
+			model.stateParse(document, group)
 
 	def AddLibrary(self, library):  # FIXME: parameter type
 		self.__libraries.append(library)
@@ -181,3 +335,7 @@ class Document(DocumentModel):
 		print()
 		for packageBody in self._packageBodies:
 			packageBody.Print()
+
+
+RegisterModel(LibraryGroup, Library)
+RegisterModel(UseGroup,     PackageReference)
@@ -0,0 +1,492 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Fast-forward scanner for design units and their dependencies
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Fast-forward scanner for design units and their dependencies.
+
+The scanner reads a token stream and reports the design units declared in a source file together with their
+``library``, ``use`` and ``context`` references and the component, entity, configuration and package
+instantiations they contain. It doesn't run the block and group parsers. Statement bodies are skipped by balancing
+parentheses and ``end`` keywords: constructs with a mandatory closing keyword (``end if``, ``end process``, ...) are
+ignored, so only subprogram bodies, nested packages, generate statements and the design unit itself are tracked. Inside
+a generate statement, a bare ``end`` closes a VHDL-2008 generate statement body (an alternative), not the statement.
+"""
+from enum                       import Enum, unique
+from pathlib                    import PurePath
+from typing                     import Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydecor.decorators         import export
+
+from pyVHDLParser.Base          import ParserException
+from pyVHDLParser.Token         import Token, TokenCategory, GetSourceText
+from pyVHDLParser.Token.Parser  import Tokenizer
+
+__all__ = []
+__api__ = __all__
+
+
+_SKIPPED =        TokenCategory.Trivia | TokenCategory.Meta
+_END =            ("", None)
+
+#: Keywords following ``end``, which close a construct with a mandatory closing keyword.
+_MANDATORY_END =  frozenset(("if", "loop", "case", "process", "postponed", "generate", "block", "record", "units", "protected", "component", "for"))
+_INSTANTIATION =  frozenset(("generic", "port"))
+
+
+@export
+class ScannerException(ParserException):
+	"""A :exc:`~pyVHDLParser.Base.ParserException` generated by the :class:`DesignUnitScanner`."""
+
+	def __init__(self, message: str, token: Optional[Token]):
+		super().__init__(message)
+		self.Token = token
+
+	def __str__(self) -> str:
+		if self.Token is None:
+			return self._message
+		return "{0!s}: {1}".format(self.Token.Start, self._message)
+
+
+@export
+@unique
+class DesignUnitKind(Enum):
+	"""Kinds of design units."""
+
+	Entity =        0
+	Architecture =  1
+	Package =       2
+	PackageBody =   3
+	Context =       4
+	Configuration = 5
+
+
+@export
+@unique
+class ReferenceKind(Enum):
+	"""Kinds of references in context clauses and declarative regions."""
+
+	Library =       0   #: ``library name;``
+	Use =           1   #: ``use name.name.name;``
+	Context =       2   #: ``context name.name;``
+
+
+@export
+@unique
+class InstantiationKind(Enum):
+	"""Kinds of instantiations and binding indications."""
+
+	Component =     0   #: ``label : [component] name``
+	Entity =        1   #: ``label : entity name[(architecture)]`` or ``use entity name[(architecture)]``
+	Configuration = 2   #: ``label : configuration name`` or ``use configuration name``
+	Package =       3   #: ``package name is new name``
+
+
+@export
+class Reference:
+	"""A ``library``, ``use`` or ``context`` reference."""
+
+	__slots__ = ("Kind", "Name", "Row")
+
+	Kind:  ReferenceKind   #: Kind of the reference.
+	Name:  str             #: Referenced (selected) name. Basic identifiers are lowercased.
+	Row:   int             #: Row of the reference in the source file.
+
+	def __init__(self, kind: ReferenceKind, name: str, row: int):
+		self.Kind = kind
+		self.Name = name
+		self.Row =  row
+
+	def __repr__(self) -> str:
+		return "<Reference {0} {1} at {2}>".format(self.Kind.name, self.Name, self.Row)
+
+
+@export
+class Instantiation:
+	"""An instantiated or bound component, entity, configuration or package."""
+
+	__slots__ = ("Kind", "Label", "Name", "Architecture", "Row")
+
+	Kind:          InstantiationKind   #: Kind of the instantiation.
+	Label:         Optional[str]       #: Instance label or None for binding indications and package instantiations.
+	Name:          str                 #: Instantiated (selected) name. Basic identifiers are lowercased.
+	Architecture:  Optional[str]       #: Architecture of an entity instantiation or None.
+	Row:           int                 #: Row of the instantiation in the source file.
+
+	def __init__(self, kind: InstantiationKind, label: Optional[str], name: str, architecture: Optional[str], row: int):
+		self.Kind =         kind
+		self.Label =        label
+		self.Name =         name
+		self.Architecture = architecture
+		self.Row =          row
+
+	def __repr__(self) -> str:
+		return "<Instantiation {0} {1}{2} at {3}>".format(self.Kind.name, self.Name, "" if (self.Architecture is None) else "(" + self.Architecture + ")", self.Row)
+
+
+@export
+class DesignUnit:
+	"""A design unit with its context clause, its references and its instantiations."""
+
+	__slots__ = ("Kind", "Name", "EntityName", "Row", "References", "Instantiations")
+
+	Kind:            DesignUnitKind        #: Kind of the design unit.
+	Name:            str                   #: Name of the design unit. Basic identifiers are lowercased.
+	EntityName:      Optional[str]         #: Entity of an architecture or configuration, otherwise None.
+	Row:             int                   #: Row of the design unit's keyword in the source file.
+	References:      List[Reference]       #: References of the context clause and inside the design unit.
+	Instantiations:  List[Instantiation]   #: Instantiations and binding indications inside the design unit.
+
+	def __init__(self, kind: DesignUnitKind, name: str, row: int, references: List[Reference], entityName: str = None):
+		self.Kind =           kind
+		self.Name =           name
+		self.EntityName =     entityName
+		self.Row =            row
+		self.References =     references
+		self.Instantiations = []
+
+	def __repr__(self) -> str:
+		return "<DesignUnit {0} {1}{2} at {3}>".format(self.Kind.name, self.Name, "" if (self.EntityName is None) else " of " + self.EntityName, self.Row)
+
+
+@export
+class DesignUnitScanner:
+	"""
+	Scans a token stream for design units (see :func:`ScanDesignUnits`).
+
+	Only significant tokens are read. A word's text is lowercased, a literal's text is its source code.
+	"""
+
+	_tokens:   Iterator[Tuple[str, Token]]
+	_pending:  Optional[Tuple[str, Token]]
+
+	def __init__(self, tokenStream: Iterable[Token]):
+		self._tokens =  self._GetSignificantTokens(tokenStream)
+		self._pending = None
+
+	@staticmethod
+	def _GetSignificantTokens(tokenStream: Iterable[Token]) -> Iterator[Tuple[str, Token]]:
+		word =    TokenCategory.Word
+		literal = TokenCategory.Literal
+		for token in tokenStream:
+			category = token.CATEGORY
+			if category & _SKIPPED:
+				continue
+			if category & word:
+				yield token.Value.lower(), token
+			elif category & literal:
+				yield GetSourceText(token, token), token
+			else:
+				# the tokenizer emits a linebreak after a delimiter as a character token
+				value = token.Value
+				if not value.isspace():
+					yield value, token
+
+	def _Next(self) -> Tuple[str, Token]:
+		pending = self._pending
+		if pending is not None:
+			self._pending = None
+			return pending
+		return next(self._tokens, _END)
+
+	def _PushBack(self, item: Tuple[str, Token]):
+		self._pending = item
+
+	def _Expect(self, expected: str, context: str) -> Token:
+		text, token = self._Next()
+		if text != expected:
+			raise ScannerException("Expected '{0}' {1}. Found '{2}'.".format(expected, context, text), token)
+		return token
+
+	def _ReadName(self) -> Tuple[str, Token]:
+		"""Reads a (selected) name and returns it with its first token."""
+		text, token = self._Next()
+		if token is None:
+			raise ScannerException("Unexpected end of document. Expected a name.", None)
+
+		parts = [text]
+		while True:
+			item = self._Next()
+			if item[0] != ".":
+				self._PushBack(item)
+				return ".".join(parts), token
+			parts.append(self._Next()[0])
+
+	def _ReadNameList(self, kind: ReferenceKind, references: List[Reference]):
+		"""Reads a comma-separated list of names up to and including the final ``;``."""
+		while True:
+			name, token = self._ReadName()
+			references.append(Reference(kind, name, token.Start.Row))
+			text, token = self._Next()
+			if text == ";":
+				return
+			if text != ",":
+				raise ScannerException("Expected ',' or ';' after {0} reference. Found '{1}'.".format(kind.name.lower(), text), token)
+
+	def _ReadEntityAspect(self, kind: InstantiationKind, label: Optional[str], unit: DesignUnit):
+		"""Reads the name and the optional architecture after ``entity`` or ``configuration``."""
+		name, token = self._ReadName()
+		architecture = None
+		if kind is InstantiationKind.Entity:
+			item = self._Next()
+			if item[0] == "(":
+				architecture = self._Next()[0]
+				self._Expect(")", "after architecture name")
+			else:
+				self._PushBack(item)
+		unit.Instantiations.append(Instantiation(kind, label, name, architecture, token.Start.Row))
+
+	def GetDesignUnits(self) -> Iterator[DesignUnit]:
+		"""Returns a generator, that emits each design unit as soon as it was scanned."""
+		references = []
+		while True:
+			text, token = self._Next()
+			if token is None:
+				return
+
+			if text == "library":
+				self._ReadNameList(ReferenceKind.Library, references)
+				continue
+			elif text == "use":
+				self._ReadNameList(ReferenceKind.Use, references)
+				continue
+			elif text == "context":
+				name, nameToken = self._ReadName()
+				item = self._Next()
+				if item[0] != "is":
+					references.append(Reference(ReferenceKind.Context, name, nameToken.Start.Row))
+					if item[0] == ",":
+						self._ReadNameList(ReferenceKind.Context, references)
+					elif item[0] != ";":
+						raise ScannerException("Expected ',', ';' or 'is' after context name. Found '{0}'.".format(item[0]), item[1])
+					continue
+
+				unit = DesignUnit(DesignUnitKind.Context, name, token.Start.Row, references)
+				self._ScanContext(unit)
+			elif text == "entity":
+				name, _ = self._ReadName()
+				self._Expect("is", "after entity name")
+				unit = DesignUnit(DesignUnitKind.Entity, name, token.Start.Row, references)
+				self._ScanBody(unit)
+			elif text in ("architecture", "configuration"):
+				name, _ = self._ReadName()
+				self._Expect("of", "after {0} name".format(text))
+				entityName, _ = self._ReadName()
+				self._Expect("is", "after entity name")
+				kind = DesignUnitKind.Architecture if (text == "architecture") else DesignUnitKind.Configuration
+				unit = DesignUnit(kind, name, token.Start.Row, references, entityName)
+				self._ScanBody(unit)
+			elif text == "package":
+				item = self._Next()
+				isBody = item[0] == "body"
+				if not isBody:
+					self._PushBack(item)
+				name, _ = self._ReadName()
+				self._Expect("is", "after package name")
+				unit = DesignUnit(DesignUnitKind.PackageBody if isBody else DesignUnitKind.Package, name, token.Start.Row, references)
+
+				item = self._Next()
+				if item[0] == "new":
+					self._ScanPackageInstantiation(None, unit)
+				else:
+					self._PushBack(item)
+					self._ScanBody(unit)
+			else:
+				raise ScannerException("Expected a context clause or a design unit. Found '{0}'.".format(text), token)
+
+			yield unit
+			references = []
+
+	def _ScanContext(self, unit: DesignUnit):
+		"""Scans the references of a context declaration up to its ``end``."""
+		while True:
+			text, token = self._Next()
+			if text == "library":
+				self._ReadNameList(ReferenceKind.Library, unit.References)
+			elif text == "use":
+				self._ReadNameList(ReferenceKind.Use, unit.References)
+			elif text == "context":
+				self._ReadNameList(ReferenceKind.Context, unit.References)
+			elif text == "end":
+				self._SkipTo(";")
+				return
+			else:
+				raise ScannerException("Expected a context reference or 'end'. Found '{0}'.".format(text), token)
+
+	def _ScanPackageInstantiation(self, label: Optional[str], unit: DesignUnit):
+		"""Scans ``name [generic map (...)];`` after ``package ... is new``."""
+		name, token = self._ReadName()
+		unit.Instantiations.append(Instantiation(InstantiationKind.Package, label, name, None, token.Start.Row))
+		self._SkipTo(";")
+
+	def _SkipTo(self, expected: str):
+		"""Skips all tokens up to and including ``expected`` outside of parentheses."""
+		parentheses = 0
+		while True:
+			text, token = self._Next()
+			if token is None:
+				raise ScannerException("Unexpected end of document. Expected '{0}'.".format(expected), None)
+			elif text == "(":
+				parentheses += 1
+			elif text == ")":
+				parentheses -= 1
+			elif (text == expected) and (parentheses == 0):
+				return
+
+	def _ScanBody(self, unit: DesignUnit):
+		"""Skips the body of a design unit up to its ``end`` and collects references and instantiations."""
+		constructs =  [False]  #: Open constructs closed by an ``end``: true for generate statements.
+		alternative = False    #: True after ``elsif`` or ``else`` in the current statement.
+		parentheses = 0
+		previous =    ""       #: Text of the previous token, if it was a word, otherwise an empty string.
+		while True:
+			text, token = self._Next()
+			if token is None:
+				raise ScannerException("Unexpected end of document in {0} '{1}'.".format(unit.Kind.name.lower(), unit.Name), None)
+
+			if text == "(":
+				parentheses += 1
+			elif text == ")":
+				parentheses -= 1
+			elif parentheses > 0:
+				pass
+			elif text == "end":
+				item = self._Next()
+				if item[0] == "generate":
+					if constructs[-1]:
+						constructs.pop()
+				elif (item[0] not in _MANDATORY_END) and not constructs[-1]:
+					constructs.pop()
+					if not constructs:
+						if item[0] != ";":
+							self._SkipTo(";")
+						return
+			elif text == ";":
+				alternative = False
+			elif text in ("elsif", "else"):
+				alternative = True
+			elif text == "generate":
+				# 'elsif ... generate' and 'else generate' start the next alternative of an if-generate statement
+				if not alternative:
+					constructs.append(True)
+				alternative = False
+			elif text in ("function", "procedure"):
+				# a subprogram body is closed by an 'end'
+				if self._ScanSubprogram():
+					constructs.append(False)
+			elif text == "package":
+				item = self._Next()
+				if item[0] != "is":
+					if item[0] != "body":
+						self._PushBack(item)
+					self._ReadName()
+					self._Expect("is", "after package name")
+					item = self._Next()
+					if item[0] == "new":
+						self._ScanPackageInstantiation(None, unit)
+					else:
+						self._PushBack(item)
+						constructs.append(False)
+			elif text == "use":
+				item = self._Next()
+				if item[0] == "entity":
+					self._ReadEntityAspect(InstantiationKind.Entity, None, unit)
+				elif item[0] == "configuration":
+					self._ReadEntityAspect(InstantiationKind.Configuration, None, unit)
+				elif item[0] != "open":
+					self._PushBack(item)
+					self._ReadNameList(ReferenceKind.Use, unit.References)
+			elif (text == ":") and previous:
+				self._ScanLabeledStatement(previous, unit)
+			elif token.CATEGORY & TokenCategory.Word:
+				previous = text
+				continue
+
+			previous = ""
+
+	def _ScanSubprogram(self) -> bool:
+		"""Scans a subprogram specification after ``function`` or ``procedure``. Returns true, if a body follows."""
+		parentheses = 0
+		first =       True
+		while True:
+			text, token = self._Next()
+			if token is None:
+				raise ScannerException("Unexpected end of document in subprogram specification.", None)
+			elif text == "(":
+				parentheses += 1
+			elif text == ")":
+				parentheses -= 1
+			elif parentheses > 0:
+				pass
+			elif text == ";":
+				return False
+			elif text == "is":
+				# 'function is' is an entity class in an attribute specification
+				if first:
+					return False
+				item = self._Next()
+				self._PushBack(item)
+				return item[0] != "new"
+			first = False
+
+	def _ScanLabeledStatement(self, label: str, unit: DesignUnit):
+		"""Scans the token after ``label :`` for an instantiation."""
+		item = self._Next()
+		text = item[0]
+		if text in ("entity", "configuration", "component"):
+			nameItem = self._Next()
+			self._PushBack(nameItem)
+			# 'name : entity is' is an entity class in an attribute specification
+			if nameItem[0] == "is":
+				return
+			if text == "component":
+				name, token = self._ReadName()
+				unit.Instantiations.append(Instantiation(InstantiationKind.Component, label, name, None, token.Start.Row))
+			else:
+				self._ReadEntityAspect(InstantiationKind.Entity if (text == "entity") else InstantiationKind.Configuration, label, unit)
+		elif (item[1] is not None) and (item[1].CATEGORY & TokenCategory.Word):
+			self._PushBack(item)
+			name, token = self._ReadName()
+			item = self._Next()
+			self._PushBack(item)
+			if item[0] in _INSTANTIATION:
+				unit.Instantiations.append(Instantiation(InstantiationKind.Component, label, name, None, token.Start.Row))
+		else:
+			self._PushBack(item)
+
+
+@export
+def ScanDesignUnits(source: Union[str, PurePath, bytes, Iterable[Token]]) -> List[DesignUnit]:
+	"""
+	Returns the design units of a VHDL source.
+
+	The source is anything accepted by :meth:`~pyVHDLParser.Token.Parser.Tokenizer.GetVHDLTokenizer` or a token
+	stream. Strings, paths and bytes are tokenized by the lexeme scanner. References after the last design unit are
+	not reported.
+	"""
+	if isinstance(source, (str, PurePath, bytes, bytearray)):
+		source = Tokenizer.GetVHDLTokenizer(source, engine=Tokenizer.Engine.LexemeScanner)
+	return list(DesignUnitScanner(source).GetDesignUnits())
@@ -26,13 +26,14 @@
 # ==============================================================================
 #
 # load dependencies
-from collections import Generator
-from typing import Any
+from typing import Any, Generator
 
-from pyVHDLParser.Blocks           import BlockParserException, CommentBlock, Block
-from pyVHDLParser.Blocks.Common    import IndentationBlock, LinebreakBlock, WhitespaceBlock
+from pyVHDLParser.Blocks           import BlockParserException, BlockCategory, Block
 # from pyVHDLParser.Blocks.Document  import CommentBlock
 
+_SKIPPED =    BlockCategory.Indentation | BlockCategory.Comment | BlockCategory.Linebreak
+_MULTIPART =  BlockCategory.Whitespace | BlockCategory.Comment
+
 
 def StripAndFuse(generator: Generator[Block, Any, None]) -> Generator[Block, Any, None]:
 	iterator =  iter(generator)
@@ -42,13 +43,13 @@ def StripAndFuse(generator: Generator[Block, Any, None]) -> Generator[Block, Any
 	yield lastBlock
 
 	for block in iterator:
-		if isinstance(block, (IndentationBlock, CommentBlock, LinebreakBlock)):
+		if (block.CATEGORY & _SKIPPED):
 			continue
 		else:
 			if (block.MultiPart == True):
 				while True:
 					nextBlock = next(iterator)
-					if isinstance(nextBlock, (WhitespaceBlock, CommentBlock)):
+					if (nextBlock.CATEGORY & _MULTIPART):
 						continue
 					if (type(block) is not type(nextBlock)):
 						raise BlockParserException("Error in multipart blocks. {0} <-> {1}".format(type(block), type(nextBlock)), None)   # TODO: review exception type
@@ -69,7 +70,7 @@ def FastForward(generator: Generator[Block, Any, None]) -> Generator[Block, Any,
 	yield next(iterator)
 
 	for block in iterator:
-		if isinstance(block, (IndentationBlock, CommentBlock, LinebreakBlock)):
+		if (block.CATEGORY & _SKIPPED):
 			continue
 		else:
 			yield block
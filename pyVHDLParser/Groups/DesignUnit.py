@@ -31,8 +31,7 @@ from itertools                                import chain
 
 from pydecor.decorators                       import export
 
-from pyVHDLParser.Blocks                      import CommentBlock, EndOfDocumentBlock
-from pyVHDLParser.Blocks.Common               import LinebreakBlock, IndentationBlock
+from pyVHDLParser.Blocks                      import BlockCategory, EndOfDocumentBlock
 from pyVHDLParser.Blocks.List                 import GenericList, ParameterList, PortList
 from pyVHDLParser.Blocks.Object.Signal        import SignalDeclarationBlock
 from pyVHDLParser.Blocks.Object.Constant      import ConstantDeclarationBlock
@@ -40,7 +39,7 @@ from pyVHDLParser.Blocks.Reference            import Context, Library, Use
 from pyVHDLParser.Blocks.Reporting.Assert     import AssertBlock
 from pyVHDLParser.Blocks.Sequential           import Package, PackageBody, Function, Procedure, Process
 from pyVHDLParser.Blocks.Structural           import Entity, Architecture, Component, Configuration
-from pyVHDLParser.Groups                      import GroupParserException, Group, EndOfDocumentGroup, ParserState
+from pyVHDLParser.Groups                      import GroupParserException, Group, EndOfDocumentGroup, ParserState, BlockDispatchTable
 from pyVHDLParser.Groups.Comment              import CommentGroup, WhitespaceGroup
 from pyVHDLParser.Groups.Concurrent           import AssertGroup
 from pyVHDLParser.Groups.List                 import GenericListGroup, ParameterListGroup, PortListGroup
@@ -61,6 +60,8 @@ class ContextGroup(Group):
 		Use.StartBlock:        UseGroup
 	}
 
+	BLOCK_DISPATCH = BlockDispatchTable(SIMPLE_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -85,26 +86,25 @@ class ContextGroup(Group):
 			#parserState.Pop()
 			#parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.BLOCK_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -131,6 +131,9 @@ class EntityGroup(Group):
 		Process.OpenBlock:       ProcessGroup,
 	}
 
+	DECLARATION_DISPATCH = BlockDispatchTable(DECLARATION_SIMPLE_BLOCKS, DECLARATION_COMPOUND_BLOCKS)
+	STATEMENT_DISPATCH =   BlockDispatchTable(STATEMENT_SIMPLE_BLOCKS, STATEMENT_COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -177,13 +180,13 @@ class EntityGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -207,13 +210,13 @@ class EntityGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -238,34 +241,25 @@ class EntityGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.DECLARATION_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -282,34 +276,25 @@ class EntityGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.STATEMENT_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -337,6 +322,9 @@ class ArchitectureGroup(Group):
 		Process.OpenBlock:        ProcessGroup
 	}
 
+	DECLARATION_DISPATCH = BlockDispatchTable(DECLARATION_SIMPLE_BLOCKS, DECLARATION_COMPOUND_BLOCKS)
+	STATEMENT_DISPATCH =   BlockDispatchTable(STATEMENT_SIMPLE_BLOCKS, STATEMENT_COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -359,13 +347,13 @@ class ArchitectureGroup(Group):
 		if isinstance(currentBlock, Architecture.NameBlock):
 			parserState.NextState =   cls.stateParseDeclarations
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -386,34 +374,25 @@ class ArchitectureGroup(Group):
 		if isinstance(currentBlock, Architecture.BeginBlock):
 			parserState.NextState =   cls.stateParseStatements
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.DECLARATION_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -432,34 +411,25 @@ class ArchitectureGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.STATEMENT_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -484,6 +454,8 @@ class PackageGroup(Group):
 		Procedure.NameBlock:      ProcedureGroup
 	}
 
+	DECLARATION_DISPATCH = BlockDispatchTable(DECLARATION_SIMPLE_BLOCKS, DECLARATION_COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -508,34 +480,25 @@ class PackageGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState = WhitespaceGroup.stateParse
 			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState = CommentGroup.stateParse
 			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.DECLARATION_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -560,6 +523,9 @@ class PackageBodyGroup(Group):
 		Procedure.NameBlock:      ProcedureGroup
 	}
 
+	DECLARATION_DISPATCH =          BlockDispatchTable(DECLARATION_SIMPLE_BLOCKS)
+	DECLARATION_COMPOUND_DISPATCH = BlockDispatchTable(DECLARATION_COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -584,35 +550,33 @@ class PackageBodyGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState = WhitespaceGroup.stateParse
 			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState = CommentGroup.stateParse
 			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, parserState.BlockMarker, currentBlock)
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.DECLARATION_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
+
+			group = cls.DECLARATION_COMPOUND_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.NextGroup =   group(parserState.LastGroup, parserState.BlockMarker, currentBlock)
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -634,6 +598,8 @@ class ComponentGroup(Group):
 		# Procedure.NameBlock:      ProcedureGroup
 	}
 
+	BLOCK_DISPATCH = BlockDispatchTable(SIMPLE_BLOCKS, COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -653,34 +619,25 @@ class ComponentGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState = WhitespaceGroup.stateParse
 			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState = CommentGroup.stateParse
 			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.BLOCK_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -702,6 +659,8 @@ class ConfigurationGroup(Group):
 		# Procedure.NameBlock: ProcedureGroup
 	}
 
+	BLOCK_DISPATCH = BlockDispatchTable(SIMPLE_BLOCKS, COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -721,34 +680,25 @@ class ConfigurationGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState = WhitespaceGroup.stateParse
 			parserState.NextGroup = WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState = CommentGroup.stateParse
 			parserState.NextGroup = CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue = True
 			return
 		else:
-			for block in cls.SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.SIMPLE_BLOCKS[block]
-					parserState.PushState = group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue = True
-					return
-
-			for block in cls.COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.COMPOUND_BLOCKS[block]
-					parserState.PushState = group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue = True
-					return
+			group = cls.BLOCK_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
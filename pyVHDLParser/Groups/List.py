@@ -28,8 +28,7 @@
 # load dependencies
 from pydecor.decorators             import export
 
-from pyVHDLParser.Blocks            import CommentBlock, EndOfDocumentBlock
-from pyVHDLParser.Blocks.Common     import LinebreakBlock, IndentationBlock
+from pyVHDLParser.Blocks            import BlockCategory, EndOfDocumentBlock
 import pyVHDLParser.Blocks.InterfaceObject
 from pyVHDLParser.Blocks.List       import GenericList, ParameterList, PortList, SensitivityList
 from pyVHDLParser.Groups            import ParserState, GroupParserException, Group, EndOfDocumentGroup
@@ -65,13 +64,13 @@ class GenericListGroup(Group):
 		elif isinstance(currentBlock, GenericList.CloseBlock):
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -142,13 +141,13 @@ class PortListGroup(Group):
 		elif isinstance(currentBlock, PortList.CloseBlock):
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -219,13 +218,13 @@ class ParameterListGroup(Group):
 		elif isinstance(currentBlock, ParameterList.CloseBlock):
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -296,13 +295,13 @@ class SensitivityListGroup(Group):
 		elif isinstance(currentBlock, SensitivityList.CloseBlock):
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
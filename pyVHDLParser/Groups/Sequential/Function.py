@@ -32,15 +32,14 @@ from itertools                            import chain
 from pydecor.decorators                   import export
 
 from pyVHDLParser.Token.Keywords          import EndToken
-from pyVHDLParser.Blocks                  import CommentBlock, EndOfDocumentBlock
-from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock
+from pyVHDLParser.Blocks                  import BlockCategory, EndOfDocumentBlock
 from pyVHDLParser.Blocks.List             import GenericList, ParameterList
 from pyVHDLParser.Blocks.Object.Variable  import VariableDeclarationBlock
 from pyVHDLParser.Blocks.Object.Constant  import ConstantDeclarationBlock
 from pyVHDLParser.Blocks.Reference        import Use
 from pyVHDLParser.Blocks.Reporting.Report import ReportBlock
 from pyVHDLParser.Blocks.Sequential       import Function
-from pyVHDLParser.Groups                  import ParserState, Group, GroupParserException, EndOfDocumentGroup
+from pyVHDLParser.Groups                  import ParserState, Group, GroupParserException, EndOfDocumentGroup, BlockDispatchTable
 from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup
 from pyVHDLParser.Groups.Concurrent       import ReportGroup
 from pyVHDLParser.Groups.List             import GenericListGroup, ParameterListGroup
@@ -69,6 +68,9 @@ class FunctionGroup(Group):
 		# If.OpenBlock:        IfGroup
 	}
 
+	DECLARATION_DISPATCH = BlockDispatchTable(DECLARATION_SIMPLE_BLOCKS, DECLARATION_COMPOUND_BLOCKS)
+	STATEMENT_DISPATCH =   BlockDispatchTable(STATEMENT_SIMPLE_BLOCKS, STATEMENT_COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -123,13 +125,13 @@ class FunctionGroup(Group):
 				parserState.NextState =   cls.stateParse2
 				parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -153,13 +155,13 @@ class FunctionGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -201,34 +203,25 @@ class FunctionGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.DECLARATION_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -244,34 +237,25 @@ class FunctionGroup(Group):
 			# parserState.NextGroup =   cls(parserState.LastGroup, parserState.BlockMarker, parserState.Block)
 			parserState.Pop()
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.STATEMENT_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -31,15 +31,14 @@ from itertools                            import chain
 
 from pydecor.decorators                   import export
 
-from pyVHDLParser.Blocks                  import CommentBlock, EndOfDocumentBlock
-from pyVHDLParser.Blocks.Common           import LinebreakBlock, IndentationBlock
+from pyVHDLParser.Blocks                  import BlockCategory, EndOfDocumentBlock
 from pyVHDLParser.Blocks.List             import GenericList, ParameterList
 from pyVHDLParser.Blocks.Object.Variable  import VariableDeclarationBlock
 from pyVHDLParser.Blocks.Object.Constant  import ConstantDeclarationBlock
 from pyVHDLParser.Blocks.Reference        import Use
 from pyVHDLParser.Blocks.Reporting.Report import ReportBlock
 from pyVHDLParser.Blocks.Sequential       import Procedure
-from pyVHDLParser.Groups                  import ParserState, Group, GroupParserException, EndOfDocumentGroup
+from pyVHDLParser.Groups                  import ParserState, Group, GroupParserException, EndOfDocumentGroup, BlockDispatchTable
 from pyVHDLParser.Groups.Comment          import WhitespaceGroup, CommentGroup
 from pyVHDLParser.Groups.List             import GenericListGroup, ParameterListGroup
 from pyVHDLParser.Groups.Object           import ConstantGroup, VariableGroup
@@ -67,6 +66,9 @@ class ProcedureGroup(Group):
 		# If.OpenBlock:        IfGroup
 	}
 
+	DECLARATION_DISPATCH = BlockDispatchTable(DECLARATION_SIMPLE_BLOCKS, DECLARATION_COMPOUND_BLOCKS)
+	STATEMENT_DISPATCH =   BlockDispatchTable(STATEMENT_SIMPLE_BLOCKS, STATEMENT_COMPOUND_BLOCKS)
+
 	def __init__(self, previousGroup, startBlock, endBlock=None):
 		super().__init__(previousGroup, startBlock, endBlock)
 
@@ -116,13 +118,13 @@ class ProcedureGroup(Group):
 		elif isinstance(currentBlock, Procedure.VoidBlock):
 			parserState.NextState =   cls.stateParseDeclarations
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -147,13 +149,13 @@ class ProcedureGroup(Group):
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
@@ -178,34 +180,25 @@ class ProcedureGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.DECLARATION_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.DECLARATION_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.DECLARATION_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.DECLARATION_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.DECLARATION_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
@@ -222,34 +215,25 @@ class ProcedureGroup(Group):
 			parserState.Pop()
 			parserState.BlockMarker = None
 			return
-		elif isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
+		elif (currentBlock.CATEGORY & (BlockCategory.Linebreak | BlockCategory.Indentation)):
 			parserState.PushState =   WhitespaceGroup.stateParse
 			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
+		elif (currentBlock.CATEGORY & BlockCategory.Comment):
 			parserState.PushState =   CommentGroup.stateParse
 			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
 		else:
-			for block in cls.STATEMENT_SIMPLE_BLOCKS:
-				if isinstance(currentBlock, block):
-					group = cls.STATEMENT_SIMPLE_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for block in cls.STATEMENT_COMPOUND_BLOCKS:
-				if isinstance(currentBlock, block):
-					group =                   cls.STATEMENT_COMPOUND_BLOCKS[block]
-					parserState.PushState =   group.stateParse
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
+			group = cls.STATEMENT_DISPATCH.Get(currentBlock)
+			if (group is not None):
+				parserState.PushState =   group.stateParse
+				parserState.BlockMarker = currentBlock
+				parserState.ReIssue =     True
+				return
 
 		if isinstance(currentBlock, EndOfDocumentBlock):
 			parserState.NextGroup = EndOfDocumentGroup(currentBlock)
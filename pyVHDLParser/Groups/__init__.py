@@ -27,16 +27,16 @@
 #
 # load dependencies
 from types                                  import FunctionType
-from typing import Iterator, Callable, List, Generator, Any, Dict
-
-from pyTerminalUI                           import LineTerminal
+from typing import Iterator, Callable, List, Generator, Any, Dict, Optional
 
 from pydecor.decorators                     import export
 
 from pyVHDLParser                           import StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
+from pyVHDLParser                           import Debug
+from pyVHDLParser.Debug                     import TraceEvent, Trace
 from pyVHDLParser.Base                      import ParserException
-from pyVHDLParser.Blocks                    import Block, CommentBlock, StartOfDocumentBlock, EndOfDocumentBlock
-from pyVHDLParser.Blocks.Common             import LinebreakBlock, IndentationBlock
+from pyVHDLParser.Token                     import GetSourceText
+from pyVHDLParser.Blocks                    import Block, StartOfDocumentBlock, EndOfDocumentBlock
 from pyVHDLParser.Blocks.Reference          import Context, Library, Use
 from pyVHDLParser.Blocks.Sequential         import Package, PackageBody
 from pyVHDLParser.Blocks.Structural         import Entity, Architecture, Configuration
@@ -203,7 +203,8 @@ class ParserState:
 			self.ReIssue = True
 			while self.ReIssue:
 				self.ReIssue = False
-				LineTerminal().WriteDryRun("{DARK_GRAY}reissue state={state!s: <50}  block={block!s: <40}     {NOCOLOR}".format(state=self, block=self.Block, **LineTerminal.Foreground))
+				if Debug.TRACING:
+					Trace(TraceEvent.ReIssue, self, self.Block)
 				self.NextState(self)
 
 				# yield a new group
@@ -219,9 +220,57 @@ class ParserState:
 			raise GroupParserException("Unexpected end of document.", self.Block)
 
 
+@export
+class BlockDispatchTable:
+	"""
+	Maps block classes to group classes.
+
+	A block is looked up by its exact class first. On a miss, the block class' method resolution order is searched
+	for a registered base-class. The result of this search (also a failed one) is cached per block class, so each
+	block class is resolved only once.
+	"""
+
+	__slots__ = ("_groups", "_cache")
+
+	_groups: Dict[type, type]             #: Registered block classes and their group classes.
+	_cache:  Dict[type, Optional[type]]   #: Resolved block classes and their group classes (or None).
+
+	def __init__(self, *mappings: Dict[type, type]):
+		"""Initializes a dispatch table from mappings of block classes to group classes. Earlier mappings take precedence."""
+		self._groups = {}
+		for mapping in mappings:
+			for blockClass, groupClass in mapping.items():
+				self._groups.setdefault(blockClass, groupClass)
+
+		self._cache = dict(self._groups)
+
+	def __len__(self) -> int:
+		return len(self._groups)
+
+	def Get(self, block: Block) -> Optional[type]:
+		"""Returns the group class for a block or None."""
+		blockClass = block.__class__
+		try:
+			return self._cache[blockClass]
+		except KeyError:
+			pass
+
+		groupClass = None
+		for baseClass in blockClass.__mro__:
+			groupClass = self._groups.get(baseClass)
+			if (groupClass is not None):
+				break
+
+		self._cache[blockClass] = groupClass
+		return groupClass
+
+
 @export
 class MetaGroup(type):
-	"""Register all state*** methods in an array called '__STATES__'"""
+	"""
+	Register all state*** methods in an array called '__STATES__' and add an empty
+	'__slots__' declaration to all classes not declaring their own slots.
+	"""
 	def __new__(cls, className, baseClasses, classMembers: dict):
 		states = []
 		for memberName, memberObject in classMembers.items():
@@ -229,11 +278,14 @@ class MetaGroup(type):
 				states.append(memberObject)
 
 		classMembers['__STATES__'] = states
+		classMembers.setdefault("__slots__", ())
 		return super().__new__(cls, className, baseClasses, classMembers)
 
 
 @export
 class Group(metaclass=MetaGroup):
+	__slots__ = ("_previousGroup", "NextGroup", "InnerGroup", "_subGroups", "StartBlock", "EndBlock", "MultiPart")
+
 	__STATES__ = None
 
 	_previousGroup:  'Group'                   #: Reference to the previous group.
@@ -257,7 +309,7 @@ class Group(metaclass=MetaGroup):
 		self.MultiPart =          False
 
 	def __len__(self) -> int:
-		return self.EndBlock.EndToken.End.Absolute - self.StartBlock.StartToken.Start.Absolute + 1
+		return self.EndBlock.EndToken.EndAbsolute - self.StartBlock.StartToken.StartAbsolute + 1
 
 	def __iter__(self):   # XXX: return type; iterator vs. generator
 		block = self.StartBlock
@@ -304,6 +356,13 @@ class Group(metaclass=MetaGroup):
 	def Length(self) -> int:
 		return len(self)
 
+	@property
+	def Text(self) -> str:
+		"""Returns the source code from :attr:`StartBlock` to :attr:`EndBlock` (see :func:`~pyVHDLParser.Token.GetSourceText`)."""
+		if ((self.StartBlock is None) or (self.EndBlock is None)):
+			return ""
+		return GetSourceText(self.StartBlock.StartToken, self.EndBlock.EndToken)
+
 	@property
 	def States(self) -> List[Callable]:
 		return self.__STATES__
@@ -343,6 +402,9 @@ class EndOfGroup(Group):
 	def __init__(self, endBlock: Block):
 		self._previousGroup = None
 		self.NextGroup =      None
+		self.InnerGroup =     None
+		self._subGroups =     {}
+
 		self.StartBlock =     None
 		self.EndBlock =       endBlock
 		self.MultiPart =      False
@@ -366,6 +428,8 @@ class EndOfGroup(Group):
 
 @export
 class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
+	BLOCK_DISPATCH: BlockDispatchTable = None   #: Maps blocks on document level to the groups they start (see :meth:`GetBlockDispatch`).
+
 	def __init__(self, startBlock: Block):
 		from pyVHDLParser.Groups.Comment      import CommentGroup, WhitespaceGroup
 		from pyVHDLParser.Groups.DesignUnit   import ContextGroup, EntityGroup, ArchitectureGroup, PackageGroup, PackageBodyGroup, ConfigurationGroup
@@ -387,11 +451,19 @@ class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
 		}
 
 	@classmethod
-	def stateDocument(cls, parserState: ParserState):
+	def GetBlockDispatch(cls) -> BlockDispatchTable:
+		"""Returns the dispatch table for blocks on document level. It's built on first use, because the group modules import this module."""
+		from pyVHDLParser.Blocks                import CommentBlock
+		from pyVHDLParser.Blocks.Common         import LinebreakBlock, IndentationBlock
+		from pyVHDLParser.Groups.Comment        import CommentGroup, WhitespaceGroup
 		from pyVHDLParser.Groups.DesignUnit     import ContextGroup, EntityGroup, ArchitectureGroup, PackageGroup, PackageBodyGroup, ConfigurationGroup
 		from pyVHDLParser.Groups.Reference      import LibraryGroup, UseGroup
-		from pyVHDLParser.Groups.Comment import CommentGroup, WhitespaceGroup
 
+		TRIVIA_BLOCKS = {
+			LinebreakBlock:           WhitespaceGroup,
+			IndentationBlock:         WhitespaceGroup,
+			CommentBlock:             CommentGroup
+		}
 		SIMPLE_BLOCKS = {
 			Library.StartBlock:       LibraryGroup,
 			Use.StartBlock:           UseGroup
@@ -405,42 +477,27 @@ class StartOfDocumentGroup(StartOfGroup, StartOfDocument):
 			Configuration.NameBlock:  ConfigurationGroup
 		}
 
+		StartOfDocumentGroup.BLOCK_DISPATCH = BlockDispatchTable(TRIVIA_BLOCKS, SIMPLE_BLOCKS, COMPOUND_BLOCKS)
+		return StartOfDocumentGroup.BLOCK_DISPATCH
+
+	@classmethod
+	def stateDocument(cls, parserState: ParserState):
 		currentBlock = parserState.Block
 
-		if isinstance(currentBlock, (LinebreakBlock, IndentationBlock)):
-			parserState.PushState =   WhitespaceGroup.stateParse
-			parserState.NextGroup =   WhitespaceGroup(parserState.LastGroup, currentBlock)
+		dispatch = cls.BLOCK_DISPATCH
+		if (dispatch is None):
+			dispatch = cls.GetBlockDispatch()
+
+		group = dispatch.Get(currentBlock)
+		if (group is not None):
+			parserState.PushState =   group.stateParse
+			parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
 			parserState.BlockMarker = currentBlock
 			parserState.ReIssue =     True
 			return
-		elif isinstance(currentBlock, CommentBlock):
-			parserState.PushState =   CommentGroup.stateParse
-			parserState.NextGroup =   CommentGroup(parserState.LastGroup, currentBlock)
-			parserState.BlockMarker = currentBlock
-			parserState.ReIssue =     True
+		elif isinstance(currentBlock, EndOfDocumentBlock):
+			parserState.NewGroup = EndOfDocumentGroup(currentBlock)
 			return
-		else:
-			for blk in SIMPLE_BLOCKS:
-				if isinstance(currentBlock, blk):
-					group =                   SIMPLE_BLOCKS[blk]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			for blk in COMPOUND_BLOCKS:
-				if isinstance(currentBlock, blk):
-					group =                   COMPOUND_BLOCKS[blk]
-					parserState.PushState =   group.stateParse
-					parserState.NextGroup =   group(parserState.LastGroup, currentBlock)
-					parserState.BlockMarker = currentBlock
-					parserState.ReIssue =     True
-					return
-
-			if isinstance(currentBlock, EndOfDocumentBlock):
-				parserState.NewGroup = EndOfDocumentGroup(currentBlock)
-				return
 
 		raise GroupParserException("Expected keywords: architecture, context, entity, library, package, use. Found '{block!s}'.".format(
 			block=currentBlock.__class__.__qualname__
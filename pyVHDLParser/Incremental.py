@@ -0,0 +1,480 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Incremental re-tokenization and re-blocking of edited sources
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Incremental re-tokenization and re-blocking of edited sources.
+
+An :class:`IncrementalDocument` keeps the token and block chains of a source. For an edit (offset, number of removed
+characters, inserted text), only the damaged region is processed again:
+
+* The tokenizer restarts at the beginning of the damaged line and stops at the first linebreak (or single-line
+  comment) after the edit, which was also a token of the old chain at the same (shifted) position. From there on,
+  the old tokens are kept.
+* The block parser records a :class:`~pyVHDLParser.Blocks.ParserCheckpoint` at every block boundary. It resumes
+  from the nearest checkpoint in front of the edit and stops at the first checkpoint behind the damaged tokens, which
+  matches the old checkpoint at the same token. From there on, the old blocks are kept.
+
+The block parser specializes tokens in place. Fed tokens are reset to the classes and values emitted by the tokenizer.
+If the block parser fails, the blocks and checkpoints in front of the error are kept and the tokens behind its last
+checkpoint are reset, so they equal a fresh tokenization. Later edits resume from the nearest checkpoint in front of
+the edit or the error.
+
+Positions of the kept tokens behind an edit are shifted lazily: a single pending offset applies to all tokens behind a
+frontier. Tokens are shifted, when the frontier is passed by a later edit or by :meth:`IncrementalDocument.Flush`.
+"""
+from typing                     import Dict, List, Optional
+
+from pydecor.decorators         import export
+
+from pyVHDLParser.Base          import ParserException
+from pyVHDLParser.Token         import Token, ValuedToken, EndOfDocumentToken, LinebreakToken, SingleLineCommentToken
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import Block, BlockParserException, ParserCheckpoint, ParserState
+
+__all__ = []
+__api__ = __all__
+
+
+_VALUE = ValuedToken.Value
+
+
+def _GetValue(token: Token) -> Optional[str]:
+	"""Returns the value of a valued token, unless it's a lazy value, or None."""
+	if isinstance(token, ValuedToken):
+		try:
+			return _VALUE.__get__(token)
+		except AttributeError:
+			pass
+	return None
+
+
+@export
+class EditResult:
+	"""Describes the tokens and blocks created by an edit of an :class:`IncrementalDocument`."""
+
+	__slots__ = ("Tokens", "Blocks", "Exception")
+
+	Tokens:     List[Token]                #: New tokens, which replaced the tokens of the damaged region.
+	Blocks:     List[Block]                #: New blocks, which replaced the blocks of the re-parsed region.
+	Exception:  Optional[ParserException]  #: Exception raised by the tokenizer or block parser, or None.
+
+	def __init__(self, tokens: List[Token], blocks: List[Block], exception: ParserException = None):
+		self.Tokens =     tokens
+		self.Blocks =     blocks
+		self.Exception =  exception
+
+
+@export
+class IncrementalDocument:
+	"""
+	The token and block chains of a source, which are updated incrementally by :meth:`Edit`.
+
+	If the source can't be tokenized, the exception is kept in :attr:`TokenException` and the next edit processes the
+	whole source again. If it can't be split into blocks, the exception is kept in :attr:`BlockException` and the next
+	edit resumes the block parser in front of the edit or the error.
+	"""
+
+	_source:          str
+	_tokens:          Optional[List[Token]]   #: Token chain in order.
+	_classes:         List[type]              #: Token classes emitted by the tokenizer (the block parser specializes tokens in place).
+	_values:          List[Optional[str]]     #: Token values emitted by the tokenizer (None for lazy values and other tokens).
+	_frontier:        int                     #: Index of the first token, whose position isn't shifted yet.
+	_pending:         int                     #: Pending shift of all tokens from the frontier on.
+	_blocks:          Optional[List[Block]]   #: Blocks in the order emitted by the block parser.
+	_checkpoints:     Dict[int, ParserCheckpoint]   #: Checkpoints of the block parser by the id of their token.
+	_failure:         Optional[int]           #: After a block parser error, index of the last checkpoint's token. Tokens from there on have no blocks and checkpoints.
+	_fed:             int                     #: Index behind the last token fed to the block parser.
+
+	TokenException:   Optional[ParserException]   #: Exception raised by the tokenizer or None.
+	BlockException:   Optional[ParserException]   #: Exception raised by the block parser or None.
+
+	def __init__(self, source: str):
+		self._source = source
+		self._Parse()
+
+	@property
+	def Source(self) -> str:
+		return self._source
+
+	@property
+	def StartToken(self) -> Optional[Token]:
+		"""Returns the first token (after shifting all pending positions) or None, if the source can't be tokenized."""
+		self.Flush()
+		return None if (self._tokens is None) else self._tokens[0]
+
+	@property
+	def StartBlock(self) -> Optional[Block]:
+		"""Returns the first block (after shifting all pending positions) or None, if the source can't be split into blocks."""
+		self.Flush()
+		return None if ((self._blocks is None) or (self.BlockException is not None)) else self._blocks[0]
+
+	@property
+	def Tokens(self) -> List[Token]:
+		"""Returns a list of all tokens (after shifting all pending positions)."""
+		self.Flush()
+		return [] if (self._tokens is None) else list(self._tokens)
+
+	@property
+	def Blocks(self) -> List[Block]:
+		"""Returns a list of all blocks (after shifting all pending positions) in the order emitted by the block parser."""
+		self.Flush()
+		return [] if ((self._blocks is None) or (self.BlockException is not None)) else list(self._blocks)
+
+	def Flush(self):
+		"""Shifts the positions of all tokens behind the frontier."""
+		if (self._tokens is not None):
+			self._Shift(self._frontier, len(self._tokens), self._pending)
+			self._frontier = len(self._tokens)
+			self._pending =  0
+
+	def _Shift(self, start: int, stop: int, delta: int):
+		"""Shifts the positions of tokens ``start`` to ``stop - 1``. Meta tokens keep their explicit positions."""
+		if (delta != 0):
+			tokens = self._tokens
+			for index in range(start, stop):
+				token = tokens[index]
+				if (token._start.__class__ is int):
+					token._start += delta
+					token._end +=   delta
+
+	def _GetStart(self, index: int) -> int:
+		start = self._tokens[index].StartAbsolute
+		return (start + self._pending) if (index >= self._frontier) else start
+
+	def _GetEnd(self, index: int) -> int:
+		end = self._tokens[index].EndAbsolute
+		return (end + self._pending) if (index >= self._frontier) else end
+
+	def _Parse(self):
+		"""Tokenizes the whole source and splits it into blocks."""
+		self._tokens =          None
+		self._classes =         []
+		self._values =          []
+		self._frontier =        0
+		self._pending =         0
+		self._blocks =          None
+		self._checkpoints =     {}
+		self._failure =         None
+		self._fed =             0
+		self.TokenException =   None
+		self.BlockException =   None
+
+		try:
+			tokens = list(Tokenizer.GetVHDLScanner(self._source))
+		except ParserException as ex:
+			self.TokenException = ex
+			return
+
+		self._tokens =    tokens
+		self._classes =   [token.__class__ for token in tokens]
+		self._values =    [_GetValue(token) for token in tokens]
+		self._frontier =  len(tokens)
+		self._ParseBlocks(None, 0, len(tokens))
+
+	def _ParseBlocks(self, checkpoint: Optional[ParserCheckpoint], restartIndex: int, damageEnd: int) -> List[Block]:
+		"""
+		Runs the block parser from ``checkpoint`` at token ``restartIndex`` on and returns the new blocks. An exception is
+		kept in :attr:`BlockException`.
+
+		Without a checkpoint, the whole block chain is parsed again. The parser stops at the first token from
+		``damageEnd`` on, where its checkpoint matches the old checkpoint. The old blocks from there on are kept and
+		linked to the new blocks. After an error, only the new blocks in front of the parser's last checkpoint are kept
+		(see :meth:`_Fail`).
+		"""
+		checkpoints = []
+		resync =      []
+		feed =        self._FeedTokens(restartIndex, damageEnd, checkpoints, resync)
+		if (checkpoint is None):
+			self._checkpoints.clear()
+			blockIndex =  0
+			state =       ParserState(feed, checkpointInterval=1)
+		else:
+			blockIndex =  self._blocks.index(checkpoint.LastBlock) + 1
+			state =       ParserState.FromCheckpoint(checkpoint, feed, checkpointInterval=1)
+		state.Checkpoints = checkpoints
+
+		blocks = []
+		try:
+			for block in state.GetGenerator():
+				blocks.append(block)
+		except Exception as ex:
+			# the parser is stopped by the end of the token feed, after it resynchronized
+			if not resync:
+				if not isinstance(ex, ParserException):
+					ex = BlockParserException("Unexpected exception while parsing blocks.", state.Token).with_traceback(ex.__traceback__)
+				self.BlockException = ex
+				return self._Fail(restartIndex, blockIndex, blocks, checkpoints)
+
+		for newCheckpoint in checkpoints:
+			self._checkpoints[id(newCheckpoint.Token)] = newCheckpoint
+		self._failure = None
+
+		if (blockIndex == 0):
+			self._blocks = blocks
+		elif resync:
+			# the last old block in front of the checkpoint is replaced, unless it's the block in front of the restart
+			oldBlocks =   self._blocks
+			lastIndex =   oldBlocks.index(resync[0].LastBlock, blockIndex - 1)
+			oldBlock =    oldBlocks[lastIndex + 1]
+			lastBlock =   checkpoints[-1].LastBlock
+			lastBlock.NextBlock =     oldBlock
+			oldBlock._previousBlock = lastBlock
+			oldBlocks[blockIndex:lastIndex + 1] = blocks
+		else:
+			self._blocks[blockIndex:] = blocks
+		self.BlockException = None
+		return blocks
+
+	def _Fail(self, restartIndex: int, blockIndex: int, blocks: List[Block], checkpoints: List[ParserCheckpoint]) -> List[Block]:
+		"""
+		Keeps the blocks and checkpoints in front of the block parser's last checkpoint (or the restart) and returns the
+		kept new blocks.
+
+		Tokens from the checkpoint's token on are reset and their old checkpoints are removed. Tokens behind the fed
+		tokens and behind a previous error are already reset.
+		"""
+		tokens =          self._tokens
+		oldCheckpoints =  self._checkpoints
+		failure =         restartIndex
+		if checkpoints:
+			lastCheckpoint = checkpoints[-1]
+			failure =        self._fed - 1
+			while (tokens[failure] is not lastCheckpoint.Token):
+				failure -= 1
+			blocks =         blocks[:blocks.index(lastCheckpoint.LastBlock) + 1]
+			for newCheckpoint in checkpoints:
+				oldCheckpoints[id(newCheckpoint.Token)] = newCheckpoint
+		else:
+			blocks =         []
+
+		stop = max(self._fed, len(tokens) if (self._failure is None) else self._failure)
+		self._Reset(failure, stop)
+		for index in range(failure + 1, stop):
+			oldCheckpoints.pop(id(tokens[index]), None)
+
+		if (blockIndex == 0):
+			self._blocks = blocks
+		else:
+			self._blocks[blockIndex:] = blocks
+		if self._blocks:
+			self._blocks[-1].NextBlock = None
+		self._failure = failure
+		return blocks
+
+	def _Reset(self, start: int, stop: int):
+		"""Resets tokens ``start`` to ``stop - 1`` to the classes and values emitted by the tokenizer."""
+		tokens =  self._tokens
+		classes = self._classes
+		values =  self._values
+		for index in range(start, stop):
+			token =           tokens[index]
+			token.__class__ = classes[index]
+			value =           values[index]
+			if (value is not None):
+				token.Value = value
+
+	def _FeedTokens(self, index: int, damageEnd: int, checkpoints: List[ParserCheckpoint], resync: List[ParserCheckpoint]):
+		"""
+		Feeds the token chain from ``index`` on to the block parser.
+
+		Tokens get their positions shifted and are reset to the classes and values emitted by the tokenizer. Old checkpoints of fed
+		tokens are removed, except for the first token. When a new checkpoint in ``checkpoints`` matches the old
+		checkpoint of a token from ``damageEnd`` on, the old checkpoint is put into ``resync`` and the feed ends.
+		"""
+		tokens =          self._tokens
+		classes =         self._classes
+		values =          self._values
+		oldCheckpoints =  self._checkpoints
+		oldCheckpoint =   None
+		first =           index
+		while index < len(tokens):
+			# the parser's checkpoint at the previous token is recorded, before it reads the next token
+			if ((oldCheckpoint is not None) and checkpoints):
+				newCheckpoint = checkpoints[-1]
+				if ((newCheckpoint.Token is oldCheckpoint.Token) and newCheckpoint.Matches(oldCheckpoint)):
+					resync.append(oldCheckpoint)
+					return
+
+			token = tokens[index]
+			if (index >= self._frontier):
+				self._Shift(index, index + 1, self._pending)
+				self._frontier = index + 1
+			token.__class__ = classes[index]
+			value =           values[index]
+			if (value is not None):
+				token.Value = value
+			self._fed = index + 1
+
+			if (index > first):
+				oldCheckpoint = oldCheckpoints.pop(id(token), None)
+				if (index < damageEnd):
+					oldCheckpoint = None
+
+			yield token
+			index += 1
+
+	def _FindToken(self, position: int) -> int:
+		"""Returns the index of the last token (excluding meta tokens) starting at or before ``position`` or 1."""
+		low =   1
+		high =  len(self._tokens) - 1
+		while (low < high):
+			middle = (low + high) // 2
+			if (self._GetStart(middle) <= position):
+				low = middle + 1
+			else:
+				high = middle
+		return max(1, low - 1)
+
+	def _IsRestartBoundary(self, index: int, source: str) -> bool:
+		"""Returns true, if the tokenizer's state behind token ``index`` equals its state at the start of a document."""
+		tokenClass = self._classes[index]
+		if (tokenClass is SingleLineCommentToken):
+			return True
+		elif ((tokenClass is LinebreakToken) and (self._tokens[index].Value != "\r")):
+			# a directive is recognized after a linebreak, but not at the start of a document
+			return source[self._GetEnd(index):self._GetEnd(index) + 1] != "`"
+		return False
+
+	def Edit(self, offset: int, removed: int, inserted: str) -> EditResult:
+		"""
+		Replaces ``removed`` characters at 0-based ``offset`` by ``inserted`` and updates the token and block chains.
+
+		Returns the new tokens and blocks. If the edited source can't be tokenized or split into blocks, the exception
+		is returned and kept in :attr:`TokenException` or :attr:`BlockException`.
+		"""
+		source = self._source
+		if ((offset < 0) or (removed < 0) or (offset + removed > len(source))):
+			raise ValueError("Edit at {0} removing {1} characters is out of range.".format(offset, removed))
+
+		newSource =     source[:offset] + inserted + source[offset + removed:]
+		self._source =  newSource
+
+		if (self._tokens is None):
+			self._Parse()
+			return EditResult(self.Tokens, self.Blocks, self.TokenException or self.BlockException)
+
+		# restart the tokenizer at the beginning of the line before the edit
+		tokens =    self._tokens
+		classes =   self._classes
+		values =    self._values
+		endIndex =  len(tokens) - 1
+		first =     self._FindToken(offset + 1)
+		while ((first > 1) and not self._IsRestartBoundary(first - 1, newSource)):
+			first -= 1
+		restart =   0 if (first == 1) else self._GetStart(first) - 1
+
+		delta =       len(inserted) - removed
+		limit =       offset + len(inserted) + 1
+		lineIndex =   tokens[0]._lineIndex
+		newTokens =   []
+		stop =        None
+		oldIndex =    first
+		try:
+			scanner = Tokenizer.GetVHDLScanner(newSource[restart:])
+			next(scanner)
+			for token in scanner:
+				if isinstance(token, EndOfDocumentToken):
+					break
+
+				token._start +=     restart
+				token._end +=       restart
+				token._lineIndex =  lineIndex
+				newTokens.append(token)
+
+				# resynchronize at a linebreak behind the edit, which is also in the old chain
+				tokenClass = token.__class__
+				if ((token._start >= limit) and ((tokenClass is SingleLineCommentToken) or ((tokenClass is LinebreakToken) and (token.Value != "\r")))):
+					oldStart = token._start - delta
+					while ((oldIndex < endIndex) and (self._GetStart(oldIndex) < oldStart)):
+						oldIndex += 1
+					if ((oldIndex < endIndex) and (classes[oldIndex] is tokenClass) and (self._GetStart(oldIndex) == oldStart) and (self._GetEnd(oldIndex) == token._end - delta)):
+						stop = oldIndex + 1
+						break
+		except ParserException as ex:
+			self._Parse()
+			return EditResult([], [], ex)
+
+		lineIndex._source = newSource
+		lineIndex.Replace(offset, removed, inserted)
+
+		# bring the positions of the kept tokens in line with a single frontier
+		frontier = self._frontier
+		pending =  self._pending
+		if (frontier < first):
+			self._Shift(frontier, first, pending)
+			frontier = first
+		if (stop is None):
+			stop = endIndex + 1
+		if (frontier <= stop):
+			frontier = stop
+		else:
+			self._Shift(stop, frontier, delta)
+
+		checkpoints = self._checkpoints
+		for index in range(first, stop):
+			checkpoints.pop(id(tokens[index]), None)
+
+		previousToken = tokens[first - 1]
+		lastToken =     newTokens[-1] if newTokens else previousToken
+		if newTokens:
+			newTokens[0]._previousToken = previousToken
+			previousToken.NextToken =     newTokens[0]
+		if (stop > endIndex):
+			newTokens.append(EndOfDocumentToken(lastToken, lineIndex.GetEndPosition(len(newSource))))
+		else:
+			nextToken =                 tokens[stop]
+			lastToken.NextToken =       nextToken
+			nextToken._previousToken =  lastToken
+			endToken =                  tokens[endIndex]
+			endToken._start = endToken._end = lineIndex.GetEndPosition(len(newSource))
+
+		tokens[first:stop] =  newTokens
+		classes[first:stop] = [token.__class__ for token in newTokens]
+		values[first:stop] =  [_GetValue(token) for token in newTokens]
+		damageEnd =           first + len(newTokens)
+		if (stop > endIndex):
+			self._frontier =  len(tokens)
+			self._pending =   0
+		else:
+			self._frontier =  frontier + damageEnd - stop
+			self._pending =   pending + delta
+
+		failure = self._failure
+		if (failure is not None):
+			# behind a previous error, there are no old blocks to resynchronize with
+			self._failure = (failure + damageEnd - stop) if (failure >= stop) else min(failure, first)
+			damageEnd =     len(tokens)
+
+		# resume the block parser at the nearest checkpoint in front of the edit and a previous error
+		restartIndex = first - 1
+		if (self._failure is not None):
+			restartIndex = min(restartIndex, self._failure)
+		while ((restartIndex > 0) and (id(tokens[restartIndex]) not in checkpoints)):
+			restartIndex -= 1
+
+		blocks = self._ParseBlocks(checkpoints.get(id(tokens[restartIndex])), restartIndex, damageEnd)
+		return EditResult(newTokens, blocks, self.BlockException)
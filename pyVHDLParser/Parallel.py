@@ -0,0 +1,279 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Parallel parsing of a single source file
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Parallel parsing of a single source file.
+
+Large (generated) files often contain many independent design units. On document level, the block parser reads
+nothing but context clauses and design units, so a source can be cut at the beginning of a line, which starts a
+context clause or a design unit. :func:`GetChunkOffsets` finds such lines by a fast textual search. The chunks are
+tokenized and split into blocks (and groups) in a pool of worker processes, and the results are joined into a single
+token and block chain with the positions of the whole source (see :meth:`~pyVHDLParser.Columnar.ColumnarDocument.Join`).
+
+The search doesn't know, if a line is on document level. But a chunk is only parsed without an error, if it ends on
+document level, because nothing else accepts the end of a document. If a chunk can't be parsed, the whole source is
+parsed again in the current process, so results and exceptions are the same as for a sequential parse.
+"""
+import re
+from concurrent.futures         import Executor, ProcessPoolExecutor
+from os                         import cpu_count
+from typing                     import Dict, List, Optional, Tuple
+
+from pydecor.decorators         import export
+
+from pyVHDLParser.Base          import ParserException
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import Block, TokenToBlockParser
+from pyVHDLParser.Groups        import BlockToGroupParser, Group
+from pyVHDLParser.Columnar      import ColumnarDocument
+from pyVHDLParser.Workspace     import InitializeWorker
+
+__all__ = []
+__api__ = __all__
+
+
+MINIMUM_CHUNK_SIZE =  16384   #: Minimal number of characters in a chunk.
+
+#: A line, which starts with a context clause or a design unit.
+_UNIT_LINE =          re.compile(r"^(?:library|context|entity|architecture|package)(?!\w)", re.IGNORECASE | re.MULTILINE)
+
+#: Describes a group by its class, the indices of its first and last block, its multi-part flag and the indices of
+#: its previous, next and first inner group and of its sub-groups by class. Missing blocks and groups are -1.
+GroupEntry =          Tuple[type, int, int, bool, int, int, int, Dict[type, List[int]]]
+
+
+@export
+def GetChunkOffsets(source: str, chunkSize: int) -> List[int]:
+	"""
+	Returns the 0-based offsets of the chunks of ``source``. The first chunk begins at 0.
+
+	A chunk begins at a line, which starts with ``library``, ``context``, ``entity``, ``architecture`` or ``package`` in
+	the first column. Each chunk has at least ``chunkSize`` characters.
+	"""
+	offsets =   [0]
+	position =  chunkSize
+	stop =      len(source) - chunkSize
+	while (position <= stop):
+		match = _UNIT_LINE.search(source, position)
+		if ((match is None) or (match.start() > stop)):
+			break
+		offsets.append(match.start())
+		position = match.start() + chunkSize
+
+	return offsets
+
+
+@export
+class ChunkResult:
+	"""The picklable result of :func:`ParseChunk`."""
+
+	__slots__ = ("Document", "Groups", "GroupCount")
+
+	Document:    ColumnarDocument             #: Tokens and blocks of the chunk.
+	Groups:      Optional[List[GroupEntry]]   #: Description of the groups (see :func:`DescribeGroups`) or None.
+	GroupCount:  int                          #: Number of emitted groups, which are described first.
+
+	def __init__(self, document: ColumnarDocument, groups: List[GroupEntry] = None, groupCount: int = 0):
+		self.Document =   document
+		self.Groups =     groups
+		self.GroupCount = groupCount
+
+
+@export
+def ParseChunk(source: str, groups: bool = False, last: bool = True) -> ChunkResult:
+	"""
+	Parses a chunk into blocks and optionally into groups. It's called in the worker processes.
+
+	Unless it's the ``last`` chunk, the end of document block is linked to the last block like the first block of the
+	next chunk, so groups are closed like in the whole source.
+	"""
+	InitializeWorker()
+
+	blocks =   list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(source)))
+	document = ColumnarDocument.FromBlocks(blocks)
+	if not groups:
+		return ChunkResult(document)
+
+	if not last:
+		blocks[-1]._previousBlock = blocks[-2]
+	groupList = list(BlockToGroupParser.Transform(iter(blocks)))
+	return ChunkResult(document, DescribeGroups(groupList, blocks), len(groupList))
+
+
+@export
+def DescribeGroups(groups: List[Group], blocks: List[Block]) -> List[GroupEntry]:
+	"""
+	Returns a picklable description of groups, which refers to blocks and groups by index.
+
+	The emitted groups come first. Groups, which are only referenced by other groups, are appended.
+	"""
+	blockIndices = {id(block): index for index, block in enumerate(blocks)}
+	groupIndices = {id(group): index for index, group in enumerate(groups)}
+	groups =       list(groups)
+
+	def GetBlockIndex(block: Optional[Block]) -> int:
+		if block is None:
+			return -1
+		try:
+			return blockIndices[id(block)]
+		except KeyError:
+			raise ParserException("Group references a block, which is not in the block stream.") from None
+
+	def GetGroupIndex(group: Optional[Group]) -> int:
+		if group is None:
+			return -1
+		index = groupIndices.get(id(group))
+		if index is None:
+			index = groupIndices[id(group)] = len(groups)
+			groups.append(group)
+		return index
+
+	entries = []
+	for group in groups:
+		entries.append((
+			group.__class__,
+			GetBlockIndex(group.StartBlock),
+			GetBlockIndex(group.EndBlock),
+			group.MultiPart,
+			GetGroupIndex(group._previousGroup),
+			GetGroupIndex(group.NextGroup),
+			GetGroupIndex(group.InnerGroup),
+			{groupClass: [GetGroupIndex(subGroup) for subGroup in subGroups] for groupClass, subGroups in group._subGroups.items()}
+		))
+	return entries
+
+
+def _GetChunkSize(source: str, workers: Optional[int]) -> int:
+	# a few chunks per worker balance the load while keeping the inter-process overhead low
+	workers = cpu_count() if (workers is None) else workers
+	return max(MINIMUM_CHUNK_SIZE, len(source) // (4 * max(1, workers or 1)))
+
+
+def _ParseChunks(source: str, groups: bool, workers: Optional[int], executor: Optional[Executor], chunkSize: Optional[int]) -> Tuple[List[int], List[ChunkResult]]:
+	"""Returns the chunk offsets and results. Falls back to a single chunk, if a chunk can't be parsed."""
+	offsets = GetChunkOffsets(source, _GetChunkSize(source, workers) if (chunkSize is None) else chunkSize)
+	if (len(offsets) > 1):
+		chunks = [source[start:stop] for start, stop in zip(offsets, offsets[1:] + [len(source)])]
+		flags =  [groups] * len(chunks)
+		lasts =  [False] * (len(chunks) - 1) + [True]
+		try:
+			if executor is not None:
+				return offsets, list(executor.map(ParseChunk, chunks, flags, lasts))
+			elif workers == 0:
+				return offsets, list(map(ParseChunk, chunks, flags, lasts))
+			else:
+				with ProcessPoolExecutor(max_workers=workers, initializer=InitializeWorker) as pool:
+					return offsets, list(pool.map(ParseChunk, chunks, flags, lasts))
+		except Exception:
+			# a chunk doesn't end on document level or a block state failed
+			pass
+
+	return [0], [ParseChunk(source, groups)]
+
+
+@export
+def ParseBlocks(source: str, workers: int = None, executor: Executor = None, chunkSize: int = None) -> ColumnarDocument:
+	"""
+	Parses a source into blocks in parallel and returns a single :class:`~pyVHDLParser.Columnar.ColumnarDocument`.
+
+	Chunks are distributed to a :class:`~concurrent.futures.ProcessPoolExecutor` with ``workers`` processes (default:
+	number of CPUs). Alternatively, an existing ``executor`` is used. With ``workers=0``, chunks are parsed in the
+	current process. Chunks have at least ``chunkSize`` characters (default: a quarter of the source per worker, at
+	least :data:`MINIMUM_CHUNK_SIZE`).
+	"""
+	offsets, results = _ParseChunks(source, False, workers, executor, chunkSize)
+	if (len(results) == 1):
+		return results[0].Document
+	return ColumnarDocument.Join(source, [result.Document for result in results], offsets)
+
+
+@export
+def ParseGroups(source: str, workers: int = None, executor: Executor = None, chunkSize: int = None) -> List[Group]:
+	"""
+	Parses a source into blocks and groups in parallel (see :func:`ParseBlocks`) and returns the groups in emission order.
+
+	The groups refer to a single chain of linked blocks and tokens. Groups on document level of all chunks are
+	sub-groups of the first :class:`~pyVHDLParser.Groups.StartOfDocumentGroup`. The first group of a chunk is linked
+	to the last group emitted by the previous chunk.
+	"""
+	offsets, results = _ParseChunks(source, True, workers, executor, chunkSize)
+	documents =        [result.Document for result in results]
+	blocks =           (documents[0] if (len(results) == 1) else ColumnarDocument.Join(source, documents, offsets)).ToBlocks()
+
+	groups =        []
+	documentGroup = None
+	tail =          None
+	blockBase =     0     #: Block i of a chunk is block 'blockBase + i' of the joined document.
+	last =          len(results) - 1
+	for number, result in enumerate(results):
+		entries = result.Groups
+		objects = [object.__new__(entry[0]) for entry in entries]
+		if (number > 0):
+			# the chunk's start of document group is merged into the first one, its block is dropped
+			objects[0] = documentGroup
+			blockBase -= 1
+		if (number < last):
+			# the last emitted group is the chunk's end of document group
+			objects[result.GroupCount - 1] = None
+
+		def GetGroup(index: int) -> Optional[Group]:
+			return None if (index < 0) else objects[index]
+
+		def GetBlock(index: int) -> Optional[Block]:
+			return None if (index < 0) else blocks[blockBase + index]
+
+		for index, (_, start, end, multiPart, previousGroup, nextGroup, innerGroup, subGroups) in enumerate(entries):
+			group = objects[index]
+			if ((number > 0) and (index == 0)):
+				for groupClass, indices in subGroups.items():
+					documentGroup._subGroups.setdefault(groupClass, []).extend(map(GetGroup, indices))
+				if (documentGroup.InnerGroup is None):
+					documentGroup.InnerGroup = GetGroup(innerGroup)
+			elif group is not None:
+				group._previousGroup = GetGroup(previousGroup)
+				group.NextGroup =      GetGroup(nextGroup)
+				group.InnerGroup =     GetGroup(innerGroup)
+				group._subGroups =     {groupClass: list(map(GetGroup, indices)) for groupClass, indices in subGroups.items()}
+				group.StartBlock =     GetBlock(start)
+				group.EndBlock =       GetBlock(end)
+				group.MultiPart =      multiPart
+
+		# the chunk's first group follows the last group emitted in front of it
+		if (number == 0):
+			documentGroup = objects[0]
+		else:
+			group = GetGroup(entries[0][5])
+			if group is not None:
+				group._previousGroup = tail
+				tail.NextGroup =       group
+		if (result.GroupCount > 1):
+			tail = objects[result.GroupCount - 2]
+
+		groups.extend(group for group in objects[(0 if (number == 0) else 1):result.GroupCount] if (group is not None))
+		blockBase += result.Document.BlockCount - (0 if (number == last) else 1)
+
+	return groups
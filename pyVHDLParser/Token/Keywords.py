@@ -28,27 +28,44 @@
 # load dependencies
 from pydecor.decorators         import export
 
-from pyVHDLParser.Token import Token, WordToken, VHDLToken, CharacterToken
+from pyVHDLParser.Token import Token, TokenCategory, WordToken, VHDLToken, CharacterToken
 from pyVHDLParser.Token.Parser  import TokenizerException
 
 __all__ = []
 __api__ = __all__
 
 
+#: If True, specific tokens and keywords retype the recognized simple token in place. Otherwise,
+#: a new token is allocated, which replaces the simple token in the token chain.
+SPECIALIZE_IN_PLACE: bool = True
+
+
 @export
 class SpecificVHDLToken(VHDLToken):
 	"""Base-class for all specific tokens.
 
-	Simple token will be converted to specific tokens while parsing.
-	The internal data is copied, and the original token is replaced by this token.
+	Simple token will be converted to specific tokens while parsing. By default
+	(see :data:`SPECIALIZE_IN_PLACE`), the simple token's class is replaced, so the
+	token keeps its storage and its links. Otherwise, the internal data is copied,
+	and the original token is replaced by this token.
 	"""
 
+	CATEGORY = TokenCategory.Specific
+
+	def __new__(cls, token: Token):
+		if SPECIALIZE_IN_PLACE:
+			token.__class__ = cls
+			return token
+		return super().__new__(cls)
+
 	def __init__(self, token: Token):
 		"""
 		Initialize a specific token, by copying the simple token's data and link
 		this new token to the previous token as a replacement.
 		"""
-		super().__init__(token.PreviousToken, token.Value, token.Start, token.End)
+		if (token is not self):
+			super().__init__(token.PreviousToken, token.Value, token._start, token._end)
+			self._trivia = token._trivia
 
 
 @export
@@ -268,8 +285,17 @@ class RepeatedLabelToken(LabelToken):
 class MultiCharKeyword(VHDLToken):
 	__KEYWORD__ = None
 
+	def __new__(cls, characterToken: CharacterToken):
+		if SPECIALIZE_IN_PLACE:
+			characterToken.__class__ = cls
+			characterToken.Value =     cls.__KEYWORD__
+			return characterToken
+		return super().__new__(cls)
+
 	def __init__(self, characterToken: CharacterToken):
-		super().__init__(characterToken.PreviousToken, self.__KEYWORD__, characterToken.Start, characterToken.End)
+		if (characterToken is not self):
+			super().__init__(characterToken.PreviousToken, self.__KEYWORD__, characterToken._start, characterToken._end)
+			self._trivia = characterToken._trivia
 
 	def __str__(self) -> str:
 		return "<{name: <50} '{value}' at {pos!r}>".format(
@@ -328,12 +354,24 @@ class SignalAssociationKeyword(AssociationKeyword):
 
 @export
 class KeywordToken(VHDLToken):
+	CATEGORY = TokenCategory.Keyword
+
 	__KEYWORD__ : str
 
+	def __new__(cls, wordToken: WordToken):
+		if (not (isinstance(wordToken, WordToken) and (wordToken <= cls.__KEYWORD__))):
+			raise TokenizerException("Expected keyword {0}.".format(cls.__KEYWORD__.upper()), wordToken)
+
+		if SPECIALIZE_IN_PLACE:
+			wordToken.__class__ = cls
+			wordToken.Value =     cls.__KEYWORD__
+			return wordToken
+		return super().__new__(cls)
+
 	def __init__(self, wordToken: WordToken):
-		if (not (isinstance(wordToken, WordToken) and (wordToken <= self.__KEYWORD__))):
-			raise TokenizerException("Expected keyword {0}.".format(self.__KEYWORD__.upper()), wordToken)
-		super().__init__(wordToken.PreviousToken, self.__KEYWORD__, wordToken.Start, wordToken.End)
+		if (wordToken is not self):
+			super().__init__(wordToken.PreviousToken, self.__KEYWORD__, wordToken._start, wordToken._end)
+			self._trivia = wordToken._trivia
 
 	def __str__(self) -> str:
 		return "<{name: <50}  {value:.<59} at {pos!r}>".format(
@@ -27,13 +27,17 @@
 #
 # load dependencies
 from enum                     import Enum
-from typing                   import Iterator
+from itertools                import islice
+from mmap                     import mmap, ACCESS_READ
+from pathlib                  import PurePath
+from re                       import compile as re_compile
+from typing                   import AnyStr, Callable, IO, Iterable, Iterator, Union
 
 from pydecor.decorators       import export
 
-from pyVHDLParser             import SourceCodePosition
+from pyVHDLParser             import SourceCodePosition, SourceCodeLineIndex
 from pyVHDLParser.Base        import ParserException
-from pyVHDLParser.Token       import StartOfDocumentToken, EndOfDocumentToken, IndentationToken, FusedCharacterToken
+from pyVHDLParser.Token       import Token, TokenCategory, StartOfDocumentToken, EndOfDocumentToken, IndentationToken, FusedCharacterToken
 from pyVHDLParser.Token       import CharacterLiteralToken, StringLiteralToken, ExtendedIdentifier, DirectiveToken, IntegerLiteralToken, RealLiteralToken
 from pyVHDLParser.Token       import CharacterToken, SpaceToken, WordToken, SingleLineCommentToken, MultiLineCommentToken, LinebreakToken
 
@@ -41,6 +45,102 @@ __all__ = []
 __api__ = __all__
 
 
+# Character classes of the lexeme scanner (see Tokenizer.GetVHDLScanner)
+_CC_OTHER =         0
+_CC_SPACE =         1
+_CC_DIGIT =         2
+_CC_ALPHA =         3
+_CC_APOSTROPHE =    4
+_CC_QUOTE =         5
+_CC_DASH =          6
+_CC_CR =            7
+_CC_LF =            8
+_CC_FUSEABLE =      9
+_CC_DOT =           10
+_CC_BACKSLASH =     11
+_CC_BACKTICK =      12
+
+_CHARACTER_CLASSES = {}
+_CHARACTER_CLASSES.update({char: _CC_SPACE    for char in " \t"})
+_CHARACTER_CLASSES.update({char: _CC_ALPHA    for char in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"})
+_CHARACTER_CLASSES.update({char: _CC_DIGIT    for char in "0123456789"})
+_CHARACTER_CLASSES.update({char: _CC_FUSEABLE for char in "=<:/*>?"})
+_CHARACTER_CLASSES.update({
+	"'":  _CC_APOSTROPHE,
+	"\"": _CC_QUOTE,
+	"-":  _CC_DASH,
+	"\r": _CC_CR,
+	"\n": _CC_LF,
+	".":  _CC_DOT,
+	"\\": _CC_BACKSLASH,
+	"`":  _CC_BACKTICK
+})
+
+# Dispatch variants of the lexeme scanner. Depending on the lexeme that was
+# closed by a character, the character-by-character state machine dispatches
+# that character slightly different. These flags reproduce its behavior.
+_DV_REFRESH =       1   #: A new start position is created for the next lexeme.
+_DV_REAL =          2   #: A ``.`` starts a possible real literal.
+_DV_LINEBREAKS =    4   #: ``\r`` and ``\n`` are recognized as linebreaks.
+_DV_STAYFUSEABLE =  8   #: Any other character keeps the scanner in the fuseable character state.
+
+_DV_OTHER =         _DV_REFRESH | _DV_LINEBREAKS
+_DV_SPACE =         _DV_REFRESH | _DV_LINEBREAKS | _DV_REAL
+_DV_DASH =          _DV_REFRESH
+_DV_CR =            0
+_DV_DOT =           _DV_REFRESH
+_DV_FUSEABLE =      _DV_REFRESH | _DV_LINEBREAKS | _DV_STAYFUSEABLE
+
+_FUSED_CHARACTERS = frozenset(("=>", "**", ":=", "/=", "<=", ">=", "<>", "<<", ">>", "??", "?=", "?<", "?>", "?/=", "?<=", "?>="))
+
+_SPACE_PATTERN =        re_compile(r"[ \t]*")
+_WORD_PATTERN =         re_compile(r"[A-Za-z0-9_]*")
+_DIGITS_PATTERN =       re_compile(r"[0-9_]*")
+_TO_LINEBREAK_PATTERN = re_compile(r"[^\r\n]*")
+
+# The same patterns for Latin-1 encoded bytes-like sources.
+_SPACE_BYTES_PATTERN =        re_compile(rb"[ \t]*")
+_WORD_BYTES_PATTERN =         re_compile(rb"[A-Za-z0-9_]*")
+_DIGITS_BYTES_PATTERN =       re_compile(rb"[0-9_]*")
+_TO_LINEBREAK_BYTES_PATTERN = re_compile(rb"[^\r\n]*")
+
+BytesSource = (bytes, bytearray, mmap)    #: Types of bytes-like sources accepted by the tokenizer.
+
+
+@export
+class Latin1Buffer:
+	"""
+	Presents a Latin-1 encoded bytes-like object (``bytes``, ``bytearray`` or ``mmap``) as a read-only string.
+
+	Latin-1 maps every byte to the code point of the same value, so indices and lengths are identical in both
+	representations. Only requested characters and slices are decoded, the buffer is never decoded as a whole.
+	"""
+
+	__slots__ = ("_buffer",)
+
+	_buffer: Union[bytes, bytearray, mmap]
+
+	def __init__(self, buffer: Union[bytes, bytearray, mmap]):
+		self._buffer = buffer
+
+	def __len__(self) -> int:
+		return len(self._buffer)
+
+	def __getitem__(self, key: Union[int, slice]) -> str:
+		if isinstance(key, slice):
+			return self._buffer[key].decode("latin-1")
+		return chr(self._buffer[key])
+
+	@property
+	def Buffer(self) -> Union[bytes, bytearray, mmap]:
+		"""Returns the underlying bytes-like object."""
+		return self._buffer
+
+	def find(self, sub: str, start: int = 0) -> int:
+		"""Returns the lowest index of ``sub`` at or after ``start``, or -1."""
+		return self._buffer.find(sub.encode("latin-1"), start)
+
+
 @export
 class TokenizerException(ParserException):
 	"""A :exc:`~pyVHDLParser.Base.ParserException` generated by the :class:`~pyVHDLParser.Token.Parser.Tokenizer`."""
@@ -76,16 +176,74 @@ class Tokenizer:
 		FuseableCharacter =               15  #: Last char was a character that could be fused
 		OtherChars =                      16  #: Any thing else
 
+	class Engine(Enum):
+		"""Enumeration of all tokenizer engines."""
+
+		StateMachine =                    0   #: Walks the input character by character.
+		LexemeScanner =                   1   #: Matches whole lexemes at once, see :meth:`GetVHDLScanner`.
+
 
 	@classmethod
-	def GetVHDLTokenizer(cls, iterable: Iterator[str]):
-		previousToken = StartOfDocumentToken()
+	def MapSourceFile(cls, path: PurePath) -> Union[mmap, bytes]:
+		"""
+		Maps a source file read-only into memory.
+
+		The file handle is closed immediately, the mapping is released when the last reference to it is dropped.
+		Empty files can't be mapped, so an empty ``bytes`` object is returned for them.
+		"""
+		with open(path, "rb") as fileHandle:
+			try:
+				return mmap(fileHandle.fileno(), 0, access=ACCESS_READ)
+			except ValueError:
+				return b""
+
+	@classmethod
+	def GetVHDLTokenizer(cls, iterable: Union[Iterator[str], PurePath, bytes, bytearray, mmap, IO], engine: 'Tokenizer.Engine' = Engine.StateMachine, attachTrivia: bool = False):
+		"""
+		Returns a generator, that reads characters from an iterable and emits a chain of tokens.
+
+		The ``engine`` parameter selects the tokenizer engine. Both engines emit the same token chain.
+
+		If ``attachTrivia`` is set, whitespace, linebreaks and comments are attached to the adjacent significant tokens
+		(see :meth:`AttachTrivia`).
+
+		Besides a string or an iterable of characters, the source can be a path, ``bytes``, a ``bytearray`` or an
+		``mmap``. Such sources are Latin-1 encoded and always processed by the lexeme scanner. A path is mapped into
+		memory (see :meth:`MapSourceFile`), so neither the raw file content nor a decoded copy is materialized.
+
+		A file-like object (anything with a ``read`` method) is read in chunks by :meth:`GetVHDLStreamScanner`.
+		"""
+		if attachTrivia:
+			yield from cls.AttachTrivia(cls.GetVHDLTokenizer(iterable, engine))
+			return
+
+		if isinstance(iterable, PurePath):
+			iterable = cls.MapSourceFile(iterable)
+		elif (hasattr(iterable, "read") and not isinstance(iterable, mmap)):
+			yield from cls.GetVHDLStreamScanner(iterable)
+			return
+
+		if ((engine is cls.Engine.LexemeScanner) or isinstance(iterable, BytesSource)):
+			yield from cls.GetVHDLScanner(iterable if isinstance(iterable, (str, *BytesSource)) else "".join(iterable))
+			return
+
+		# a string's line index is built lazily, for any other iterable linebreaks are recorded while reading
+		if isinstance(iterable, str):
+			lineIndex =     SourceCodeLineIndex(iterable)
+			addLinebreak =  None
+			source =        iterable    #: Comments, string literals and extended identifiers are closed by a bulk search.
+		else:
+			lineIndex =     SourceCodeLineIndex()
+			addLinebreak =  lineIndex.AddLinebreak
+			source =        None
+		characters =    iter(iterable)
+		toLinebreakMatch = _TO_LINEBREAK_PATTERN.match
+
+		previousToken = StartOfDocumentToken(lineIndex)
 		tokenKind =     cls.TokenKind.OtherChars
-		start =         SourceCodePosition(1, 1, 1)
+		start =         1
 		buffer =        ""
 		absolute =      0
-		column =        0
-		row =           1
 
 		__NUMBER_CHARACTERS__ =     "0123456789"
 		__ALPHA_CHARACTERS__ =      "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
@@ -94,23 +252,24 @@ class Tokenizer:
 
 		yield previousToken
 
-		for char in iterable:
+		for char in characters:
 			absolute +=   1
-			column +=     1
+			if ((char == "\n") and (addLinebreak is not None)):
+				addLinebreak(absolute)
 
 			# State: SpaceChars
 			if (tokenKind is cls.TokenKind.SpaceChars):
 				if (char in __WHITESPACE_CHARACTERS__):
 					buffer += char
 				else:
-					end = SourceCodePosition(row, column - 1, absolute - 1)
+					end = absolute - 1
 					if isinstance(previousToken, (LinebreakToken, SingleLineCommentToken, StartOfDocumentToken)):
 						previousToken = IndentationToken(previousToken, buffer, start, end)
 					else:
 						previousToken = SpaceToken(previousToken, buffer, start, end)
 					yield previousToken
 
-					start =   SourceCodePosition(row, column, absolute)
+					start =   absolute
 					buffer =  char
 					if (char in __NUMBER_CHARACTERS__):   tokenKind = cls.TokenKind.IntegerChars
 					elif (char in __ALPHA_CHARACTERS__):  tokenKind = cls.TokenKind.AlphaChars
@@ -142,10 +301,10 @@ class Tokenizer:
 					buffer += char
 					tokenKind = cls.TokenKind.RealChars
 				else:
-					previousToken = IntegerLiteralToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = IntegerLiteralToken(previousToken, buffer, start, absolute - 1)
 					yield previousToken
 
-					start =   SourceCodePosition(row, column, absolute)
+					start =   absolute
 					buffer =  char
 					if (char in __WHITESPACE_CHARACTERS__): tokenKind = cls.TokenKind.SpaceChars
 					elif (char in __ALPHA_CHARACTERS__):    tokenKind = cls.TokenKind.AlphaChars
@@ -173,10 +332,10 @@ class Tokenizer:
 				if ((char in __NUMBER_CHARACTERS__) or (char == "_")):
 					buffer += char
 				else:
-					previousToken = RealLiteralToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = RealLiteralToken(previousToken, buffer, start, absolute - 1)
 					yield previousToken
 
-					start =   SourceCodePosition(row, column, absolute)
+					start =   absolute
 					buffer =  char
 					if (char in __WHITESPACE_CHARACTERS__): tokenKind = cls.TokenKind.SpaceChars
 					elif (char in __ALPHA_CHARACTERS__):    tokenKind = cls.TokenKind.AlphaChars
@@ -204,10 +363,10 @@ class Tokenizer:
 				if ((char in __ALPHA_CHARACTERS__) or (char == "_")):
 					buffer += char
 				else:
-					previousToken = WordToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = WordToken(previousToken, buffer, start, absolute - 1)
 					yield previousToken
 
-					start =   SourceCodePosition(row, column, absolute)
+					start =   absolute
 					buffer =  char
 					if (char in __WHITESPACE_CHARACTERS__): tokenKind = cls.TokenKind.SpaceChars
 					elif (char == "'"):                     tokenKind = cls.TokenKind.PossibleCharacterLiteral
@@ -238,6 +397,7 @@ class Tokenizer:
 					previousToken = CharacterToken(previousToken, "-", start)
 					yield previousToken
 
+					start =         absolute
 					buffer =        char
 					if (char in __WHITESPACE_CHARACTERS__): tokenKind = cls.TokenKind.SpaceChars
 					elif (char in __NUMBER_CHARACTERS__):   tokenKind = cls.TokenKind.IntegerChars
@@ -262,7 +422,7 @@ class Tokenizer:
 
 			# State: PossibleLinebreak
 			elif (tokenKind is cls.TokenKind.PossibleLinebreak):
-				end = SourceCodePosition(row, column, absolute)
+				end = absolute
 				if (char == "\n"):
 					tokenKind = cls.TokenKind.OtherChars
 					if (buffer[:2] == "--"):
@@ -309,7 +469,7 @@ class Tokenizer:
 					previousToken = CharacterToken(previousToken, ".", start)
 					yield previousToken
 
-					start = SourceCodePosition(row, column, absolute)
+					start = absolute
 					buffer = char
 
 					if (char in __WHITESPACE_CHARACTERS__): tokenKind = cls.TokenKind.SpaceChars
@@ -341,44 +501,59 @@ class Tokenizer:
 					if (buffer[1] == "'"):
 						previousToken =   CharacterToken(previousToken, "'", start)
 						yield previousToken
-						previousToken =   CharacterToken(previousToken, "'", SourceCodePosition(row, column, absolute))
+						previousToken =   CharacterToken(previousToken, "'", absolute)
 						yield previousToken
 						tokenKind =       cls.TokenKind.OtherChars
 					else:
 						continue
 				elif ((len(buffer) == 3) and (buffer[2] == "'")):
-					previousToken =   CharacterLiteralToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken =   CharacterLiteralToken(previousToken, buffer, start, absolute)
 					yield previousToken
 					tokenKind = cls.TokenKind.OtherChars
 				else:
 					previousToken =   CharacterToken(previousToken, "'", start)
 					yield previousToken
 
-					start.Column +=   1
-					start.Absolute += 1
+					start +=          1
 					buffer =          buffer[:2]
 					if ((buffer[0] in __ALPHA_CHARACTERS__) and (buffer[1] in __ALPHA_CHARACTERS__)):
 						tokenKind =     cls.TokenKind.AlphaChars
 					elif ((buffer[0] in __WHITESPACE_CHARACTERS__) and (buffer[1] in __WHITESPACE_CHARACTERS__)):
 						tokenKind =     cls.TokenKind.SpaceChars
 					else:
-						raise TokenizerException("Ambiguous syntax detected. buffer: '{buffer}'".format(buffer=buffer), start)
+						raise TokenizerException("Ambiguous syntax detected. buffer: '{buffer}'".format(buffer=buffer), lineIndex.GetPosition(start))
 
 			# State: PossibleStringLiteralStart
 			elif (tokenKind is cls.TokenKind.PossibleStringLiteralStart):
 				buffer += char
 				if (char == "\""):
-					previousToken = StringLiteralToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = StringLiteralToken(previousToken, buffer, start, absolute)
 					yield previousToken
 					tokenKind = cls.TokenKind.OtherChars
+				elif (source is not None):
+					# jump to the closing quote, which is dispatched as next character
+					end = source.find("\"", absolute)
+					if (end < 0):
+						end = len(source)
+					buffer +=   source[absolute:end]
+					next(islice(characters, end - absolute, end - absolute), None)
+					absolute =  end
 
 			# State: PossibleExtendedIdentifierStart
 			elif (tokenKind is cls.TokenKind.PossibleExtendedIdentifierStart):
 				buffer += char
 				if (char == "\\"):
-					previousToken = ExtendedIdentifier(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = ExtendedIdentifier(previousToken, buffer, start, absolute)
 					yield previousToken
 					tokenKind =     cls.TokenKind.OtherChars
+				elif (source is not None):
+					# jump to the closing backslash, which is dispatched as next character
+					end = source.find("\\", absolute)
+					if (end < 0):
+						end = len(source)
+					buffer +=   source[absolute:end]
+					next(islice(characters, end - absolute, end - absolute), None)
+					absolute =  end
 
 			# State: Directive
 			elif (tokenKind is cls.TokenKind.Directive):
@@ -386,7 +561,7 @@ class Tokenizer:
 				if (char == "\r"):
 					tokenKind =     cls.TokenKind.PossibleLinebreak
 				elif (char == "\n"):
-					previousToken = DirectiveToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = DirectiveToken(previousToken, buffer, start, absolute)
 					yield previousToken
 					tokenKind =     cls.TokenKind.OtherChars
 
@@ -396,23 +571,37 @@ class Tokenizer:
 				if (char == "\r"):
 					tokenKind =     cls.TokenKind.PossibleLinebreak
 				elif (char == "\n"):
-					previousToken = SingleLineCommentToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = SingleLineCommentToken(previousToken, buffer, start, absolute)
 					yield previousToken
 					tokenKind =     cls.TokenKind.OtherChars
+				elif (source is not None):
+					# jump to the linebreak, which is dispatched as next character
+					end =       toLinebreakMatch(source, absolute).end()
+					buffer +=   source[absolute:end]
+					next(islice(characters, end - absolute, end - absolute), None)
+					absolute =  end
 
 			# State: MultiLineComment
 			elif (tokenKind is cls.TokenKind.MultiLineComment):
 				buffer += char
 				if (buffer[-2:] == "*/"):
-					previousToken = MultiLineCommentToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+					previousToken = MultiLineCommentToken(previousToken, buffer, start, absolute)
 					yield previousToken
 					tokenKind =     cls.TokenKind.OtherChars
+				elif (source is not None):
+					# jump to the ``*`` of the terminator, the ``/`` is dispatched as next character
+					end = source.find("*/", absolute - 1) + 1
+					if (end == 0):
+						end = len(source)
+					buffer +=   source[absolute:end]
+					next(islice(characters, end - absolute, end - absolute), None)
+					absolute =  end
 
 			# State: FuseableCharacter
 			elif (tokenKind is cls.TokenKind.FuseableCharacter):
 				fused = buffer + char
 				if (fused in ("=>", "**", ":=", "/=", "<=", ">=", "<>", "<<", ">>", "??", "?=", "?<", "?>", "?/=", "?<=", "?>=")):
-					previousToken = FusedCharacterToken(previousToken, fused, start, SourceCodePosition(row, column, absolute))
+					previousToken = FusedCharacterToken(previousToken, fused, start, absolute)
 					yield previousToken
 					tokenKind = cls.TokenKind.OtherChars
 				elif (fused in ("?/", "?<", "?>")):
@@ -424,9 +613,10 @@ class Tokenizer:
 					previousToken = CharacterToken(previousToken, buffer[0], start)
 					yield previousToken
 					if (len(buffer) == 2):
-						previousToken = CharacterToken(previousToken, buffer[1], start)
+						previousToken = CharacterToken(previousToken, buffer[1], start + 1)
 						yield previousToken
 
+					start =  absolute
 					buffer = char
 					if (char in __WHITESPACE_CHARACTERS__):   tokenKind = cls.TokenKind.SpaceChars
 					elif (char in __NUMBER_CHARACTERS__):     tokenKind = cls.TokenKind.IntegerChars
@@ -450,7 +640,7 @@ class Tokenizer:
 
 			# State: OtherChars
 			elif (tokenKind is cls.TokenKind.OtherChars):
-				start =     SourceCodePosition(row, column, absolute)
+				start =     absolute
 				buffer =    char
 				if (char in __WHITESPACE_CHARACTERS__):   tokenKind = cls.TokenKind.SpaceChars
 				elif (char in __NUMBER_CHARACTERS__):     tokenKind = cls.TokenKind.IntegerChars
@@ -476,40 +666,466 @@ class Tokenizer:
 
 			# State: unknown
 			else:
-				raise TokenizerException("Unknown state.", SourceCodePosition(row, column, absolute))
+				raise TokenizerException("Unknown state.", lineIndex.GetPosition(absolute))
 
-			if (char == "\n"):
-				column =  0
-				row +=    1
 		# end for
 
 		if (tokenKind is cls.TokenKind.MultiLineComment):
-			raise TokenizerException("End of document before end of multi line comment.", SourceCodePosition(row, column, absolute))
+			raise TokenizerException("End of document before end of multi line comment.", lineIndex.GetEndPosition(absolute))
 
 		# close open token when input stream is empty
 		if (tokenKind is cls.TokenKind.AlphaChars):
-			previousToken = WordToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+			previousToken = WordToken(previousToken, buffer, start, absolute)
 			yield previousToken
 		elif (tokenKind is cls.TokenKind.IntegerChars):
-			previousToken = IntegerLiteralToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+			previousToken = IntegerLiteralToken(previousToken, buffer, start, absolute)
 			yield previousToken
 		elif (tokenKind is cls.TokenKind.RealChars):
-			previousToken = RealLiteralToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+			previousToken = RealLiteralToken(previousToken, buffer, start, absolute)
 			yield previousToken
 		elif (tokenKind is cls.TokenKind.SpaceChars):
-			end = SourceCodePosition(row, column - 1, absolute - 1)
 			if isinstance(previousToken, (LinebreakToken, SingleLineCommentToken, StartOfDocumentToken)):
-				previousToken = IndentationToken(previousToken, buffer, start, end)
+				previousToken = IndentationToken(previousToken, buffer, start, absolute)
 			else:
-				previousToken = SpaceToken(previousToken, buffer, start, end)
+				previousToken = SpaceToken(previousToken, buffer, start, absolute)
 			yield previousToken
 		elif (tokenKind is cls.TokenKind.SingleLineComment):
-			previousToken = SingleLineCommentToken(previousToken, buffer, start, SourceCodePosition(row, column, absolute))
+			previousToken = SingleLineCommentToken(previousToken, buffer, start, absolute)
 			yield previousToken
 		elif (tokenKind in (cls.TokenKind.OtherChars, cls.TokenKind.DelimiterChars)):
 			pass
 		else:
-			raise TokenizerException("End of document before ...", SourceCodePosition(row, column, absolute))
+			raise TokenizerException("End of document before ...", lineIndex.GetEndPosition(absolute))
+
+		# End of document
+		yield EndOfDocumentToken(previousToken, lineIndex.GetEndPosition(absolute))
+
+	@classmethod
+	def AttachTrivia(cls, tokenStream: Iterable[Token]) -> Iterator[Token]:
+		"""
+		Returns a generator, that emits the significant tokens of a token stream with trivia attached to them.
+
+		Trivia (whitespace, indentation, linebreaks and comments) following a significant token up to and including the
+		end of its line becomes the token's :attr:`~pyVHDLParser.Token.Token.TrailingTrivia`. All other trivia becomes the
+		:attr:`~pyVHDLParser.Token.Token.LeadingTrivia` of the next significant token. The significant tokens are linked
+		to each other, while the trivia tokens keep their links. Thus, no character of the source is lost and
+		:meth:`ExpandTrivia` restores the original token chain.
+
+		The :class:`~pyVHDLParser.Token.StartOfDocumentToken` carries an empty pair of trivia to mark a trivia-attached
+		chain. A significant token is emitted, when the next significant token is read.
+		"""
+		trivia =      TokenCategory.Trivia
+		tokenStream = iter(tokenStream)
+
+		previousToken = next(tokenStream)
+		previousToken._trivia = ((), ())
+		yield previousToken
+
+		leading =     ()
+		trailing =    []
+		pending =     []
+		lineIsOpen =  False   #: True, while the trivia is trailing the previous token.
+		for token in tokenStream:
+			if token.CATEGORY & trivia:
+				if lineIsOpen:
+					trailing.append(token)
+					lineIsOpen = not isinstance(token, (LinebreakToken, SingleLineCommentToken))
+				else:
+					pending.append(token)
+				continue
+
+			if previousToken._trivia is None:
+				previousToken._trivia = (leading, tuple(trailing))
+				yield previousToken
+
+			previousToken.NextToken = token
+			token._previousToken =    previousToken
+			previousToken =           token
+			leading =                 tuple(pending)
+			trailing =                []
+			pending =                 []
+			lineIsOpen =              True
+
+		if previousToken._trivia is None:
+			previousToken._trivia = (leading, tuple(trailing))
+			yield previousToken
+
+	@classmethod
+	def ExpandTrivia(cls, tokenStream: Iterable[Token], previousToken: Token = None) -> Iterator[Token]:
+		"""
+		Returns a generator, that emits the original token chain of a trivia-attached token stream (see :meth:`AttachTrivia`).
+
+		Every token is emitted between its leading and its trailing trivia. The tokens are linked in emission order. If
+		the stream is expanded after some tokens were already read, ``previousToken`` is the last token read.
+		"""
+		lastToken = previousToken
+		for token in tokenStream:
+			for item in token.LeadingTrivia:
+				item._previousToken = lastToken
+				lastToken.NextToken = item
+				yield item
+				lastToken = item
+
+			if lastToken is not None:
+				token._previousToken = lastToken
+				lastToken.NextToken =  token
+			yield token
+			lastToken = token
+
+			for item in token.TrailingTrivia:
+				item._previousToken = lastToken
+				lastToken.NextToken = item
+				yield item
+				lastToken = item
+
+	@classmethod
+	def ReleaseTokens(cls, tokenStream: Iterable[Token]) -> Iterator[Token]:
+		"""
+		Returns a generator, that forwards a token stream and removes the back-links of consumed tokens.
+
+		When the next token is requested, the previously emitted token is unlinked from its predecessor. The token chain
+		isn't a reference cycle anymore, so a token is freed as soon as the consumer drops it and a scan over a large
+		source runs in constant memory. The consumer must not follow :attr:`~pyVHDLParser.Token.Token.PreviousToken`
+		beyond the last token read. A block parser needs the back-links, so a released stream can't be transformed into
+		blocks (see :meth:`~pyVHDLParser.Blocks.TokenToBlockParser.ReleaseBlocks` instead).
+		"""
+		lastToken = None
+		for token in tokenStream:
+			if lastToken is not None:
+				lastToken._previousToken = None
+			yield token
+			lastToken = token
+
+	@classmethod
+	def GetVHDLStreamScanner(cls, fileHandle: IO, chunkSize: int = 65536):
+		"""
+		Returns a generator, that reads a file-like object in chunks of ``chunkSize`` characters and emits a chain of tokens.
+
+		Tokens are emitted while the file is read, so a block parser can consume them before the end of the file is
+		reached. The read buffer holds the current chunk and an unfinished lexeme only. Binary files are decoded as
+		Latin-1, then absolute positions are byte offsets. See :meth:`GetVHDLScanner` for details.
+		"""
+		return cls.GetVHDLScanner("", fileHandle.read, chunkSize)
+
+	@classmethod
+	def GetVHDLScanner(cls, content: Union[str, bytes, bytearray, mmap], read: Callable[[int], AnyStr] = None, chunkSize: int = 65536):
+		"""
+		Returns a generator, that emits the same token chain as the character-based state machine, but matches whole lexemes at once.
+
+		Characters are classified by a lookup table. Runs of whitespace, words, numbers and single-line comments are
+		matched by precompiled patterns. String literals, extended identifiers and multi-line comments are closed by
+		a single search for their terminator. Tokens store absolute positions only, rows and columns are derived on
+		demand from a lazily built line index.
+
+		A bytes-like ``content`` is read as Latin-1 through a :class:`Latin1Buffer`. Patterns are matched on the
+		raw bytes and only the slices becoming token values are decoded.
+
+		If a ``read`` function is given, ``content`` is only the beginning of the source (usually an empty string).
+		Further chunks of at least ``chunkSize`` characters are requested by calling ``read`` until it returns an
+		empty chunk. The scanner keeps only the unfinished lexeme and the new chunk in its buffer. A lexeme reaching
+		the end of the buffer is scanned again after the next chunk was appended. Bytes chunks are decoded as Latin-1.
+		"""
+		characterClasses =  _CHARACTER_CLASSES
+		fusedCharacters =   _FUSED_CHARACTERS
+		if isinstance(content, str):
+			source =            content
+			spaceMatch =        _SPACE_PATTERN.match
+			wordMatch =         _WORD_PATTERN.match
+			digitsMatch =       _DIGITS_PATTERN.match
+			toLinebreakMatch =  _TO_LINEBREAK_PATTERN.match
+		else:
+			source =            content
+			content =           Latin1Buffer(content)
+			spaceMatch =        _SPACE_BYTES_PATTERN.match
+			wordMatch =         _WORD_BYTES_PATTERN.match
+			digitsMatch =       _DIGITS_BYTES_PATTERN.match
+			toLinebreakMatch =  _TO_LINEBREAK_BYTES_PATTERN.match
+
+		length =        len(content)
+		base =          0       #: Number of characters dropped from the front of the buffer.
+		if (read is None):
+			lineIndex =   SourceCodeLineIndex(content)
+			eof =         True
+		else:
+			lineIndex =   SourceCodeLineIndex()
+			lineIndex.AddLinebreaks(content, 0)
+			eof =         False
+		eager =         not eof #: Values of whitespace and comments are sliced lazily from the source buffer, if it's kept.
+		previousToken = StartOfDocumentToken(lineIndex)
+		start =         1       #: Absolute (1-based) start position of the current lexeme.
+		index =         0       #: Index of the next character to dispatch.
+		variant =       _DV_OTHER
+		state =         None    #: Open multi-character state: FuseableCharacter or PossibleLinebreak.
+		openToken =     None    #: Token class of a lexeme reaching the end of document.
+		bufferStart =   0
+		bufferEnd =     0
+		isComment =     False
+
+		yield previousToken
+
+		while True:
+			while index < length:
+				if (state is cls.TokenKind.FuseableCharacter):
+					# the buffer holds 1 or 2 characters (``?/``), index points to the next character
+					fused = content[bufferStart:index + 1]
+					if (fused in fusedCharacters):
+						previousToken = FusedCharacterToken(previousToken, fused, start, base + index + 1)
+						yield previousToken
+						index +=    1
+						variant =   _DV_OTHER
+						state =     None
+					elif (fused == "?/"):
+						index +=    1
+					elif (fused == "/*"):
+						end = content.find("*/", index)
+						if (end < 0):
+							if eof:
+								raise TokenizerException("End of document before end of multi line comment.", lineIndex.GetEndPosition(base + length))
+							break
+
+						end += 1
+						previousToken = MultiLineCommentToken(previousToken, content[bufferStart:end + 1] if eager else None, start, base + end + 1)
+						yield previousToken
+						index =     end + 1
+						variant =   _DV_OTHER
+						state =     None
+					else:
+						previousToken = CharacterToken(previousToken, content[bufferStart], start)
+						yield previousToken
+						if (index - bufferStart == 2):
+							previousToken = CharacterToken(previousToken, content[bufferStart + 1], start + 1)
+							yield previousToken
+						variant =   _DV_FUSEABLE
+						state =     None
+					continue
+
+				elif (state is cls.TokenKind.PossibleLinebreak):
+					# index points to the character after ``\r``
+					end = base + index + 1
+					if (content[index] == "\n"):
+						if isComment:
+							previousToken = SingleLineCommentToken(previousToken, content[bufferStart:index + 1] if eager else None, start, end)
+						else:
+							previousToken = LinebreakToken(previousToken, "\r\n", start, end)
+						yield previousToken
+						index +=    1
+						variant =   _DV_OTHER
+					else:
+						previousToken = LinebreakToken(previousToken, "\r", start, end)
+						yield previousToken
+						start =     end
+						variant =   _DV_CR
+					state = None
+					continue
+
+				char =      content[index]
+				charClass = characterClasses.get(char, _CC_OTHER)
+				if (variant & _DV_REFRESH):
+					start = base + index + 1
+
+				if (charClass == _CC_SPACE):
+					end = spaceMatch(source, index + 1).end()
+					if (end == length):
+						openToken =   SpaceToken
+						bufferStart = index
+						break
+
+					if isinstance(previousToken, (LinebreakToken, SingleLineCommentToken, StartOfDocumentToken)):
+						previousToken = IndentationToken(previousToken, content[index:end] if eager else None, start, base + end)
+					else:
+						previousToken = SpaceToken(previousToken, content[index:end] if eager else None, start, base + end)
+					yield previousToken
+					index =   end
+					variant = _DV_SPACE
+
+				elif (charClass == _CC_ALPHA):
+					end = wordMatch(source, index + 1).end()
+					if (end == length):
+						openToken =   WordToken
+						bufferStart = index
+						break
+
+					previousToken = WordToken(previousToken, content[index:end], start, base + end)
+					yield previousToken
+					index =   end
+					variant = _DV_OTHER
+
+				elif ((charClass == _CC_DIGIT) or ((charClass == _CC_DOT) and (variant & _DV_REAL))):
+					tokenClass = IntegerLiteralToken
+					if (charClass == _CC_DOT):
+						if (index + 1 == length):
+							state = cls.TokenKind.PossibleRealLiteral
+							break
+						elif (characterClasses.get(content[index + 1]) != _CC_DIGIT):
+							previousToken = CharacterToken(previousToken, ".", start)
+							yield previousToken
+							index +=  1
+							variant = _DV_DOT
+							continue
+
+						end = index
+					else:
+						end = digitsMatch(source, index + 1).end()
+
+					if ((end < length) and (content[end] == ".")):
+						tokenClass = RealLiteralToken
+						end =        digitsMatch(source, end + 1).end()
+					if (end == length):
+						openToken =   tokenClass
+						bufferStart = index
+						break
+
+					previousToken = tokenClass(previousToken, content[index:end], start, base + end)
+					yield previousToken
+					index =   end
+					variant = _DV_OTHER
+
+				elif ((charClass == _CC_LF) and (variant & _DV_LINEBREAKS)):
+					previousToken = LinebreakToken(previousToken, char, start, start)
+					yield previousToken
+					index +=    1
+					variant =   _DV_OTHER
+
+				elif (charClass == _CC_DASH):
+					if (index + 1 == length):
+						state = cls.TokenKind.PossibleSingleLineCommentStart
+						break
+					elif (content[index + 1] != "-"):
+						previousToken = CharacterToken(previousToken, "-", start)
+						yield previousToken
+						index +=  1
+						variant = _DV_DASH
+						continue
+
+					end = toLinebreakMatch(source, index + 2).end()
+					if (end == length):
+						openToken =   SingleLineCommentToken
+						bufferStart = index
+						break
+					elif (content[end] == "\n"):
+						previousToken = SingleLineCommentToken(previousToken, content[index:end + 1] if eager else None, start, base + end + 1)
+						yield previousToken
+						index =     end + 1
+						variant =   _DV_OTHER
+					else:
+						bufferStart = index
+						isComment =   True
+						index =       end + 1
+						state =       cls.TokenKind.PossibleLinebreak
+
+				elif ((charClass == _CC_CR) and (variant & _DV_LINEBREAKS)):
+					isComment = False
+					index +=    1
+					state =     cls.TokenKind.PossibleLinebreak
+
+				elif (charClass == _CC_FUSEABLE):
+					bufferStart = index
+					index +=      1
+					state =       cls.TokenKind.FuseableCharacter
+
+				elif ((charClass == _CC_QUOTE) or (charClass == _CC_BACKSLASH)):
+					end = content.find(char, index + 1)
+					if (end < 0):
+						state = cls.TokenKind.PossibleStringLiteralStart
+						break
+
+					tokenClass =    StringLiteralToken if (charClass == _CC_QUOTE) else ExtendedIdentifier
+					previousToken = tokenClass(previousToken, content[index:end + 1], start, base + end + 1)
+					yield previousToken
+					index =   end + 1
+					variant = _DV_OTHER
+
+				elif (charClass == _CC_APOSTROPHE):
+					if (index + 1 == length):
+						state = cls.TokenKind.PossibleCharacterLiteral
+						break
+					elif (content[index + 1] == "'"):
+						previousToken = CharacterToken(previousToken, "'", start)
+						yield previousToken
+						previousToken = CharacterToken(previousToken, "'", base + index + 2)
+						yield previousToken
+						index +=  2
+						variant = _DV_OTHER
+					elif (index + 2 == length):
+						state = cls.TokenKind.PossibleCharacterLiteral
+						break
+					elif (content[index + 2] == "'"):
+						previousToken = CharacterLiteralToken(previousToken, content[index:index + 3], start, base + index + 3)
+						yield previousToken
+						index +=  3
+						variant = _DV_OTHER
+					else:
+						previousToken = CharacterToken(previousToken, "'", start)
+						yield previousToken
+
+						raise TokenizerException("Ambiguous syntax detected. buffer: '{buffer}'".format(buffer=content[index:index + 2]), lineIndex.GetPosition(start + 1))
+
+				elif ((charClass == _CC_BACKTICK) and isinstance(previousToken, (SpaceToken, LinebreakToken))):
+					end = toLinebreakMatch(source, index + 1).end()
+					if (end == length):
+						state = cls.TokenKind.Directive
+						break
+					elif (content[end] == "\n"):
+						previousToken = DirectiveToken(previousToken, content[index:end + 1], start, base + end + 1)
+						yield previousToken
+						index =     end + 1
+						variant =   _DV_OTHER
+					else:
+						isComment = False
+						index =     end + 1
+						state =     cls.TokenKind.PossibleLinebreak
+
+				else:
+					previousToken = CharacterToken(previousToken, char, start)
+					yield previousToken
+					if (variant & _DV_STAYFUSEABLE):
+						bufferStart = index
+						state =       cls.TokenKind.FuseableCharacter
+					else:
+						variant =     _DV_OTHER
+					index +=        1
+			# end while
+
+			if eof:
+				break
+
+			# keep the unfinished lexeme and append the next chunk
+			if ((state is cls.TokenKind.FuseableCharacter) or ((state is cls.TokenKind.PossibleLinebreak) and isComment)):
+				keep = bufferStart
+			else:
+				keep = index
+
+			chunk = read(max(chunkSize, length - keep))
+			if not chunk:
+				eof = True
+			else:
+				if not isinstance(chunk, str):
+					chunk = chunk.decode("latin-1")
+				lineIndex.AddLinebreaks(chunk, base + length)
+
+				content =     content[keep:] + chunk
+				source =      content
+				base +=       keep
+				index -=      keep
+				bufferStart -= keep
+				length =      len(content)
+
+			# a lexeme, that reached the end of the buffer, is scanned again
+			openToken = None
+			if ((state is not cls.TokenKind.FuseableCharacter) and (state is not cls.TokenKind.PossibleLinebreak)):
+				state = None
+
+		if (openToken is SpaceToken):
+			if isinstance(previousToken, (LinebreakToken, SingleLineCommentToken, StartOfDocumentToken)):
+				previousToken = IndentationToken(previousToken, content[bufferStart:], start, base + length)
+			else:
+				previousToken = SpaceToken(previousToken, content[bufferStart:], start, base + length)
+			yield previousToken
+		elif (openToken is not None):
+			previousToken = openToken(previousToken, content[bufferStart:], start, base + length)
+			yield previousToken
+		elif (state is not None):
+			raise TokenizerException("End of document before ...", lineIndex.GetEndPosition(base + length))
 
 		# End of document
-		yield EndOfDocumentToken(previousToken, SourceCodePosition(row, column, absolute))
+		yield EndOfDocumentToken(previousToken, lineIndex.GetEndPosition(base + length))
@@ -26,11 +26,11 @@
 # ==============================================================================
 #
 # load dependencies
-from typing import Iterator
+from typing import Iterator, Tuple, Union
 
 from pydecor.decorators       import export
 
-from pyVHDLParser             import SourceCodePosition, StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
+from pyVHDLParser             import SourceCodePosition, SourceCodeLineIndex, StartOfDocument, EndOfDocument, StartOfSnippet, EndOfSnippet
 from pyVHDLParser.Base        import ParserException
 
 __all__ = []
@@ -172,15 +172,81 @@ class TokenReverseIterator:
 
 
 @export
-class Token:
-	"""Base-class for all token classes."""
+class TokenCategory:
+	"""
+	Bit flags describing the category of a token class.
+
+	Each token class carries the union of its categories in :attr:`Token.CATEGORY`. A flag
+	is set, if and only if the token is an instance of the corresponding base-class, so
+	``token.CATEGORY & TokenCategory.Comment`` is equivalent to ``isinstance(token, CommentToken)``.
+	All flags are plain integers.
+	"""
+
+	Meta =        0x0001   #: :class:`StartOfToken` or :class:`EndOfToken`
+	Character =   0x0002   #: :class:`CharacterToken`
+	Space =       0x0004   #: :class:`SpaceToken`
+	Indentation = 0x0008   #: :class:`IndentationToken`
+	Linebreak =   0x0010   #: :class:`LinebreakToken`
+	Comment =     0x0020   #: :class:`CommentToken`
+	Word =        0x0040   #: :class:`WordToken`
+	Literal =     0x0080   #: :class:`LiteralToken`
+	Specific =    0x0100   #: :class:`~pyVHDLParser.Token.Keywords.SpecificVHDLToken`
+	Keyword =     0x0200   #: :class:`~pyVHDLParser.Token.Keywords.KeywordToken`
+
+	Trivia =      Space | Linebreak | Comment   #: Tokens without meaning for the VHDL grammar.
+
+
+@export
+class MetaToken(type):
+	"""
+	A :term:`meta-class` to construct *Token* classes.
+
+	Modifications done by this meta-class:
+
+	* Add an empty :attr:`__slots__` declaration to all classes not declaring their own
+	  slots, so no token instance carries a ``__dict__``.
+	* Merge the :attr:`Token.CATEGORY` flags of all base-classes into the class' own flags.
+	"""
+
+	def __new__(cls, className, baseClasses, classMembers: dict):
+		classMembers.setdefault("__slots__", ())
+
+		category = classMembers.get("CATEGORY", 0)
+		for baseClass in baseClasses:
+			category |= getattr(baseClass, "CATEGORY", 0)
+		classMembers["CATEGORY"] = category
+
+		return super().__new__(cls, className, baseClasses, classMembers)
 
-	_previousToken:  'Token'              #: Reference to the previous token
-	NextToken:       'Token'             = None #: Reference to the next token
-	Start:           SourceCodePosition   #: Position for the token start
-	End:             SourceCodePosition   #: Position for the token end
 
-	def __init__(self, previousToken: 'Token', start: SourceCodePosition, end :SourceCodePosition = None):
+@export
+class Token(metaclass=MetaToken):
+	"""
+	Base-class for all token classes.
+
+	A token's start and end are stored as absolute (1-based) character positions. The
+	rows and columns of :attr:`Start` and :attr:`End` are derived on demand from the
+	document's :class:`~pyVHDLParser.SourceCodeLineIndex`, which is shared by all
+	tokens of a chain. A token can also be created with explicit :class:`~pyVHDLParser.SourceCodePosition`
+	objects, which are returned as is.
+
+	In a trivia-attached token chain (see :meth:`~pyVHDLParser.Token.Parser.Tokenizer.AttachTrivia`), whitespace,
+	linebreaks and comments are not linked into the chain, but are kept as :attr:`LeadingTrivia` and
+	:attr:`TrailingTrivia` of the adjacent significant token.
+	"""
+
+	__slots__ = ("_previousToken", "NextToken", "_start", "_end", "_lineIndex", "_trivia")
+
+	CATEGORY:        int =                            0   #: Category flags of this token class (see :class:`TokenCategory`).
+
+	_previousToken:  'Token'                          #: Reference to the previous token
+	NextToken:       'Token'                          #: Reference to the next token
+	_start:          Union[int, SourceCodePosition]   #: Absolute position (or explicit position) for the token start
+	_end:            Union[int, SourceCodePosition]   #: Absolute position (or explicit position) for the token end
+	_lineIndex:      SourceCodeLineIndex              #: Line index of the document to derive rows and columns
+	_trivia:         Tuple[Tuple['Token', ...], Tuple['Token', ...]]  #: Attached leading and trailing trivia or None
+
+	def __init__(self, previousToken: 'Token', start: Union[int, SourceCodePosition], end: Union[int, SourceCodePosition] = None):
 		"""
 		Initializes a token object.
 
@@ -188,16 +254,53 @@ class Token:
 
 		* link this token to previous token.
 		* link previous token to this token.
+		* share the previous token's line index.
 		"""
 
 		previousToken.NextToken = self
 		self._previousToken =     previousToken
+		self._lineIndex =         previousToken._lineIndex
 		self.NextToken =          None
-		self.Start =              start
-		self.End =                end
+		self._start =             start
+		self._end =               end
+		self._trivia =            None
 
 	def __len__(self) -> int:
-		return self.End.Absolute - self.Start.Absolute + 1
+		return self.EndAbsolute - self.StartAbsolute + 1
+
+	@property
+	def Start(self) -> SourceCodePosition:
+		"""Position for the token start."""
+		start = self._start
+		if (start.__class__ is int):
+			return self._lineIndex.GetPosition(start)
+		return start
+	@Start.setter
+	def Start(self, value: Union[int, SourceCodePosition]):
+		self._start = value
+
+	@property
+	def End(self) -> SourceCodePosition:
+		"""Position for the token end."""
+		end = self._end
+		if (end.__class__ is int):
+			return self._lineIndex.GetPosition(end)
+		return end
+	@End.setter
+	def End(self, value: Union[int, SourceCodePosition]):
+		self._end = value
+
+	@property
+	def StartAbsolute(self) -> int:
+		"""Absolute (1-based) character position of the token start."""
+		start = self._start
+		return start if (start.__class__ is int) else start.Absolute
+
+	@property
+	def EndAbsolute(self) -> int:
+		"""Absolute (1-based) character position of the token end."""
+		end = self._end
+		return end if (end.__class__ is int) else end.Absolute
 
 	def GetIterator(self, inclusiveStartToken:bool=False, inclusiveStopToken:bool=True, stopToken:'Token'=None) -> Iterator['Token']:
 		return TokenIterator(self, inclusiveStartToken=inclusiveStartToken, inclusiveStopToken=inclusiveStopToken, stopToken=stopToken)
@@ -217,6 +320,18 @@ class Token:
 	def Length(self) -> int:
 		return len(self)
 
+	@property
+	def LeadingTrivia(self) -> Tuple['Token', ...]:
+		"""Trivia tokens attached in front of this token (see :meth:`~pyVHDLParser.Token.Parser.Tokenizer.AttachTrivia`)."""
+		trivia = self._trivia
+		return () if (trivia is None) else trivia[0]
+
+	@property
+	def TrailingTrivia(self) -> Tuple['Token', ...]:
+		"""Trivia tokens attached behind this token up to and including the end of its line."""
+		trivia = self._trivia
+		return () if (trivia is None) else trivia[1]
+
 	def __str__(self) -> str:
 		return "{name} at {pos}".format(
 			name=self.__class__.__qualname__,
@@ -233,15 +348,32 @@ class ValuedToken(Token):
 	Base-class for all *valued* token.
 
 	A ValuedToken contains a :attr:`Value` field for the underlying string from the source code file.
+
+	If a tokenizer passes ``None`` as value, the value is a lazy slice of the document's source buffer (see
+	:attr:`pyVHDLParser.SourceCodeLineIndex.Source`) from :attr:`Start` to :attr:`End`. The slot stays unset
+	until the value is read the first time, so materialized values are read without any indirection.
 	"""
 
+	__slots__ = ("Value",)
+
 	Value: str  #: String value of this token.
 
-	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition=None):
+	def __init__(self, previousToken: Token, value: str, start: Union[int, SourceCodePosition], end: Union[int, SourceCodePosition]=None):
 		"""Initializes a *valued* token object."""
 
 		super().__init__(previousToken, start, end)
-		self.Value = value
+		if (value is not None):
+			self.Value = value
+
+	def __getattr__(self, name: str):
+		# only called for unset slots, thus for a lazy value
+		if (name != "Value"):
+			raise AttributeError("'{0}' object has no attribute '{1}'".format(self.__class__.__name__, name))
+
+		lineIndex = self._lineIndex
+		source =    None if (lineIndex is None) else lineIndex.Source
+		self.Value = value = None if (source is None) else source[self.StartAbsolute - 1:self.EndAbsolute]
+		return value
 
 	def __iter__(self) -> Iterator[str]:
 		return iter(self.Value)
@@ -268,18 +400,40 @@ class ValuedToken(Token):
 			)
 
 
+@export
+def GetSourceText(startToken: Token, endToken: Token) -> str:
+	"""
+	Returns the source code from ``startToken`` to ``endToken`` (inclusive).
+
+	If the document's source buffer is available, the text is a single slice of it. Otherwise, the values of all
+	valued tokens in between are concatenated. Meta blocks and groups, which miss a token, have no text.
+	"""
+	if ((startToken is None) or (endToken is None)):
+		return ""
+
+	lineIndex = startToken._lineIndex
+	source =    None if (lineIndex is None) else lineIndex.Source
+	if ((source is not None) and isinstance(startToken, ValuedToken) and isinstance(endToken, ValuedToken)):
+		return source[startToken.StartAbsolute - 1:endToken.EndAbsolute]
+
+	return "".join(token.Value for token in TokenIterator(startToken, inclusiveStartToken=True, stopToken=endToken) if isinstance(token, ValuedToken))
+
 
 @export
 class StartOfToken(Token):
 	"""Base-class for meta-tokens representing the start of a token stream."""
 
-	def __init__(self):
-		"""Initializes a StartOfToken object."""
+	CATEGORY = TokenCategory.Meta
+
+	def __init__(self, lineIndex: SourceCodeLineIndex = None):
+		"""Initializes a StartOfToken object. All tokens linked to it share its ``lineIndex``."""
 
 		self._previousToken = None
+		self._lineIndex =     lineIndex
 		self.NextToken =      None
-		self.Start =          SourceCodePosition(1, 1, 1)
-		self.End =            None
+		self._start =         SourceCodePosition(1, 1, 1)
+		self._end =           None
+		self._trivia =        None
 
 	def __len__(self) -> int:
 		"""Returns always 0."""
@@ -295,6 +449,8 @@ class StartOfToken(Token):
 class EndOfToken(Token):
 	"""Base-class for meta-tokens representing the end of a token stream."""
 
+	CATEGORY = TokenCategory.Meta
+
 	def __init__(self, previousToken: Token, end: SourceCodePosition):
 		"""Initializes a EndOfToken object."""
 		super().__init__(previousToken, start=end, end=end)
@@ -330,7 +486,9 @@ class EndOfSnippetToken(EndOfToken, EndOfSnippet):
 class CharacterToken(ValuedToken):
 	"""Token representing a single character."""
 
-	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition):
+	CATEGORY = TokenCategory.Character
+
+	def __init__(self, previousToken: Token, value: str, start: Union[int, SourceCodePosition]):
 		"""
 		Initializes a CharacterToken object.
 
@@ -354,10 +512,10 @@ class CharacterToken(ValuedToken):
 class FusedCharacterToken(CharacterToken):
 	"""Token representing a double (or triple) character."""
 
-	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition):
+	def __init__(self, previousToken: Token, value: str, start: Union[int, SourceCodePosition], end: Union[int, SourceCodePosition]):
 		"""Initializes a FusedCharacterToken object."""
 		super().__init__(previousToken, value, start=start)
-		self.End = end
+		self._end = end
 
 	# FIXME: check if base-base class implementation could solve this question.
 	def __len__(self) -> int:
@@ -374,6 +532,9 @@ class FusedCharacterToken(CharacterToken):
 @export
 class SpaceToken(ValuedToken):
 	"""Token representing a space (space or tab)."""
+
+	CATEGORY = TokenCategory.Space
+
 	def __repr__(self) -> str:
 		return "<{name: <50}  {value:.<59} at {pos!r}>".format(
 			name=self.__class__.__name__,
@@ -386,6 +547,8 @@ class SpaceToken(ValuedToken):
 class WordToken(ValuedToken):
 	"""Token representing a string."""
 
+	CATEGORY = TokenCategory.Word
+
 	def __eq__(self, other: str) -> bool:
 		"""Return true if the internal value is equal to the second operand."""
 		return self.Value == other
@@ -421,6 +584,8 @@ class VHDLToken(ValuedToken):
 class CommentToken(VHDLToken):
 	"""Base-class for comment tokens."""
 
+	CATEGORY = TokenCategory.Comment
+
 	def __repr__(self) -> str:
 		value = self.Value
 		value = value.replace("\n", "\\n")
@@ -447,6 +612,8 @@ class MultiLineCommentToken(CommentToken):
 class LiteralToken(VHDLToken):
 	"""Base-class for all literals in VHDL."""
 
+	CATEGORY = TokenCategory.Literal
+
 	def __eq__(self, other: str):  return self.Value == other
 	def __ne__(self, other: str):  return self.Value != other
 	def __hash__(self):
@@ -473,7 +640,7 @@ class RealLiteralToken(LiteralToken):
 class CharacterLiteralToken(LiteralToken):
 	"""Token representing a character literal in VHDL."""
 
-	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition):
+	def __init__(self, previousToken: Token, value: str, start: Union[int, SourceCodePosition], end: Union[int, SourceCodePosition]):
 		"""
 		Initializes a CharacterLiteralToken object.
 
@@ -493,7 +660,7 @@ class CharacterLiteralToken(LiteralToken):
 class StringLiteralToken(LiteralToken):
 	"""Token representing a string literal in VHDL."""
 
-	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition):
+	def __init__(self, previousToken: Token, value: str, start: Union[int, SourceCodePosition], end: Union[int, SourceCodePosition]):
 		"""
 		Initializes a CharacterLiteralToken object.
 
@@ -513,7 +680,7 @@ class StringLiteralToken(LiteralToken):
 class BitStringLiteralToken(LiteralToken):
 	"""Token representing a bit-string literal in VHDL."""
 
-	def __init__(self, previousToken: Token, value: str, start: SourceCodePosition, end: SourceCodePosition):
+	def __init__(self, previousToken: Token, value: str, start: Union[int, SourceCodePosition], end: Union[int, SourceCodePosition]):
 		"""
 		Initializes a BitStringLiteralToken object.
 
@@ -543,6 +710,8 @@ class DirectiveToken(CommentToken):
 class LinebreakToken(VHDLToken):
 	"""Token representing a linebreak in the source code file."""
 
+	CATEGORY = TokenCategory.Linebreak
+
 	def __repr__(self) -> str:
 		return "<{name:-<111} at {pos!r}>".format(
 				name=self.__class__.__name__ + "  ",
@@ -554,6 +723,8 @@ class LinebreakToken(VHDLToken):
 class IndentationToken(SpaceToken):
 	"""Token representing an indentation in a source code line."""
 
+	CATEGORY = TokenCategory.Indentation
+
 	def __repr__(self) -> str:
 		value = self.Value
 		value = value.replace("\t", "\\t")
@@ -0,0 +1,199 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Parallel parsing of many source files
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Parallel parsing of many source files.
+
+A :class:`Workspace` collects source files from paths and glob patterns and parses them in a
+:class:`~concurrent.futures.ProcessPoolExecutor`. Each worker initializes the block classes once. A file's result is
+a :class:`FileResult`, which is picklable: parse results are returned as
+:class:`~pyVHDLParser.Columnar.ColumnarDocument` or as a list of :class:`~pyVHDLParser.FastForward.DesignUnit`
+objects, and exceptions are reduced to their class name and message.
+"""
+from concurrent.futures         import Executor, ProcessPoolExecutor
+from enum                       import Enum, unique
+from glob                       import glob
+from os                         import cpu_count
+from pathlib                    import Path
+from time                       import perf_counter
+from typing                     import Any, Iterable, Iterator, List, Optional, Union
+
+from pydecor.decorators         import export
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, MetaBlock
+from pyVHDLParser.Columnar      import ColumnarDocument
+from pyVHDLParser.Cache         import ParseCache
+from pyVHDLParser.FastForward   import ScanDesignUnits
+
+__all__ = []
+__api__ = __all__
+
+
+@export
+@unique
+class ParseMode(Enum):
+	"""Selects the result computed for each file."""
+
+	Tokens =      0   #: The token chain as a :class:`~pyVHDLParser.Columnar.ColumnarDocument`.
+	Blocks =      1   #: The token and block chains as a :class:`~pyVHDLParser.Columnar.ColumnarDocument`.
+	DesignUnits = 2   #: The design units found by :func:`~pyVHDLParser.FastForward.ScanDesignUnits`.
+
+
+@export
+class FileResult:
+	"""The result of parsing one file. Either :attr:`Result` or :attr:`ErrorClass` is set."""
+
+	__slots__ = ("Path", "Result", "ErrorClass", "ErrorMessage", "Duration")
+
+	Path:          Path            #: Path of the source file.
+	Result:        Any             #: Parse result (see :class:`ParseMode`) or None.
+	ErrorClass:    Optional[str]   #: Qualified class name of the exception raised while parsing or None.
+	ErrorMessage:  Optional[str]   #: Message of the exception raised while parsing or None.
+	Duration:      float           #: Time in seconds spent in the worker.
+
+	def __init__(self, path: Path, result: Any = None, errorClass: str = None, errorMessage: str = None, duration: float = 0.0):
+		self.Path =         path
+		self.Result =       result
+		self.ErrorClass =   errorClass
+		self.ErrorMessage = errorMessage
+		self.Duration =     duration
+
+	@property
+	def Failed(self) -> bool:
+		return self.ErrorClass is not None
+
+	def __repr__(self) -> str:
+		if self.Failed:
+			return "<FileResult {0!s}: {1}: {2}>".format(self.Path, self.ErrorClass, self.ErrorMessage)
+		return "<FileResult {0!s}>".format(self.Path)
+
+
+_workerInitialized = False
+
+
+def InitializeWorker():
+	"""Initializes all block classes of a process. It's called once per worker process and is a no-op afterwards."""
+	global _workerInitialized
+
+	if not _workerInitialized:
+		for block in MetaBlock.BLOCKS:
+			try:
+				block.__cls_init__()
+			except AttributeError:
+				pass
+		_workerInitialized = True
+
+
+@export
+def ParseFile(path: Path, mode: ParseMode = ParseMode.Blocks, cache: ParseCache = None) -> FileResult:
+	"""
+	Parses a single file and returns a picklable :class:`FileResult`. Exceptions are caught and reported.
+
+	In mode :attr:`ParseMode.Blocks`, results are read from and stored into an optional :class:`~pyVHDLParser.Cache.ParseCache`.
+	"""
+	InitializeWorker()
+
+	start = perf_counter()
+	try:
+		if mode is ParseMode.DesignUnits:
+			result = ScanDesignUnits(path)
+		elif (mode is ParseMode.Blocks) and (cache is not None):
+			result = cache.GetBlocks(path)
+		else:
+			tokenStream = Tokenizer.GetVHDLTokenizer(path)
+			if mode is ParseMode.Tokens:
+				result = ColumnarDocument.FromTokens(list(tokenStream)[0])
+			else:
+				result = ColumnarDocument.FromBlocks(TokenToBlockParser.Transform(tokenStream))
+	except Exception as ex:
+		return FileResult(path, None, "{0.__module__}.{0.__qualname__}".format(ex.__class__), str(ex), perf_counter() - start)
+
+	return FileResult(path, result, duration=perf_counter() - start)
+
+
+@export
+class Workspace:
+	"""
+	A set of source files, which are parsed in parallel.
+
+	Files are given as paths or glob patterns (``**`` matches directories recursively). Each file is added once.
+	"""
+
+	_files: List[Path]
+
+	def __init__(self, paths: Iterable[Union[str, Path]] = ()):
+		self._files = []
+		self.AddFiles(paths)
+
+	@property
+	def Files(self) -> List[Path]:
+		return self._files
+
+	def AddFiles(self, paths: Iterable[Union[str, Path]]):
+		"""Adds files by path or glob pattern."""
+		known = set(self._files)
+		for path in paths:
+			pattern = str(path)
+			if any(character in pattern for character in "*?["):
+				files = [Path(file) for file in sorted(glob(pattern, recursive=True))]
+			else:
+				files = [Path(path)]
+
+			for file in files:
+				if file not in known:
+					known.add(file)
+					self._files.append(file)
+
+	def Parse(self, mode: ParseMode = ParseMode.Blocks, workers: int = None, executor: Executor = None, cache: ParseCache = None) -> List[FileResult]:
+		"""
+		Parses all files and returns a list of results in the order of :attr:`Files`.
+
+		Files are distributed to a :class:`~concurrent.futures.ProcessPoolExecutor` with ``workers`` processes (default:
+		number of CPUs). Alternatively, an existing ``executor`` is used. With ``workers=0``, files are parsed in the
+		current process. Workers share an optional ``cache`` directory (see :func:`ParseFile`).
+		"""
+		return list(self.GetResults(mode, workers, executor, cache))
+
+	def GetResults(self, mode: ParseMode = ParseMode.Blocks, workers: int = None, executor: Executor = None, cache: ParseCache = None) -> Iterator[FileResult]:
+		"""Returns a generator, that emits the results of :meth:`Parse` in the order of :attr:`Files` as they arrive."""
+		files = self._files
+		modes =  [mode] * len(files)
+		caches = [cache] * len(files)
+
+		if executor is not None:
+			yield from executor.map(ParseFile, files, modes, caches, chunksize=self._GetChunkSize(workers))
+		elif workers == 0:
+			yield from map(ParseFile, files, modes, caches)
+		else:
+			with ProcessPoolExecutor(max_workers=workers, initializer=InitializeWorker) as pool:
+				yield from pool.map(ParseFile, files, modes, caches, chunksize=self._GetChunkSize(workers))
+
+	def _GetChunkSize(self, workers: Optional[int]) -> int:
+		# a few chunks per worker balance the load while keeping the inter-process overhead low
+		workers = cpu_count() if (workers is None) else workers
+		return max(1, min(64, len(self._files) // (4 * max(1, workers or 1))))
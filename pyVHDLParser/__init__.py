@@ -33,6 +33,9 @@
 # ==============================================================================
 #
 # load dependencies
+from array              import array
+from bisect             import bisect_right
+
 from pydecor.decorators import export
 
 __all__ = []
@@ -61,26 +64,121 @@ class SourceCodePosition:
 		return "(line: {0: >3}, col: {1: >2})".format(self.Row, self.Column)
 
 
+@export
+class SourceCodeLineIndex:
+	"""
+	Maps absolute character positions of a source code file to :class:`SourceCodePosition` objects.
+
+	The index is a sorted array of absolute positions where a row starts. If the
+	source code is passed to the constructor, the index is built lazily when a row
+	or column is requested the first time. Otherwise, a tokenizer records each
+	linebreak via :meth:`AddLinebreak` while reading its input.
+
+	The index is shared by all tokens of a document. If the source code was passed
+	to the constructor, the index also owns it as the document's source buffer, so
+	token values and the text of blocks and groups can be sliced from it.
+	"""
+
+	_source:      str     #: Source code of the document, if it was passed to the constructor.
+	_lineStarts:  array   #: 0-based index of the first character in each row.
+
+	def __init__(self, content: str = None):
+		"""Initializes a SourceCodeLineIndex object."""
+
+		self._source =      content
+		self._lineStarts =  None if (content is not None) else array("L", (0,))
+
+	@property
+	def Source(self) -> str:
+		"""Returns the document's source buffer or ``None``, if the source was read incrementally."""
+		return self._source
+
+	def _BuildIndex(self) -> array:
+		content =     self._source
+		lineStarts =  array("L", (0,))
+		index =       content.find("\n")
+		while (index >= 0):
+			index += 1
+			lineStarts.append(index)
+			index = content.find("\n", index)
+
+		self._lineStarts =  lineStarts
+		return lineStarts
+
+	def AddLinebreak(self, absolute: int):
+		"""Records a linebreak (``\\n``) at 1-based position ``absolute``. The next row starts after it."""
+		self._lineStarts.append(absolute)
+
+	def AddLinebreaks(self, text: str, offset: int):
+		"""Records all linebreaks in ``text``, whose first character follows ``offset`` characters of source code."""
+		lineStarts =  self._lineStarts
+		index =       text.find("\n")
+		while (index >= 0):
+			index += 1
+			lineStarts.append(offset + index)
+			index = text.find("\n", index)
+
+	def Replace(self, offset: int, removed: int, text: str):
+		"""Updates the index, after ``removed`` characters at 0-based ``offset`` were replaced by ``text``. Rows behind the edit are shifted."""
+		lineStarts = self._lineStarts
+		if (lineStarts is None):
+			return
+
+		first =  bisect_right(lineStarts, offset)
+		last =   bisect_right(lineStarts, offset + removed)
+		delta =  len(text) - removed
+		tail =   lineStarts[last:]
+		del lineStarts[first:]
+		self.AddLinebreaks(text, offset)
+		lineStarts.extend(tail if (delta == 0) else array("L", [start + delta for start in tail]))
+
+	def GetPosition(self, absolute: int) -> SourceCodePosition:
+		"""Returns the position of the character at 1-based position ``absolute``."""
+
+		lineStarts = self._lineStarts
+		if (lineStarts is None):
+			lineStarts = self._BuildIndex()
+
+		row = bisect_right(lineStarts, absolute - 1)
+		return SourceCodePosition(row, absolute - lineStarts[row - 1], absolute)
+
+	def GetEndPosition(self, length: int) -> SourceCodePosition:
+		"""Returns the position after the last character of a source code with ``length`` characters."""
+
+		lineStarts = self._lineStarts
+		if (lineStarts is None):
+			lineStarts = self._BuildIndex()
+
+		row = bisect_right(lineStarts, length)
+		return SourceCodePosition(row, length - lineStarts[row - 1], length)
+
+
 @export
 class StartOf:
 	"""Base-class (mixin) for all StartOf*** classes."""
+	__slots__ = ()
 
 @export
 class StartOfDocument(StartOf):
 	"""Base-class (mixin) for all StartOf***Document classes."""
+	__slots__ = ()
 
 @export
 class StartOfSnippet(StartOf):
 	"""Base-class (mixin) for all StartOf***Snippet classes."""
+	__slots__ = ()
 
 @export
 class EndOf:
 	"""Base-class (mixin) for all EndOf*** classes."""
+	__slots__ = ()
 
 @export
 class EndOfDocument(EndOf):
 	"""Base-class (mixin) for all EndOf***Document classes."""
+	__slots__ = ()
 
 @export
 class EndOfSnippet(EndOf):
 	"""Base-class (mixin) for all EndOf***Snippet classes."""
+	__slots__ = ()
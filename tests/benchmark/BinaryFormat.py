@@ -0,0 +1,85 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Binary format benchmark: serialized block streams versus re-parsing
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Compares reading serialized block streams with tokenizing and parsing the source again.
+
+Usage: ``python -m tests.benchmark.BinaryFormat [repetitions]``
+
+The example files in ``vhdl/`` are repeated ``repetitions`` (default: 30) times. For each source, the table lists the
+time to parse it into blocks, the size of the serialized document and the time to read it back as a columnar document
+and as linked block and token objects. The best of three runs is reported.
+"""
+from pathlib                    import Path
+from sys                        import argv
+from time                       import perf_counter
+from typing                     import Callable
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, MetaBlock
+from pyVHDLParser.BinaryFormat  import Dump, Load
+
+
+EXAMPLES = ("Entity", "Function", "GenericList", "Package", "PackageBody", "PortList", "Process")
+
+
+def Measure(function: Callable) -> float:
+	"""Returns the best time in seconds of three calls."""
+	best = None
+	for _ in range(3):
+		start = perf_counter()
+		function()
+		duration = perf_counter() - start
+		best = duration if (best is None) else min(best, duration)
+	return best
+
+
+def Benchmark(repetitions: int):
+	for block in MetaBlock.BLOCKS:
+		try:
+			block.__cls_init__()
+		except AttributeError:
+			pass
+
+	print("{0:<14} {1:>10} {2:>10} {3:>10} {4:>10} {5:>10}".format("source", "characters", "parse", "bytes", "load", "linked"))
+
+	directory = Path(__file__).parent.parent.parent / "vhdl"
+	for name in EXAMPLES:
+		content = (directory / (name + ".vhdl")).read_text() * repetitions
+		data =    Dump(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(content)))
+		print("{0:<14} {1:>10} {2:>8.3f} s {3:>10} {4:>8.3f} s {5:>8.3f} s".format(
+			name,
+			len(content),
+			Measure(lambda: list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(content)))),
+			len(data),
+			Measure(lambda: Load(data)),
+			Measure(lambda: Load(data).ToBlocks())
+		))
+
+
+if __name__ == "__main__":
+	Benchmark(int(argv[1]) if len(argv) > 1 else 30)
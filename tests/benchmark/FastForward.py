@@ -0,0 +1,102 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Fast-forward scanner benchmark: design units vs. block parser and document model
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Compares the design-unit scanner with the block parser and the document model.
+
+Usage: ``python -m tests.benchmark.FastForward [repetitions]``
+
+A library and use clause file, which the document model can parse, and the example files in ``vhdl/``, which pass
+the block parser, are repeated ``repetitions`` (default: 30) times. The best of three runs is reported. The
+tokenizer is measured on its own, as it's the lower bound of all three pipelines.
+"""
+from contextlib                 import redirect_stdout
+from io                         import StringIO
+from pathlib                    import Path
+from sys                        import argv
+from time                       import perf_counter
+from typing                     import Callable
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, MetaBlock
+from pyVHDLParser.DocumentModel import Document
+from pyVHDLParser.FastForward   import ScanDesignUnits
+
+
+EXAMPLES = ("Entity", "Function", "GenericList", "Package", "PackageBody", "PortList", "Process")
+
+
+def Measure(function: Callable) -> float:
+	"""Returns the best time in seconds of three calls."""
+	best = None
+	for _ in range(3):
+		start = perf_counter()
+		function()
+		duration = perf_counter() - start
+		best = duration if (best is None) else min(best, duration)
+	return best
+
+
+def ParseDocument(content: str):
+	# the document model writes progress messages
+	with redirect_stdout(StringIO()):
+		Document("benchmark.vhdl").Parse(content)
+
+
+def Benchmark(repetitions: int):
+	for block in MetaBlock.BLOCKS:
+		try:
+			block.__cls_init__()
+		except AttributeError:
+			pass
+
+	scanner = lambda content: Tokenizer.GetVHDLTokenizer(content, engine=Tokenizer.Engine.LexemeScanner)
+	print("{0:<14} {1:>10} {2:>10} {3:>10} {4:>10}".format("source", "tokens", "scanner", "blocks", "document"))
+
+	content = "library ieee;\nuse ieee.std_logic_1164.all;\n-- comment\n\n" * (100 * repetitions)
+	print("{0:<14} {1:>8.3f} s {2:>8.3f} s {3:>8.3f} s {4:>8.3f} s".format(
+		"Library/Use",
+		Measure(lambda: list(scanner(content))),
+		Measure(lambda: ScanDesignUnits(content)),
+		Measure(lambda: list(TokenToBlockParser.Transform(scanner(content)))),
+		Measure(lambda: ParseDocument(content))
+	))
+
+	directory = Path(__file__).parent.parent.parent / "vhdl"
+	for name in EXAMPLES:
+		content = (directory / (name + ".vhdl")).read_text() * repetitions
+		print("{0:<14} {1:>8.3f} s {2:>8.3f} s {3:>8.3f} s {4:>10}".format(
+			name,
+			Measure(lambda: list(scanner(content))),
+			Measure(lambda: ScanDesignUnits(content)),
+			Measure(lambda: list(TokenToBlockParser.Transform(scanner(content)))),
+			"-"
+		))
+
+
+if __name__ == "__main__":
+	Benchmark(int(argv[1]) if len(argv) > 1 else 30)
@@ -0,0 +1,81 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Tokenizer benchmark: multi-megabyte comments, string tables and identifiers
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Measures the tokenizer on sources dominated by very long lexemes.
+
+Usage: ``python -m tests.benchmark.LongLexemes [megabytes]``
+
+Each generated source contains lexemes of about ``megabytes`` (default: 4) MiB:
+a multi-line comment banner, a single-line comment, a table of string literals
+and an extended identifier. Every source is tokenized by the state machine from
+a string (comments, string literals and extended identifiers are closed by a
+bulk search), by the state machine from an iterable (character by character)
+and by the lexeme scanner.
+"""
+from sys                        import argv
+from time                       import perf_counter
+from typing                     import Callable, Dict
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+
+
+def GenerateSources(megabytes: float) -> Dict[str, str]:
+	"""Returns a dictionary of generated VHDL sources with lexemes of about ``megabytes`` MiB."""
+	size = int(megabytes * 1024 * 1024)
+	line = "-- Copyright (c) the authors of this generated netlist, all rights reserved. --"
+
+	return {
+		"multi-line comment":   "/*\n" + (line + "\n") * (size // (len(line) + 1)) + "*/\nentity e is end entity;\n",
+		"single-line comment":  "-- " + "x" * size + "\nentity e is end entity;\n",
+		"string table":         "constant TABLE : T := (\n" + "".join("  \"{0:0>1021}\",\n".format(i) for i in range(size // 1024)) + ");\n",
+		"extended identifier":  "signal \\" + "i" * size + "\\ : bit;\n"
+	}
+
+
+def Measure(tokenStream: Callable) -> float:
+	"""Returns the time in seconds to consume a token stream."""
+	start = perf_counter()
+	for _ in tokenStream():
+		pass
+	return perf_counter() - start
+
+
+def Benchmark(megabytes: float):
+	print("{0:<22} {1:>10} {2:>14} {3:>14} {4:>14}".format("source", "characters", "state machine", "per character", "lexeme scanner"))
+	for name, source in GenerateSources(megabytes).items():
+		print("{0:<22} {1:>10} {2:>12.3f} s {3:>12.3f} s {4:>12.3f} s".format(
+			name,
+			len(source),
+			Measure(lambda: Tokenizer.GetVHDLTokenizer(source)),
+			Measure(lambda: Tokenizer.GetVHDLTokenizer(iter(source))),
+			Measure(lambda: Tokenizer.GetVHDLScanner(source))
+		))
+
+
+if __name__ == "__main__":
+	Benchmark(float(argv[1]) if len(argv) > 1 else 4.0)
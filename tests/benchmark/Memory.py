@@ -0,0 +1,132 @@
+# ==============================================================================
+# Authors:            Patrick Lehmann
+#
+# Python functions:   A streaming VHDL parser
+#
+# Description:
+# ------------------------------------
+#		Memory benchmark: bytes per token and per block
+#
+# License:
+# ==============================================================================
+# Copyright 2017-2021 Patrick Lehmann - Boetzingen, Germany
+# Copyright 2016-2017 Patrick Lehmann - Dresden, Germany
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+#
+"""
+Reports the memory footprint of token and block chains.
+
+Usage: ``python -m tests.benchmark.Memory [file.vhdl ...]``
+
+Without arguments, the example files in ``vhdl/`` that pass the block parser
+are used. For every object of a chain,
+the instance size and the size of its ``__dict__`` (if any) are summed up. The
+strings referenced by the objects are not counted, as they are shared with the
+source. The overall peak of the pipeline is measured with :mod:`tracemalloc`.
+"""
+from pathlib                    import Path
+from sys                        import argv, getsizeof
+from tracemalloc                import start as tracemallocStart, stop as tracemallocStop, get_traced_memory
+from typing                     import Iterable, Tuple
+
+from pyVHDLParser.Base          import ParserException
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, MetaBlock
+from pyVHDLParser.DocumentModel import Document
+
+
+EXAMPLES = (
+	"AssertStatement", "Context", "Entity", "Function", "GenericList", "Library", "Package", "PackageBody", "PortList", "Process"
+)
+
+
+def ObjectSize(obj) -> int:
+	"""Returns the size of an object including its instance dictionary."""
+	size = getsizeof(obj)
+	try:
+		size += getsizeof(obj.__dict__)
+	except AttributeError:
+		pass
+	return size
+
+
+def MeasureChain(items: Iterable) -> Tuple[int, int]:
+	"""Returns the number of objects and their accumulated size."""
+	count = 0
+	size =  0
+	for item in items:
+		count += 1
+		size +=  ObjectSize(item)
+	return count, size
+
+
+def IterateTokens(firstToken):
+	token = firstToken
+	while token is not None:
+		yield token
+		token = token.NextToken
+
+
+def IterateBlocks(firstBlock):
+	block = firstBlock
+	while block is not None:
+		yield block
+		block = block.NextBlock
+
+
+def Benchmark(files: Iterable[Path]):
+	for block in MetaBlock.BLOCKS:
+		try:
+			block.__cls_init__()
+		except AttributeError:
+			pass
+
+	tokenCount, tokenSize, blockCount, blockSize, peak, characters = 0, 0, 0, 0, 0, 0
+	for file in files:
+		with file.open("r") as fileHandle:
+			content = fileHandle.read()
+
+		tracemallocStart()
+		try:
+			blocks = list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(content)))
+		except ParserException as ex:
+			print("skipped {0}: {1!s}".format(file.name, ex))
+			continue
+		finally:
+			peak += get_traced_memory()[1]
+			tracemallocStop()
+
+		count, size = MeasureChain(IterateTokens(blocks[0].StartToken))
+		tokenCount += count
+		tokenSize +=  size
+		count, size = MeasureChain(IterateBlocks(blocks[0]))
+		blockCount += count
+		blockSize +=  size
+		characters += len(content)
+
+	print("characters: {0:>10}".format(characters))
+	print("tokens:     {0:>10}  {1:>6.1f} bytes/token".format(tokenCount, tokenSize / tokenCount))
+	print("blocks:     {0:>10}  {1:>6.1f} bytes/block".format(blockCount, blockSize / blockCount))
+	print("peak:       {0:>10}  {1:>6.1f} bytes/character (tokenizer + block parser)".format(peak, peak / characters))
+
+
+if __name__ == "__main__":
+	if len(argv) > 1:
+		files = [Path(arg) for arg in argv[1:]]
+	else:
+		directory = Path(__file__).parent.parent.parent / "vhdl"
+		files =     [directory / (name + ".vhdl") for name in EXAMPLES]
+
+	Benchmark(files)
@@ -0,0 +1,127 @@
+from io                         import BytesIO
+from os                         import system
+from pathlib                    import Path
+from random                     import Random
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, Block
+from pyVHDLParser.Columnar      import ColumnarDocument
+from pyVHDLParser.BinaryFormat  import Dump, Load, Write, Read, BinaryFormatException, MAGIC
+
+from tests.unit.Common          import Initializer
+from tests.unit.Columnar        import Describe, DescribeTokens, IterateBlocks
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+COLUMNS = (
+	"Source", "LineStarts", "Strings", "TokenClasses", "TokenKinds", "TokenStarts", "TokenEnds", "TokenValues", "TokenBlocks",
+	"BlockClasses", "BlockKinds", "BlockStartTokens", "BlockEndTokens", "BlockMultiParts"
+)
+
+
+class BinaryFormat(TestCase):
+	code = "library ieee;\nuse ieee.std_logic_1164.all;  -- " + "long comment " * 40 + "\n\n/* multi\nline */ library work;\nentity e is\n  generic (\n    G : character := '\xe4'\n  );\nend entity;\n"
+
+	def setUp(self):
+		self.blocks =   list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code)))
+		self.document = ColumnarDocument.FromBlocks(self.blocks)
+
+	def assertSameColumns(self, expected: ColumnarDocument, actual: ColumnarDocument):
+		for column in COLUMNS:
+			self.assertEqual(getattr(expected, column), getattr(actual, column), msg="Column '{0}' differs.".format(column))
+
+	def test_RoundTrip(self):
+		document = Load(Dump(self.document))
+
+		self.assertSameColumns(self.document, document)
+		self.assertEqual(Describe(self.blocks), Describe(document.GetBlocks()))
+		self.assertEqual(Describe(self.blocks), Describe(IterateBlocks(document.ToBlocks()[0])))
+
+	def test_BlockStream(self):
+		self.assertEqual(Dump(self.document), Dump(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code))))
+
+	def test_WithoutSource(self):
+		data =     Dump(self.document, includeSource=False)
+		document = Load(data)
+
+		self.assertLess(len(data), len(Dump(self.document)))
+		self.assertIsNone(document.Source)
+		self.assertEqual(DescribeTokens(self.document.GetTokens()), DescribeTokens(document.GetTokens()))
+
+	def test_Tokens(self):
+		tokens =   list(Tokenizer.GetVHDLTokenizer(self.code))
+		document = Load(Dump(ColumnarDocument.FromTokens(tokens[0])))
+
+		self.assertEqual(0, document.BlockCount)
+		self.assertEqual(DescribeTokens(tokens), DescribeTokens(document.ToTokens()))
+
+	def test_Files(self):
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "document.vhdb"
+			Write(self.document, file)
+			self.assertSameColumns(self.document, Read(file))
+
+		buffer = BytesIO()
+		Write(self.document, buffer)
+		buffer.seek(0)
+		self.assertSameColumns(self.document, Read(buffer))
+
+	def test_Errors(self):
+		data = Dump(self.document)
+
+		for damaged in (b"", b"XXXX" + data[4:], MAGIC + b"\x63" + data[5:], data[:len(data) // 2], data[:-1]):
+			with self.subTest(size=len(damaged)):
+				with self.assertRaises(BinaryFormatException):
+					Load(damaged)
+
+		unknownClass = data.replace(b"pyVHDLParser.Token:StartOfDocumentToken", b"pyVHDLParser.Token:StartOfDocumentTokeX")
+		with self.assertRaises(BinaryFormatException):
+			Load(unknownClass)
+
+		def Patched(column, value):
+			document = Load(Dump(self.document))
+			setattr(document, column, value)
+			return Dump(document)
+
+		tokenCount = self.document.TokenCount
+		blockCount = self.document.BlockCount
+		for column, value in (
+			("TokenClasses",     [system] + self.document.TokenClasses[1:]),        # a function of another package
+			("TokenClasses",     [Block] + self.document.TokenClasses[1:]),         # not a token class
+			("BlockClasses",     self.document.TokenClasses[:1] + self.document.BlockClasses[1:]),
+			("LineStarts",       [0, -5]),
+			("TokenValues",      [len(self.document.Strings)] * tokenCount),
+			("TokenBlocks",      [blockCount] * tokenCount),
+			("BlockStartTokens", [tokenCount] * blockCount),
+			("BlockEndTokens",   [-2] * blockCount)
+		):
+			with self.subTest(column=column, value=value[:2]):
+				with self.assertRaises(BinaryFormatException):
+					Load(Patched(column, value))
+
+		with self.assertRaises(BinaryFormatException):
+			Load(data.replace(b"ieee", b"\xff\xfe\xff\xfe"))
+
+		random = Random(22)
+		for _ in range(2000):
+			damaged = bytearray(data)
+			for _ in range(random.randint(1, 3)):
+				damaged[random.randrange(len(damaged))] = random.randrange(256)
+
+			try:
+				document = Load(bytes(damaged))
+			except BinaryFormatException:
+				continue
+			for token in document.GetTokens():
+				str(token)
@@ -0,0 +1,133 @@
+from os                         import system, utime
+from pickle                     import dumps
+from pathlib                    import Path
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+from unittest.mock              import patch
+
+import pyVHDLParser.Cache
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser
+from pyVHDLParser.Cache         import ParseCache
+from pyVHDLParser.BinaryFormat  import MAGIC
+from pyVHDLParser.DocumentModel import Document
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+class Cache(TestCase):
+	code = "library ieee;\n-- comment\nuse ieee.numeric_std.all;\n"
+
+	def setUp(self):
+		self._directory = TemporaryDirectory()
+		self.cache =      ParseCache(self._directory.name)
+
+	def tearDown(self):
+		self._directory.cleanup()
+
+	def test_Document(self):
+		document = Document("References.vhdl")
+		document.Parse(self.code, cache=self.cache)
+
+		with patch.object(Tokenizer, "GetVHDLTokenizer", side_effect=AssertionError("Source was parsed again.")):
+			cached = Document("References.vhdl")
+			cached.Parse(self.code, cache=self.cache)
+
+		self.assertEqual(["ieee"], [str(library) for library in cached.Libraries])
+		self.assertEqual(["ieee.numeric_std"], [str(use) for use in cached.Uses])
+
+	def test_File(self):
+		file = Path(self._directory.name) / "References.vhdl"
+		file.write_text(self.code)
+
+		Document(file).Parse(cache=self.cache)
+		self.assertEqual(1, len(list(self.cache.Directory.glob("*.entry"))))
+
+		file.write_text(self.code + "library work;\n")
+		document = Document(file)
+		document.Parse(cache=self.cache)
+		self.assertEqual(["ieee", "work"], [str(library) for library in document.Libraries])
+		self.assertEqual(2, len(list(self.cache.Directory.glob("*.entry"))))
+
+	def test_Blocks(self):
+		expected = [block.Text for block in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code))]
+		self.assertEqual(expected, [block.Text for block in self.cache.GetBlocks(self.code).GetBlocks()])
+
+		with patch.object(Tokenizer, "GetVHDLTokenizer", side_effect=AssertionError("Source was parsed again.")):
+			self.assertEqual(expected, [block.Text for block in self.cache.GetBlocks(self.code).GetBlocks()])
+
+	def test_BinaryEntry(self):
+		self.cache.GetBlocks(self.code)
+		for path in self.cache.Directory.glob("*.entry"):
+			self.assertEqual(MAGIC, path.read_bytes()[:len(MAGIC)])
+			# a pickle isn't loaded from a shared cache directory
+			path.write_bytes(dumps(system))
+
+		self.assertEqual(self.cache.GetBlocks(self.code).BlockCount, ParseCache(self._directory.name + "/new").GetBlocks(self.code).BlockCount)
+
+	def test_ForeignDocumentState(self):
+		Document("References.vhdl").Parse(self.code, cache=self.cache)
+		for path in self.cache.Directory.glob("*.entry"):
+			path.write_bytes(dumps({"_Document__libraries": system}))
+
+		document = Document("References.vhdl")
+		document.Parse(self.code, cache=self.cache)
+		self.assertEqual(["ieee"], [str(library) for library in document.Libraries])
+
+	def test_DamagedEntry(self):
+		self.cache.GetBlocks(self.code)
+		for path in self.cache.Directory.glob("*.entry"):
+			path.write_bytes(b"damaged")
+
+		self.assertEqual(self.cache.GetBlocks(self.code).BlockCount, ParseCache(self._directory.name + "/new").GetBlocks(self.code).BlockCount)
+
+	def test_Keys(self):
+		key = self.cache.GetKey("Blocks", b"library ieee;")
+		self.assertEqual(key, self.cache.GetKey("Blocks", b"library ieee;"))
+		self.assertNotEqual(key, self.cache.GetKey("Blocks", b"library work;"))
+		self.assertNotEqual(key, self.cache.GetKey("Tokens", b"library ieee;"))
+
+		with patch.object(pyVHDLParser.Cache, "_parserVersion", "other"):
+			self.assertNotEqual(key, self.cache.GetKey("Blocks", b"library ieee;"))
+
+	def test_Eviction(self):
+		self.cache.MaxSize = 250
+		for index in range(3):
+			self.cache.Store("entry{0}".format(index), bytes(100))
+			utime(self.cache.Directory / "entry{0}.entry".format(index), (index, index))
+
+		self.assertEqual(["entry1", "entry2"], sorted(path.stem for path in self.cache.Directory.glob("*.entry")))
+
+		self.assertIsNotNone(self.cache.Load("entry1"))
+		self.cache.Store("entry3", bytes(100))
+
+		self.assertEqual(["entry1", "entry3"], sorted(path.stem for path in self.cache.Directory.glob("*.entry")))
+		self.assertIsNone(self.cache.Load("entry2"))
+
+		self.cache.Clear()
+		self.assertEqual(0, self.cache.Size)
+
+	def test_FailedWrite(self):
+		with patch.object(pyVHDLParser.Cache, "replace", side_effect=OSError("disk full")):
+			with self.assertRaises(OSError):
+				self.cache.Store("entry", bytes(100))
+
+		self.assertEqual([], list(self.cache.Directory.iterdir()))
+
+	def test_Overwrite(self):
+		self.cache.Store("entry0", bytes(100))
+		self.cache.Store("entry1", bytes(100))
+		self.cache.Store("entry1", bytes(50))
+
+		self.assertEqual(150, self.cache.Size)
+		self.assertEqual(150, self.cache._size)
@@ -0,0 +1,61 @@
+from unittest                     import TestCase
+
+from pyVHDLParser.Token           import Token, TokenCategory, StartOfToken, EndOfToken, CharacterToken, SpaceToken, IndentationToken
+from pyVHDLParser.Token           import LinebreakToken, CommentToken, WordToken, LiteralToken
+from pyVHDLParser.Token.Keywords  import SpecificVHDLToken, KeywordToken
+from pyVHDLParser.Blocks          import MetaBlock, BlockCategory, StartOfBlock, EndOfBlock, SkipableBlock, FinalBlock, CommentBlock
+from pyVHDLParser.Blocks.Common   import WhitespaceBlock, LinebreakBlock, EmptyLineBlock, IndentationBlock
+from pyVHDLParser.DocumentModel   import Document
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def AllSubclasses(cls):
+	yield cls
+	for subclass in cls.__subclasses__():
+		yield from AllSubclasses(subclass)
+
+
+class Categories(TestCase):
+	def assertCategoriesMatchClasses(self, classes, categories):
+		for cls in classes:
+			for flag, baseClasses in categories.items():
+				with self.subTest(cls=cls.__qualname__, flag=flag):
+					self.assertEqual(issubclass(cls, baseClasses), bool(cls.CATEGORY & flag))
+
+	def test_Tokens(self):
+		self.assertCategoriesMatchClasses(set(AllSubclasses(Token)), {
+			TokenCategory.Meta:         (StartOfToken, EndOfToken),
+			TokenCategory.Character:    CharacterToken,
+			TokenCategory.Space:        SpaceToken,
+			TokenCategory.Indentation:  IndentationToken,
+			TokenCategory.Linebreak:    LinebreakToken,
+			TokenCategory.Comment:      CommentToken,
+			TokenCategory.Word:         WordToken,
+			TokenCategory.Literal:      LiteralToken,
+			TokenCategory.Specific:     SpecificVHDLToken,
+			TokenCategory.Keyword:      KeywordToken,
+			TokenCategory.Trivia:       (SpaceToken, LinebreakToken, CommentToken)
+		})
+
+	def test_Blocks(self):
+		self.assertCategoriesMatchClasses(MetaBlock.BLOCKS, {
+			BlockCategory.Meta:         (StartOfBlock, EndOfBlock),
+			BlockCategory.Skipable:     SkipableBlock,
+			BlockCategory.Final:        FinalBlock,
+			BlockCategory.Comment:      CommentBlock,
+			BlockCategory.Whitespace:   WhitespaceBlock,
+			BlockCategory.Linebreak:    LinebreakBlock,
+			BlockCategory.EmptyLine:    EmptyLineBlock,
+			BlockCategory.Indentation:  IndentationBlock,
+			BlockCategory.Trivia:       (WhitespaceBlock, CommentBlock)
+		})
+
+	def test_PlainIntegers(self):
+		self.assertIs(int, type(TokenCategory.Trivia))
+		self.assertIs(int, type(KeywordToken.CATEGORY))
+		self.assertIs(int, type(EmptyLineBlock.CATEGORY))
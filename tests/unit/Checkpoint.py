@@ -0,0 +1,72 @@
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import ParserState, TokenToBlockParser
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+def Describe(blocks) -> list:
+	return [(block.__class__, block.Text) for block in blocks]
+
+
+class Checkpoint(TestCase):
+	code = "library ieee;\nuse ieee.std_logic_1164.all;\n\nentity e is\n  generic (\n    G : natural := 4  -- width\n  );\n  port (\n    a : in bit\n  );\nend entity;\n\narchitecture a of e is\n  signal s : bit;\nbegin\n  process(a)\n  begin\n    null;\n  end process;\nend architecture;\n"
+
+	def Parse(self, whitespaceMode, checkpointInterval):
+		tokens =  list(Tokenizer.GetVHDLScanner(self.code))
+		classes = [token.__class__ for token in tokens]
+		state =   ParserState(iter(tokens), whitespaceMode, checkpointInterval)
+		blocks =  list(state.GetGenerator())
+		return tokens, classes, state, blocks
+
+	def test_Resume(self):
+		for whitespaceMode in TokenToBlockParser.WhitespaceMode:
+			tokens, classes, state, blocks = self.Parse(whitespaceMode, 1)
+			self.assertEqual(len(blocks), state.BlockCount)
+			self.assertGreater(len(state.Checkpoints), 10)
+
+			for checkpoint in state.Checkpoints:
+				with self.subTest(whitespaceMode=whitespaceMode, checkpoint=checkpoint):
+					# tokens behind the checkpoint are reset to the classes emitted by the tokenizer
+					index = next(i for i, token in enumerate(tokens) if token is checkpoint.Token)
+					for i in range(index, len(tokens)):
+						tokens[i].__class__ = classes[i]
+
+					resumed = ParserState.FromCheckpoint(checkpoint, iter(tokens[index:]), whitespaceMode)
+					self.assertEqual(Describe(blocks[checkpoint.BlockCount:]), Describe(resumed.GetGenerator()))
+					self.assertEqual(len(blocks), resumed.BlockCount)
+
+	def test_Interval(self):
+		_, _, state, blocks = self.Parse(TokenToBlockParser.WhitespaceMode.Emit, 8)
+		counts = [checkpoint.BlockCount for checkpoint in state.Checkpoints]
+
+		self.assertGreater(len(counts), 2)
+		for previous, count in zip([0] + counts, counts):
+			self.assertGreaterEqual(count, previous + 8)
+		for checkpoint in state.Checkpoints:
+			self.assertIs(blocks[checkpoint.BlockCount - 1], checkpoint.LastBlock)
+
+		_, _, state, _ = self.Parse(TokenToBlockParser.WhitespaceMode.Emit, 0)
+		self.assertEqual([], state.Checkpoints)
+
+	def test_Immutable(self):
+		_, _, state, _ = self.Parse(TokenToBlockParser.WhitespaceMode.Emit, 1)
+		checkpoint = state.Checkpoints[5]
+
+		self.assertTrue(checkpoint.Matches(checkpoint))
+		self.assertFalse(checkpoint.Matches(state.Checkpoints[6]))
+		with self.assertRaises(AttributeError):
+			checkpoint.Counter = 1
+		with self.assertRaises(AttributeError):
+			checkpoint.Stack.append(None)
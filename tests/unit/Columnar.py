@@ -0,0 +1,130 @@
+import gc
+import pickle
+from unittest                   import TestCase
+
+from pyVHDLParser.Token         import Token, StartOfDocumentToken, EndOfDocumentToken
+from pyVHDLParser.Token.Keywords import LibraryKeyword
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, StartOfDocumentBlock, EndOfDocumentBlock
+from pyVHDLParser.Blocks.Reference.Library import StartBlock as LibraryStartBlock
+from pyVHDLParser.Groups        import BlockToGroupParser
+from pyVHDLParser.Columnar      import ColumnarDocument
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+def ClassName(item) -> str:
+	"""Returns the full name of an item's class. A view class has the name of its token or block class."""
+	return "{0.__module__}.{0.__qualname__}".format(item.__class__)
+
+
+def DescribeTokens(tokens) -> list:
+	return [(ClassName(token), str(token), str(token.Start), str(token.End)) for token in tokens]
+
+
+def Describe(blocks) -> list:
+	return [(ClassName(block), block.Text, DescribeTokens(block)) for block in blocks]
+
+
+def IterateBlocks(block):
+	while block is not None:
+		yield block
+		block = block.NextBlock
+
+
+class Columnar(TestCase):
+	code = "library ieee;\nuse ieee.std_logic_1164.all;  -- comment\n\n/* multi\nline */ library work;\nentity e is\n  generic (\n    G : character := 'x'\n  );\nend entity;\n"
+
+	def setUp(self):
+		self.blocks =   list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code)))
+		self.document = ColumnarDocument.FromBlocks(self.blocks)
+
+	def test_Views(self):
+		self.assertEqual(Describe(self.blocks), Describe(IterateBlocks(self.document.GetBlock(0))))
+		self.assertEqual(len(self.blocks), self.document.BlockCount)
+
+		self.assertIsInstance(self.document.GetBlock(0), StartOfDocumentBlock)
+		self.assertIsInstance(self.document.GetBlock(self.document.BlockCount - 1), EndOfDocumentBlock)
+		self.assertIsInstance(self.document.GetToken(0), StartOfDocumentToken)
+		self.assertIsInstance(self.document.GetToken(self.document.TokenCount - 1), EndOfDocumentToken)
+
+	def test_Links(self):
+		token = self.document.GetToken(4)
+		self.assertIs(token, token.NextToken.PreviousToken)
+		self.assertIs(token, self.document.GetToken(4))
+		self.assertIsNone(self.document.GetToken(0).PreviousToken)
+		self.assertIsNone(self.document.GetToken(self.document.TokenCount - 1).NextToken)
+
+		block = self.document.GetBlock(3)
+		self.assertIs(block, block.NextBlock.PreviousBlock)
+		self.assertIsNone(self.document.GetBlock(0).PreviousBlock)
+
+		with self.assertRaises(AttributeError):
+			token.NextToken = None
+
+	def test_TokenBlocks(self):
+		library = self.document.GetToken(1)
+		self.assertIsInstance(library, LibraryKeyword)
+		self.assertIsInstance(self.document.GetTokenBlock(1), LibraryStartBlock)
+		self.assertIs(library, self.document.GetTokenBlock(1).StartToken)
+
+	def test_NoReferenceCycles(self):
+		gc.collect()
+		gc.disable()
+		try:
+			blocks = Describe(self.document.GetBlocks())
+			self.assertEqual(0, gc.collect())
+		finally:
+			gc.enable()
+
+		self.assertEqual(Describe(self.blocks), blocks)
+
+	def test_Pickle(self):
+		document = pickle.loads(pickle.dumps(self.document))
+		self.assertEqual(Describe(self.blocks), Describe(document.GetBlocks()))
+
+	def test_ToBlocks(self):
+		blocks = self.document.ToBlocks()
+		self.assertEqual(Describe(self.blocks), Describe(IterateBlocks(blocks[0])))
+		self.assertNotIsInstance(blocks[1].StartToken.NextToken, ColumnarDocument.GetTokenViewClass(Token))
+		self.assertEqual(Describe(self.blocks), Describe(ColumnarDocument.FromBlocks(blocks).GetBlocks()))
+
+	def test_Tokens(self):
+		tokens =   list(Tokenizer.GetVHDLTokenizer(self.code))
+		document = ColumnarDocument.FromTokens(tokens[0])
+		expected = DescribeTokens(tokens)
+
+		self.assertEqual(expected, DescribeTokens(document.GetTokens()))
+		self.assertEqual(expected, DescribeTokens(document.ToTokens()))
+		self.assertIsNone(document.GetTokenBlock(1))
+
+	def test_Groups(self):
+		code =     "library ieee;\nuse ieee.std_logic_1164.all;\n-- comment\n\n"
+		blocks =   list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(code)))
+		document = ColumnarDocument.FromBlocks(blocks)
+
+		expected = [(group.__class__, str(group.StartBlock)) for group in BlockToGroupParser.Transform(iter(blocks))]
+		actual =   [(group.__class__, str(group.StartBlock)) for group in BlockToGroupParser.Transform(document.GetBlocks())]
+		self.assertEqual(expected, actual)
+
+	def test_Join(self):
+		offset =    self.code.index("entity")
+		documents = [
+			ColumnarDocument.FromBlocks(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(part)))
+			for part in (self.code[:offset], self.code[offset:])
+		]
+		document =  ColumnarDocument.Join(self.code, documents, [0, offset])
+
+		self.assertEqual(Describe(self.blocks), Describe(document.GetBlocks()))
+		self.assertEqual(self.document.TokenCount, document.TokenCount)
+		self.assertEqual(list(self.document.TokenBlocks), list(document.TokenBlocks))
@@ -0,0 +1,76 @@
+from io       import StringIO
+from unittest import TestCase
+
+from pyVHDLParser.DocumentModel                       import Document, GROUP_TO_MODEL, LoadModels, RegisterModel
+from pyVHDLParser.DocumentModel.DesignUnit.Entity     import Entity
+from pyVHDLParser.DocumentModel.Reference             import Library, PackageReference
+from pyVHDLParser.Groups.DesignUnit                   import ContextGroup, EntityGroup, ArchitectureGroup, PackageGroup, PackageBodyGroup
+from pyVHDLParser.Groups.Reference                    import LibraryGroup, UseGroup
+from tests.unit.Common import Initializer
+from tests.unit.Tokenizer.Sources import ChunkedReader
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	Initializer()
+
+
+class Registry(TestCase):
+	def test_Registered(self):
+		groupToModel = LoadModels()
+
+		self.assertIs(GROUP_TO_MODEL, groupToModel)
+		self.assertIs(LoadModels(), groupToModel)
+		self.assertIs(Library, groupToModel[LibraryGroup])
+		self.assertIs(PackageReference, groupToModel[UseGroup])
+		self.assertIs(Entity, groupToModel[EntityGroup])
+		for group in (ContextGroup, ArchitectureGroup, PackageGroup, PackageBodyGroup):
+			self.assertIn(group, groupToModel)
+
+	def test_Decorator(self):
+		class Group:
+			pass
+
+		@RegisterModel(Group)
+		class Model:
+			pass
+
+		try:
+			self.assertIs(Model, GROUP_TO_MODEL[Group])
+		finally:
+			del GROUP_TO_MODEL[Group]
+
+	def test_Dispatch(self):
+		document = Document("References.vhdl")
+		document.Parse("library ieee;\n-- comment\nuse ieee.numeric_std.all;\n")
+
+		self.assertEqual(["ieee"], [str(library) for library in document.Libraries])
+		self.assertEqual(["ieee.numeric_std"], [str(use) for use in document.Uses])
+
+
+class Streaming(TestCase):
+	def test_ModelsBeforeEndOfFile(self):
+		code =    "library ieee;\n" * 20000
+		reader =  ChunkedReader(StringIO(code))
+		calls =   []
+
+		class LibraryModel:
+			@classmethod
+			def stateParse(cls, document, group):
+				calls.append((reader.Position, group))
+
+		RegisterModel(LibraryGroup, LibraryModel)
+		try:
+			document = Document("Libraries.vhdl")
+			document.Parse(reader)
+		finally:
+			RegisterModel(LibraryGroup, Library)
+
+		self.assertEqual(20000, len(calls))
+		self.assertLess(calls[0][0], len(code))
+		self.assertTrue(all(isinstance(group, LibraryGroup) for _, group in calls))
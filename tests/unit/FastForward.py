@@ -0,0 +1,223 @@
+from pickle                     import dumps, loads
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.FastForward   import ScanDesignUnits, DesignUnitScanner, DesignUnitKind, ReferenceKind, InstantiationKind, ScannerException
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+def Describe(units) -> list:
+	return [(
+		unit.Kind, unit.Name, unit.EntityName, unit.Row,
+		[(reference.Kind, reference.Name, reference.Row) for reference in unit.References],
+		[(instance.Kind, instance.Label, instance.Name, instance.Architecture, instance.Row) for instance in unit.Instantiations]
+	) for unit in units]
+
+
+class DesignUnits(TestCase):
+	code = """\
+		library ieee, work;
+		use ieee.std_logic_1164.all, ieee.numeric_std.all;
+		context work.ctx;
+
+		entity Top is
+		  generic (
+		    function f return integer is <>;
+		    W : positive := 8
+		  );
+		  port (
+		    Clock : in std_logic;
+		    Data  : out std_logic_vector(W - 1 downto 0)
+		  );
+		  attribute keep : boolean;
+		  attribute keep of Top : entity is true;
+		end entity Top;
+
+		architecture RTL of top is
+		  use work.Types.all;
+
+		  component Counter is
+		    generic (W : positive);
+		    port (Clock : in std_logic);
+		  end component;
+
+		  type Rec is record
+		    a : integer;
+		    b : bit;
+		  end record;
+
+		  type Shared is protected
+		    procedure Inc;
+		  end protected Shared;
+
+		  function Add(a, b : integer) return integer;
+		  function Add(a, b : integer) return integer is
+		    variable s : integer;
+		    function Inner return integer is
+		    begin
+		      return 0;
+		    end;
+		  begin
+		    if a > b then
+		      s := a;
+		    end if;
+		    for i in 0 to 3 loop
+		      s := s + i;
+		    end loop;
+		    return s + b;
+		  end function Add;
+
+		  procedure Nop is new work.Generic_Nop generic map (T => integer);
+
+		  signal s : std_logic;
+		  attribute a of Add : function is 1;
+		begin
+		  cnt0 : Counter generic map (W => 8) port map (Clock => Clock);
+		  cnt1 : component work.Counter port map (Clock);
+		  u0 : entity work.Sub(Behave) port map (Clock => Clock);
+		  u1 : entity work.Sub;
+		  u2 : configuration work.SubCfg port map (Clock => Clock);
+
+		  gen : for i in 0 to 3 generate
+		    u3 : entity work.Leaf port map (Clock => Clock);
+		  end generate;
+
+		  proc : process (Clock)
+		  begin
+		    case s is
+		      when '1' => null;
+		      when others => null;
+		    end case;
+		  end process;
+
+		  s <= Clock;
+		end architecture;
+
+		package Pkg is
+		  package Inner is
+		    constant C : integer := 1;
+		  end package Inner;
+		  function F return integer;
+		end package;
+
+		package body Pkg is
+		  function F return integer is
+		  begin
+		    return 1;
+		  end function;
+		end package body Pkg;
+
+		package IntPkg is new work.GenericPkg generic map (T => integer);
+
+		configuration Cfg of Top is
+		  for RTL
+		    for all : Counter
+		      use entity work.Counter(Fast);
+		    end for;
+		    for cnt1 : Counter
+		      use configuration work.CounterCfg;
+		    end for;
+		  end for;
+		end configuration;
+
+		context Ctx is
+		  library osvvm;
+		  context osvvm.OsvvmContext;
+		end context;
+"""
+
+	expected = [
+		(DesignUnitKind.Entity, "top", None, 5, [
+			(ReferenceKind.Library, "ieee", 1), (ReferenceKind.Library, "work", 1),
+			(ReferenceKind.Use, "ieee.std_logic_1164.all", 2), (ReferenceKind.Use, "ieee.numeric_std.all", 2),
+			(ReferenceKind.Context, "work.ctx", 3)
+		], []),
+		(DesignUnitKind.Architecture, "rtl", "top", 18, [(ReferenceKind.Use, "work.types.all", 19)], [
+			(InstantiationKind.Component, "cnt0", "counter", None, 57),
+			(InstantiationKind.Component, "cnt1", "work.counter", None, 58),
+			(InstantiationKind.Entity, "u0", "work.sub", "behave", 59),
+			(InstantiationKind.Entity, "u1", "work.sub", None, 60),
+			(InstantiationKind.Configuration, "u2", "work.subcfg", None, 61),
+			(InstantiationKind.Entity, "u3", "work.leaf", None, 64)
+		]),
+		(DesignUnitKind.Package, "pkg", None, 78, [], []),
+		(DesignUnitKind.PackageBody, "pkg", None, 85, [], []),
+		(DesignUnitKind.Package, "intpkg", None, 92, [], [(InstantiationKind.Package, None, "work.genericpkg", None, 92)]),
+		(DesignUnitKind.Configuration, "cfg", "top", 94, [], [
+			(InstantiationKind.Entity, None, "work.counter", "fast", 97),
+			(InstantiationKind.Configuration, None, "work.countercfg", None, 100)
+		]),
+		(DesignUnitKind.Context, "ctx", None, 105, [(ReferenceKind.Library, "osvvm", 106), (ReferenceKind.Context, "osvvm.osvvmcontext", 107)], [])
+	]
+
+	def test_Scan(self):
+		self.assertEqual(self.expected, Describe(ScanDesignUnits(self.code)))
+
+	def test_Engines(self):
+		self.assertEqual(self.expected, Describe(ScanDesignUnits(self.code.encode("latin-1"))))
+		self.assertEqual(self.expected, Describe(DesignUnitScanner(Tokenizer.GetVHDLTokenizer(self.code)).GetDesignUnits()))
+
+	def test_Streaming(self):
+		units = DesignUnitScanner(Tokenizer.GetVHDLTokenizer(self.code)).GetDesignUnits()
+		self.assertEqual(DesignUnitKind.Entity, next(units).Kind)
+
+	def test_Pickle(self):
+		self.assertEqual(self.expected, Describe(loads(dumps(ScanDesignUnits(self.code)))))
+
+	def test_UnexpectedEnd(self):
+		with self.assertRaises(ScannerException):
+			ScanDesignUnits("entity e is\n  port (a : bit);\n")
+
+	def test_NoDesignUnit(self):
+		with self.assertRaises(ScannerException):
+			ScanDesignUnits("library ieee;\nsignal s : bit;\n")
+
+	def test_GenerateBodies(self):
+		code = """\
+			architecture a of e is
+			begin
+			  g0 : for i in 0 to 3 generate
+			    signal t : bit;
+			  begin
+			    u0 : entity work.x port map (a => b);
+			  end;
+			  end generate;
+
+			  g1 : if alt1 : c = 1 generate
+			    u1 : entity work.y;
+			  end alt1;
+			  elsif c = 2 generate
+			    s <= a when c = 3 else b;
+			  end;
+			  else generate
+			    u2 : entity work.z;
+			  end generate g1;
+
+			  g2 : case c generate
+			    when 1 => u3 : x port map (a);
+			    end;
+			    when others => u4 : entity work.x;
+			  end generate;
+			end architecture;
+
+			entity f is
+			end entity;
+"""
+		units = ScanDesignUnits(code)
+
+		self.assertEqual([("a", DesignUnitKind.Architecture), ("f", DesignUnitKind.Entity)], [(unit.Name, unit.Kind) for unit in units])
+		self.assertEqual(
+			[("u0", "work.x"), ("u1", "work.y"), ("u2", "work.z"), ("u3", "x"), ("u4", "work.x")],
+			[(instance.Label, instance.Name) for instance in units[0].Instantiations]
+		)
@@ -0,0 +1,39 @@
+from unittest                     import TestCase
+
+from pyVHDLParser.Blocks          import CommentBlock
+from pyVHDLParser.Blocks.Common   import LinebreakBlock, EmptyLineBlock, WhitespaceBlock
+from pyVHDLParser.Blocks.Reference import Library, Use
+from pyVHDLParser.Groups          import BlockDispatchTable, StartOfDocumentGroup
+from pyVHDLParser.Groups.Comment  import CommentGroup, WhitespaceGroup
+from pyVHDLParser.Groups.Reference import LibraryGroup, UseGroup
+
+from tests.unit.Common            import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+class BlockDispatch(TestCase):
+	def test_ExactAndBaseClasses(self):
+		table = BlockDispatchTable({LinebreakBlock: WhitespaceGroup}, {Library.StartBlock: LibraryGroup, LinebreakBlock: CommentGroup})
+
+		self.assertEqual(2, len(table))
+		self.assertIs(WhitespaceGroup, table.Get(LinebreakBlock.__new__(LinebreakBlock)))
+		self.assertIs(WhitespaceGroup, table.Get(EmptyLineBlock.__new__(EmptyLineBlock)))
+		self.assertIs(LibraryGroup, table.Get(Library.StartBlock.__new__(Library.StartBlock)))
+		self.assertIsNone(table.Get(WhitespaceBlock.__new__(WhitespaceBlock)))
+
+	def test_DocumentLevel(self):
+		table = StartOfDocumentGroup.GetBlockDispatch()
+
+		self.assertIs(table, StartOfDocumentGroup.BLOCK_DISPATCH)
+		self.assertIs(UseGroup, table.Get(Use.StartBlock.__new__(Use.StartBlock)))
+		self.assertIs(CommentGroup, table.Get(CommentBlock.__new__(CommentBlock)))
+		self.assertIs(WhitespaceGroup, table.Get(EmptyLineBlock.__new__(EmptyLineBlock)))
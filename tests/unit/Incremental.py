@@ -0,0 +1,195 @@
+from pathlib                    import Path
+from random                     import Random
+from unittest                   import TestCase
+
+from pyVHDLParser.Token         import ValuedToken
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, ParserState
+from pyVHDLParser.Incremental   import IncrementalDocument
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+def DescribeTokens(tokens) -> list:
+	return [(
+		token.__class__,
+		token.StartAbsolute,
+		repr(token.Start),
+		None if token._end is None else token.EndAbsolute,
+		token.Value if isinstance(token, ValuedToken) else None
+	) for token in tokens]
+
+
+def DescribeBlocks(blocks) -> list:
+	return [(
+		block.__class__,
+		block.Text,
+		None if block.StartToken is None else block.StartToken.StartAbsolute,
+		None if block.EndToken is None else block.EndToken.EndAbsolute
+	) for block in blocks]
+
+
+def ParseAll(source: str):
+	"""
+	Returns the described tokens and blocks of a full parse and whether it failed.
+
+	If the block parser fails, the blocks in front of its last checkpoint are returned. The tokens from the checkpoint's
+	token on are described as emitted by the tokenizer.
+	"""
+	try:
+		tokens = list(Tokenizer.GetVHDLScanner(source))
+	except Exception:
+		return None, None, True
+	try:
+		blocks = list(TokenToBlockParser.Transform(iter(tokens)))
+	except Exception:
+		tokens = list(Tokenizer.GetVHDLScanner(source))
+		state =  ParserState(iter(tokens), checkpointInterval=1)
+		blocks = []
+		try:
+			blocks.extend(state.GetGenerator())
+		except Exception:
+			pass
+		if not state.Checkpoints:
+			return DescribeTokens(Tokenizer.GetVHDLScanner(source)), [], True
+
+		checkpoint = state.Checkpoints[-1]
+		index =      next(i for i, token in enumerate(tokens) if token is checkpoint.Token)
+		blocks =     blocks[:blocks.index(checkpoint.LastBlock) + 1]
+		return DescribeTokens(tokens[:index]) + DescribeTokens(list(Tokenizer.GetVHDLScanner(source))[index:]), DescribeBlocks(blocks), True
+	return DescribeTokens(tokens), DescribeBlocks(blocks), False
+
+
+class Incremental(TestCase):
+	code = "library ieee;\nuse ieee.std_logic_1164.all;\n\nentity e is\n  generic (\n    G : natural := 4  -- width\n  );\nend entity;\n\narchitecture a of e is\n  signal s : bit;\nbegin\nend architecture;\n"
+
+	def assertSameAsFullParse(self, document: IncrementalDocument, context: str):
+		tokens, blocks, failed = ParseAll(document.Source)
+		exception = document.TokenException or document.BlockException
+		self.assertEqual(failed, exception is not None, msg=context)
+		if (document.TokenException is None):
+			self.assertEqual(tokens, DescribeTokens(document.Tokens), msg=context)
+			if failed:
+				# the blocks in front of the error are kept
+				self.assertEqual(blocks, DescribeBlocks(document._blocks), msg=context)
+		if not failed:
+			self.assertEqual(blocks, DescribeBlocks(document.Blocks), msg=context)
+
+			block = document.StartBlock
+			while block.NextBlock is not None:
+				self.assertIs(block, block.NextBlock.PreviousBlock, msg=context)
+				block = block.NextBlock
+
+	def test_Edits(self):
+		document = IncrementalDocument(self.code)
+		for search, removed, inserted in (
+			("ieee;", 4, "work"),                   # rename a library
+			("library", 0, "-- header\n"),          # insert a comment in front
+			(": bit", 0, "  "),                     # widen whitespace
+			("  -- width", 0, "\n-- note\n"),       # comment in a generic list
+			("begin", 0, "  signal t : bit;\n"),
+			(None, 0, "\n\n")
+		):
+			offset = len(document.Source) if (search is None) else document.Source.index(search)
+			result = document.Edit(offset, removed, inserted)
+			self.assertIsNone(result.Exception)
+			self.assertSameAsFullParse(document, repr((offset, removed, inserted)))
+
+	def test_Errors(self):
+		document = IncrementalDocument(self.code)
+		result =   document.Edit(len(self.code), 0, "\"unterminated")
+		self.assertIsNotNone(result.Exception)
+		self.assertIsNotNone(document.TokenException)
+		self.assertEqual([], document.Tokens)
+
+		result = document.Edit(len(self.code), len("\"unterminated"), "")
+		self.assertIsNone(result.Exception)
+		self.assertSameAsFullParse(document, "restored")
+
+		with self.assertRaises(ValueError):
+			document.Edit(len(self.code), 1, "")
+
+	def test_Locality(self):
+		code =     "entity e{0} is\n  port (\n    a : in bit;  -- input\n    b : out bit\n  );\nend entity;\n\n"
+		source =   "library ieee;\n" + "".join(code.format(i) for i in range(200))
+		document = IncrementalDocument(source)
+		fullSize = len(document.Tokens)
+
+		offset = source.index("a : in bit", len(source) // 2)
+		result = document.Edit(offset, 1, "x")
+		self.assertIsNone(result.Exception)
+		self.assertLess(len(result.Tokens), 20)
+		self.assertLess(len(result.Blocks), 20)
+		self.assertGreater(fullSize, 100 * len(result.Tokens))
+		self.assertSameAsFullParse(document, "locality")
+
+	def test_LongArchitecture(self):
+		source =   "architecture a of e is\n" + "".join("  signal s{0} : bit;\n".format(i) for i in range(1000)) + "begin\nend architecture;\n"
+		document = IncrementalDocument(source)
+
+		offset = source.index("s500 ") + 1
+		result = document.Edit(offset, 3, "42")
+		self.assertIsNone(result.Exception)
+		self.assertLess(len(result.Blocks), 20)
+		self.assertSameAsFullParse(document, "long architecture")
+
+	def test_EditsAfterError(self):
+		code =     "entity e{0} is\nend entity;\n\narchitecture a of e{0} is\nbegin\nend architecture;\n\n"
+		source =   "".join(code.format(i) for i in range(200))
+		document = IncrementalDocument(source)
+
+		offset = source.index("begin", len(source) // 2)
+		for index, char in enumerate("signal s : bit;\n"):
+			result = document.Edit(offset + index, 0, char)
+			if (char == ";"):
+				# the fixing edit re-parses behind the old error
+				self.assertIsNone(result.Exception)
+			elif (char != "\n"):
+				self.assertIsNotNone(result.Exception)
+				self.assertLess(len(result.Blocks), 20)
+			with self.subTest(char=char):
+				self.assertSameAsFullParse(document, repr(char))
+
+		result = document.Edit(offset, 0, "  ")
+		self.assertIsNone(result.Exception)
+		self.assertLess(len(result.Blocks), 20)
+
+	def test_RandomEdits(self):
+		snippets = (" ", "\n", "\r\n", "x", "e", "is", "end", "entity", ";", "(", ")", "--", "/*", "*/", "\"", "'", "`", "signal s : bit;\n")
+		random =   Random(23)
+		vhdl =     Path(__file__).parent.parent.parent / "vhdl"
+
+		for name in ("Entity", "GenericList", "PortList", "Process", "PackageBody", "Context"):
+			source =   (vhdl / (name + ".vhdl")).read_text()
+			document = IncrementalDocument(source)
+			for step in range(40):
+				offset =   random.randrange(len(document.Source) + 1)
+				removed =  min(random.choice((0, 0, 1, 2, 5)), len(document.Source) - offset)
+				inserted = random.choice(snippets) if random.random() < 0.7 else ""
+				document.Edit(offset, removed, inserted)
+				# a flush must not be needed before the next edit
+				if (step % 3 == 0):
+					with self.subTest(file=name, step=step):
+						self.assertSameAsFullParse(document, "{0}: {1!r}".format(name, (offset, removed, inserted)))
+
+	def test_ResetAfterError(self):
+		source =   self.code.replace("end entity", "END Entity")
+		document = IncrementalDocument(source)
+		result =   document.Edit(source.index("is"), 0, "is")
+		self.assertIsNotNone(result.Exception)
+		self.assertSameAsFullParse(document, "error")
+		self.assertIn("END", [getattr(token, "Value", None) for token in document.Tokens])
+
+		result = document.Edit(source.index("is"), 2, "")
+		self.assertIsNone(result.Exception)
+		self.assertSameAsFullParse(document, "restored")
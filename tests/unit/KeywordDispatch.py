@@ -0,0 +1,38 @@
+from unittest                     import TestCase
+
+from pyVHDLParser.Blocks          import MetaBlock, StartOfDocumentBlock
+from pyVHDLParser.Token.Keywords  import EntityKeyword
+
+from tests.unit.Common            import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+class KeywordDispatch(TestCase):
+	def test_AllBlocks(self):
+		count = 0
+		for block in MetaBlock.BLOCKS:
+			if block.KEYWORDS is None:
+				continue
+
+			with self.subTest(block=block.__qualname__):
+				self.assertEqual(len(block.KEYWORDS), len(block.KEYWORD_DISPATCH))
+				for keywordValue, (keyword, transition) in block.KEYWORD_DISPATCH.items():
+					self.assertEqual(keyword.__KEYWORD__, keywordValue)
+					self.assertIs(block.KEYWORDS[keyword], transition)
+			count += 1
+
+		self.assertGreater(count, 0)
+
+	def test_StartOfDocument(self):
+		keyword, transition = StartOfDocumentBlock.KEYWORD_DISPATCH["entity"]
+		self.assertIs(EntityKeyword, keyword)
+		self.assertIs(StartOfDocumentBlock.KEYWORDS[EntityKeyword], transition)
@@ -0,0 +1,104 @@
+from concurrent.futures         import ThreadPoolExecutor
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser
+from pyVHDLParser.Groups        import BlockToGroupParser
+from pyVHDLParser.Columnar      import ColumnarDocument
+from pyVHDLParser.Parallel      import GetChunkOffsets, ParseBlocks, ParseGroups
+
+from tests.unit.Common          import Initializer
+from tests.unit.Columnar        import Describe, IterateBlocks
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+def DescribeGroups(groups, blocks) -> list:
+	"""Describes groups by their class, blocks and links. Blocks and groups are given by their index."""
+	blockIndices =  {id(block): index for index, block in enumerate(blocks)}
+	groupIndices =  {id(group): index for index, group in enumerate(groups)}
+
+	def GetBlock(block):
+		return None if (block is None) else blockIndices[id(block)]
+
+	def GetGroup(group):
+		return None if (group is None) else groupIndices[id(group)]
+
+	return [(
+		group.__class__,
+		GetBlock(group.StartBlock),
+		GetBlock(group.EndBlock),
+		group.MultiPart,
+		GetGroup(group.PreviousGroup),
+		GetGroup(group.NextGroup),
+		GetGroup(group.InnerGroup),
+		{groupClass: [GetGroup(subGroup) for subGroup in subGroups] for groupClass, subGroups in group._subGroups.items()}
+	) for group in groups]
+
+
+UNIT = "library ieee;\nuse ieee.std_logic_1164.all;\n\n-- unit {0}\nentity e{0} is\n  port (\n    a : in bit\n  );\nend entity;\n\npackage p{0} is\nend package;\n\n"
+
+
+class Parallel(TestCase):
+	code = "".join(UNIT.format(i) for i in range(40))
+
+	def test_ChunkOffsets(self):
+		offsets = GetChunkOffsets(self.code, 500)
+
+		self.assertEqual(0, offsets[0])
+		self.assertGreater(len(offsets), 5)
+		for start, stop in zip(offsets, offsets[1:] + [len(self.code)]):
+			self.assertGreaterEqual(stop - start, 500)
+		for offset in offsets[1:]:
+			self.assertEqual("\n", self.code[offset - 1])
+			self.assertRegex(self.code[offset:offset + 20], "^(library|entity|package) ")
+
+		self.assertEqual([0], GetChunkOffsets(self.code, len(self.code)))
+
+	def test_Blocks(self):
+		expected = Describe(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code)))
+
+		for workers, executor in ((0, None), (None, ThreadPoolExecutor(2))):
+			with self.subTest(workers=workers, executor=executor):
+				document = ParseBlocks(self.code, workers=workers, executor=executor, chunkSize=500)
+				self.assertIsInstance(document, ColumnarDocument)
+				self.assertEqual(expected, Describe(document.GetBlocks()))
+				self.assertEqual(expected, Describe(IterateBlocks(document.ToBlocks()[0])))
+
+	def test_ProcessPool(self):
+		expected = Describe(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code)))
+		self.assertEqual(expected, Describe(ParseBlocks(self.code, workers=2, chunkSize=500).GetBlocks()))
+
+	def test_Groups(self):
+		blocks =   list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code)))
+		expected = DescribeGroups(list(BlockToGroupParser.Transform(iter(blocks))), blocks)
+
+		groups =   ParseGroups(self.code, workers=0, chunkSize=500)
+		self.assertEqual(expected, DescribeGroups(groups, list(IterateBlocks(groups[0].StartBlock))))
+
+	def test_Errors(self):
+		code = self.code.replace("package p30 is", "package p30 iz")
+		with self.assertRaises(Exception) as expected:
+			list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(code)))
+		with self.assertRaises(Exception) as actual:
+			ParseBlocks(code, workers=0, chunkSize=500)
+
+		self.assertIs(expected.exception.__class__, actual.exception.__class__)
+		self.assertEqual(str(expected.exception), str(actual.exception))
+
+	def test_WrongBoundary(self):
+		# a library clause in a comment is found, but the chunk in front of it doesn't end on document level
+		code = self.code + "/* disabled\nlibrary ieee;\n*/\n" + self.code
+		offset =   code.index("library", len(self.code))
+		self.assertEqual([0, offset], GetChunkOffsets(code, offset))
+
+		expected = Describe(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(code)))
+		self.assertEqual(expected, Describe(ParseBlocks(code, workers=0, chunkSize=offset).GetBlocks()))
@@ -0,0 +1,86 @@
+import gc
+from unittest                   import TestCase
+
+from pyVHDLParser.Token         import Token
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, Block
+from pyVHDLParser.Groups        import Group
+from pyVHDLParser.DocumentModel import Document
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+def CountInstances(cls) -> int:
+	return sum(1 for item in gc.get_objects() if isinstance(item, cls))
+
+
+class Release(TestCase):
+	"""Checks that released streams don't build reference cycles, so consumed objects are freed without the cyclic GC."""
+
+	code = "library ieee;\nuse ieee.std_logic_1164.all;\n-- comment\n\n" * 500
+
+	def tearDown(self):
+		gc.enable()
+
+	def test_Tokens(self):
+		expected = [(token.__class__, str(token)) for token in Tokenizer.GetVHDLTokenizer(self.code)]
+		actual =   []
+		alive =    0
+		gc.collect()
+		gc.disable()
+		for token in Tokenizer.ReleaseTokens(Tokenizer.GetVHDLTokenizer(self.code)):
+			actual.append((token.__class__, str(token)))
+			if len(actual) == len(expected) // 2:
+				alive = CountInstances(Token)
+
+		self.assertEqual(expected, actual)
+		self.assertLess(alive, 10)
+
+	def test_Blocks(self):
+		for whitespaceMode in TokenToBlockParser.WhitespaceMode:
+			with self.subTest(whitespaceMode=whitespaceMode):
+				expected = [(block.__class__, block.Text) for block in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code), whitespaceMode)]
+				actual =   []
+				alive =    0
+				gc.collect()
+				gc.disable()
+				for block in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code), whitespaceMode, release=True):
+					actual.append((block.__class__, block.Text))
+					if len(actual) == len(expected) // 2:
+						alive = CountInstances(Block)
+
+				self.assertEqual(expected, actual)
+				self.assertLess(alive, 10)
+
+	def test_Document(self):
+		gc.collect()
+		gc.disable()
+		document = Document("Release.vhdl")
+		document.Parse(self.code, release=True)
+
+		self.assertEqual(500, len(document.Libraries))
+		self.assertEqual(500, len(document.Uses))
+
+		self.assertLess(CountInstances(Token), 10)
+		self.assertLess(CountInstances(Block), 10)
+		self.assertLess(CountInstances(Group), 10)
+
+	def test_DocumentWithoutRelease(self):
+		gc.collect()
+		gc.disable()
+		document = Document("Release.vhdl")
+		document.Parse(self.code)
+
+		self.assertEqual(500, len(document.Libraries))
+		self.assertEqual(500, len(document.Uses))
+		self.assertGreater(CountInstances(Block), 1000)
@@ -0,0 +1,38 @@
+from unittest                   import TestCase
+
+from pyVHDLParser.Token         import Token
+from pyVHDLParser.Token         import Keywords
+from pyVHDLParser.Blocks        import MetaBlock
+from pyVHDLParser.Groups        import Group
+from pyVHDLParser.DocumentModel import Document
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def AllSubclasses(cls):
+	for subclass in cls.__subclasses__():
+		yield subclass
+		yield from AllSubclasses(subclass)
+
+
+class Slots(TestCase):
+	def assertNoInstanceDictionary(self, classes):
+		count = 0
+		for cls in classes:
+			with self.subTest(cls=cls.__qualname__):
+				self.assertEqual(0, cls.__dictoffset__, msg="Instances of {0} have a __dict__.".format(cls.__qualname__))
+			count += 1
+		self.assertGreater(count, 0)
+
+	def test_Tokens(self):
+		self.assertNoInstanceDictionary(AllSubclasses(Token))
+
+	def test_Blocks(self):
+		self.assertNoInstanceDictionary(MetaBlock.BLOCKS)
+
+	def test_Groups(self):
+		self.assertNoInstanceDictionary(AllSubclasses(Group))
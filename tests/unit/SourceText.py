@@ -0,0 +1,67 @@
+from unittest                   import TestCase
+
+from pyVHDLParser.Token         import ValuedToken, SpaceToken, SingleLineCommentToken, GetSourceText
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser
+from pyVHDLParser.Groups        import BlockToGroupParser
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+class LazyValues(TestCase):
+	code = "entity e is  -- comment\nend entity;\n"
+
+	def test_Unmaterialized(self):
+		tokens = list(Tokenizer.GetVHDLScanner(self.code))
+		lazy =   [token for token in tokens if isinstance(token, (SpaceToken, SingleLineCommentToken))]
+
+		self.assertGreater(len(lazy), 0)
+		for token in lazy:
+			with self.assertRaises(AttributeError):
+				ValuedToken.Value.__get__(token)
+
+		self.assertEqual(["  ", "-- comment\n"], [token.Value for token in lazy[2:4]])
+		self.assertEqual("  ", ValuedToken.Value.__get__(lazy[2]))
+
+	def test_Streaming(self):
+		for token in Tokenizer.GetVHDLTokenizer(iter(self.code)):
+			if isinstance(token, SpaceToken):
+				self.assertEqual(" ", ValuedToken.Value.__get__(token))
+				break
+
+
+class Text(TestCase):
+	code = "library ieee;\nuse ieee.numeric_std.all;\n\nentity e is\n  generic (\n    G : natural := 8 -- width\n  );\nend entity;\n"
+
+	def test_Blocks(self):
+		for engine in Tokenizer.Engine:
+			blocks = list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code, engine=engine)))
+
+			self.assertEqual("", blocks[0].Text)
+			self.assertEqual("generic (", blocks[13].Text)
+			for block in blocks:
+				self.assertEqual(block.Text, "".join(token.Value for token in block if isinstance(token, ValuedToken)))
+
+	def test_WithoutSourceBuffer(self):
+		expected = [block.Text for block in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code))]
+		actual =   [block.Text for block in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(iter(self.code)))]
+
+		self.assertEqual(expected, actual)
+
+	def test_Groups(self):
+		code =   "library ieee;\nuse ieee.numeric_std.all;\n"
+		groups = list(BlockToGroupParser.Transform(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(code))))
+		texts =  [group.Text for group in groups]
+
+		self.assertEqual(["", "library ieee;", "\n", "use ieee.numeric_std.all;", "\n", ""], texts)
+		self.assertEqual(code, GetSourceText(groups[1].StartBlock.StartToken, groups[-2].EndBlock.EndToken))
@@ -0,0 +1,56 @@
+from unittest                     import TestCase
+
+from pyVHDLParser.Token           import StartOfDocumentToken, WordToken, CharacterToken, SpaceToken
+from pyVHDLParser.Token           import Keywords
+from pyVHDLParser.Token.Keywords  import EntityKeyword, BoundaryToken, VariableAssignmentKeyword
+from pyVHDLParser.Token.Parser    import TokenizerException
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Specialization(TestCase):
+	def setUp(self):
+		self.start =  StartOfDocumentToken()
+		self.word =   WordToken(self.start, "Entity", 1, 6)
+		self.space =  SpaceToken(self.word, " ", 7, 7)
+		self.fused =  CharacterToken(self.space, ":=", 8)
+
+	def tearDown(self):
+		Keywords.SPECIALIZE_IN_PLACE = True
+
+	def test_InPlace(self):
+		keyword =  EntityKeyword(self.word)
+		boundary = BoundaryToken(self.space)
+		assign =   VariableAssignmentKeyword(self.fused)
+
+		self.assertIs(self.word, keyword)
+		self.assertIs(self.space, boundary)
+		self.assertIs(self.fused, assign)
+		self.assertIsInstance(keyword, EntityKeyword)
+		self.assertEqual("entity", keyword.Value)
+		self.assertEqual(" ", boundary.Value)
+		self.assertEqual(":=", assign.Value)
+		self.assertIs(self.start.NextToken, keyword)
+		self.assertIs(keyword.NextToken, boundary)
+		self.assertEqual((1, 6), (keyword.StartAbsolute, keyword.EndAbsolute))
+
+	def test_Copy(self):
+		Keywords.SPECIALIZE_IN_PLACE = False
+
+		keyword = EntityKeyword(self.word)
+
+		self.assertIsNot(self.word, keyword)
+		self.assertIsInstance(self.word, WordToken)
+		self.assertEqual("Entity", self.word.Value)
+		self.assertEqual("entity", keyword.Value)
+		self.assertIs(self.start.NextToken, keyword)
+		self.assertEqual((1, 6), (keyword.StartAbsolute, keyword.EndAbsolute))
+
+	def test_WrongKeyword(self):
+		with self.assertRaises(TokenizerException):
+			EntityKeyword(self.space)
+		self.assertIsInstance(self.space, SpaceToken)
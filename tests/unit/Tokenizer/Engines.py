@@ -0,0 +1,81 @@
+from importlib                  import import_module
+from pathlib                    import Path
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def TokenizeAll(code: str, engine: Tokenizer.Engine) -> list:
+	"""Returns a list of (class, value, start, end) tuples and a final exception entry."""
+	return CollectTokens(Tokenizer.GetVHDLTokenizer(code, engine=engine))
+
+
+def CollectTokens(tokenStream) -> list:
+	"""Returns a list of (class, value, start, end) tuples and a final exception entry."""
+	tokens = []
+	try:
+		for token in tokenStream:
+			tokens.append(token)
+		exception = None
+	except Exception as ex:
+		exception = (ex.__class__, str(ex))
+
+	# positions are read after the whole stream was consumed
+	return [(
+		token.__class__,
+		getattr(token, "Value", None),
+		None if token.Start is None else (token.Start.Row, token.Start.Column, token.Start.Absolute),
+		None if token.End is None else (token.End.Row, token.End.Column, token.End.Absolute)
+	) for token in tokens] + [exception]
+
+
+class Differential(TestCase):
+	"""Checks that the lexeme scanner emits the same token chain as the character-based state machine."""
+
+	def assertSameTokenStream(self, code: str, context: str):
+		expected = TokenizeAll(code, Tokenizer.Engine.StateMachine)
+		actual =   TokenizeAll(code, Tokenizer.Engine.LexemeScanner)
+		self.assertEqual(expected, actual, msg="Token streams differ for {0}.".format(context))
+
+	def test_TestCaseCode(self):
+		unitTests = Path(__file__).parent.parent
+		modules =   ["tests.unit.Tokenizer.Tokens"] + ["tests.unit.SimpleBlockSequences." + file.stem for file in (unitTests / "SimpleBlockSequences").glob("[A-Z]*.py")]
+
+		count = 0
+		for module in map(import_module, modules):
+			for item in module.__dict__.values():
+				code = getattr(item, "code", None)
+				if isinstance(item, type) and isinstance(code, str):
+					with self.subTest(testcase=item.__qualname__):
+						self.assertSameTokenStream(code, item.__qualname__)
+					count += 1
+
+		self.assertGreater(count, 0)
+
+	def test_VHDLFiles(self):
+		root = Path(__file__).parent.parent.parent.parent
+		for file in list((root / "vhdl").glob("*.vhdl")) + list((root / "tests" / "issue").glob("*/*.vhdl")):
+			with self.subTest(file=file.name):
+				with file.open("r") as fileHandle:
+					self.assertSameTokenStream(fileHandle.read(), file.name)
+
+	def test_Corners(self):
+		for code in (
+			"", " ", "a", "12", "1.5", "1.", " .5", " .x", ".5", "-", "--", "-- c", "-x", "-\n", "=", "?/", "?/=", "?/x",
+			"/*", "/* c", "/*/", "a/* c\n d */b", "\r", "\rx", "\r\r\n", "-- c\r\nx", "-- c\rx", " `d\r\n", " `d\n", " `d",
+			"'", "''", "'a", "'a'", "x'ab", "'\n'x", "\"", "\"abc\"", "\"a\nb\"c", "\\", "\\id\\", "=(a", "=((", "=\n", "=;x",
+			"abc \t\n\tdef", "a<=b;\r\n"
+		):
+			with self.subTest(code=code):
+				self.assertSameTokenStream(code, repr(code))
+
+	def test_SelectByEngine(self):
+		tokenStream = Tokenizer.GetVHDLTokenizer("entity e is", engine=Tokenizer.Engine.LexemeScanner)
+		scannerStream = Tokenizer.GetVHDLScanner("entity e is")
+		self.assertEqual([token.__class__ for token in tokenStream], [token.__class__ for token in scannerStream])
@@ -0,0 +1,75 @@
+from unittest                   import TestCase
+
+from pyVHDLParser               import SourceCodeLineIndex
+from pyVHDLParser.Token         import WordToken, CharacterLiteralToken, StringLiteralToken
+from pyVHDLParser.Token.Parser  import Tokenizer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class LineIndex(TestCase):
+	def test_GetPosition(self):
+		lineIndex = SourceCodeLineIndex("ab\ncd\n\nef")
+
+		for absolute, row, column in ((1, 1, 1), (3, 1, 3), (4, 2, 1), (6, 2, 3), (7, 3, 1), (8, 4, 1), (9, 4, 2)):
+			position = lineIndex.GetPosition(absolute)
+			self.assertEqual((row, column, absolute), (position.Row, position.Column, position.Absolute))
+
+	def test_RecordedLinebreaks(self):
+		lineIndex = SourceCodeLineIndex()
+		lineIndex.AddLinebreak(3)
+
+		position = lineIndex.GetPosition(5)
+		self.assertEqual((2, 2, 5), (position.Row, position.Column, position.Absolute))
+
+	def test_GetEndPosition(self):
+		position = SourceCodeLineIndex("ab\n").GetEndPosition(3)
+		self.assertEqual((2, 0, 3), (position.Row, position.Column, position.Absolute))
+
+
+class TokenPositions(TestCase):
+	code = "entity\n  e is\r\nend;"
+
+	def check_Positions(self, tokenStream):
+		words = {token.Value: token for token in tokenStream if isinstance(token, WordToken)}
+
+		self.assertIsInstance(words["e"]._start, int, msg="Token doesn't store an absolute position.")
+		self.assertEqual((2, 3, 10), (words["e"].Start.Row, words["e"].Start.Column, words["e"].Start.Absolute))
+		self.assertEqual((3, 1, 16), (words["end"].Start.Row, words["end"].Start.Column, words["end"].Start.Absolute))
+		self.assertEqual(3, len(words["end"]))
+
+	def test_StateMachine(self):
+		self.check_Positions(Tokenizer.GetVHDLTokenizer(self.code))
+
+	def test_StateMachineWithIterable(self):
+		self.check_Positions(Tokenizer.GetVHDLTokenizer(iter(self.code)))
+
+	def test_LexemeScanner(self):
+		self.check_Positions(Tokenizer.GetVHDLScanner(self.code))
+
+
+class ExactPositions(TestCase):
+	"""Checks that start and end of each token enclose its lexeme exactly."""
+
+	code = "a:=-8;b<=c'x';\n\tx:\n?/y \"s\" 12 1.5 /* c */ -- d\r\n\\e\\ e  "
+
+	def check_Positions(self, engine: Tokenizer.Engine):
+		for token in Tokenizer.GetVHDLTokenizer(self.code, engine=engine):
+			value = getattr(token, "Value", None)
+			if value is None:
+				continue
+
+			lexeme = self.code[token.StartAbsolute - 1:token.EndAbsolute]
+			if isinstance(token, (CharacterLiteralToken, StringLiteralToken)):
+				lexeme = lexeme[1:-1]
+			self.assertEqual(lexeme, value, msg="Position of {0!r} doesn't match its value.".format(token))
+
+	def test_StateMachine(self):
+		self.check_Positions(Tokenizer.Engine.StateMachine)
+
+	def test_LexemeScanner(self):
+		self.check_Positions(Tokenizer.Engine.LexemeScanner)
@@ -0,0 +1,118 @@
+from io                         import BytesIO, StringIO
+from mmap                       import mmap, ACCESS_READ
+from pathlib                    import Path
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer, Latin1Buffer
+from pyVHDLParser.Blocks        import TokenToBlockParser
+
+from tests.unit.Common          import Initializer
+from tests.unit.Tokenizer.Engines import TokenizeAll, CollectTokens
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+class BytesSources(TestCase):
+	"""Checks that paths, bytes and memory maps are tokenized like the decoded string."""
+
+	code = "library ieee;\r\nuse ieee.std_logic_1164.all; -- \xe4\n\nentity e is\n  /* \xb5 */ constant c : string := \"\xe9\" & 'x' & \\ext\\;\nend entity;  "
+
+	def assertSameAsString(self, source, context: str):
+		expected = TokenizeAll(self.code, Tokenizer.Engine.LexemeScanner)
+		self.assertEqual(expected, TokenizeAll(source, Tokenizer.Engine.StateMachine), msg="Token streams differ for {0}.".format(context))
+		self.assertEqual(expected, TokenizeAll(source, Tokenizer.Engine.LexemeScanner), msg="Token streams differ for {0}.".format(context))
+
+	def test_Bytes(self):
+		self.assertSameAsString(self.code.encode("latin-1"), "bytes")
+		self.assertSameAsString(bytearray(self.code.encode("latin-1")), "bytearray")
+
+	def test_PathAndMemoryMap(self):
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "test.vhdl"
+			file.write_bytes(self.code.encode("latin-1"))
+
+			self.assertSameAsString(file, "path")
+			with file.open("rb") as fileHandle:
+				self.assertSameAsString(mmap(fileHandle.fileno(), 0, access=ACCESS_READ), "mmap")
+
+	def test_EmptyFile(self):
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "empty.vhdl"
+			file.write_bytes(b"")
+
+			self.assertEqual(TokenizeAll("", Tokenizer.Engine.LexemeScanner), TokenizeAll(file, Tokenizer.Engine.LexemeScanner))
+
+	def test_ValuesAreStrings(self):
+		for token in Tokenizer.GetVHDLTokenizer(self.code.encode("latin-1")):
+			value = getattr(token, "Value", None)
+			if value is not None:
+				self.assertIs(type(value), str)
+
+
+class ChunkedReader:
+	"""A file-like object counting the characters handed out."""
+
+	def __init__(self, fileHandle):
+		self._fileHandle =  fileHandle
+		self.Position =     0
+
+	def read(self, size: int):
+		chunk = self._fileHandle.read(size)
+		self.Position += len(chunk)
+		return chunk
+
+
+class Streaming(TestCase):
+	"""Checks that chunked reading emits the same token chain for any chunk size."""
+
+	codes = (
+		BytesSources.code, "", " ", "a", "12", "1.5", "1.", " .5", "-- c", "-- c\r\nx", "?/=", "?/x", "/* c", "a/* c\n d */b",
+		"\r\r\n", " `d\r\n", "'a'", "x'ab", "\"a\nb\"c", "\\id\\", "a<=b;\r\n", "abc \t\n\tdef  "
+	)
+
+	def test_ChunkSizes(self):
+		for code in self.codes:
+			expected = TokenizeAll(code, Tokenizer.Engine.LexemeScanner)
+			for chunkSize in (1, 2, 3, 7, 64):
+				with self.subTest(code=code, chunkSize=chunkSize):
+					self.assertEqual(expected, CollectTokens(Tokenizer.GetVHDLStreamScanner(StringIO(code, newline=""), chunkSize)))
+					self.assertEqual(expected, CollectTokens(Tokenizer.GetVHDLStreamScanner(BytesIO(code.encode("latin-1")), chunkSize)))
+
+	def test_FileObject(self):
+		with TemporaryDirectory() as directory:
+			file = Path(directory) / "test.vhdl"
+			file.write_bytes(BytesSources.code.encode("latin-1"))
+
+			with file.open("rb") as fileHandle:
+				self.assertEqual(TokenizeAll(BytesSources.code, Tokenizer.Engine.LexemeScanner), TokenizeAll(fileHandle, Tokenizer.Engine.StateMachine))
+
+	def test_BlocksBeforeEndOfFile(self):
+		code =    "library ieee;\n" * 1000
+		reader =  ChunkedReader(StringIO(code))
+
+		blockStream = TokenToBlockParser.Transform(Tokenizer.GetVHDLStreamScanner(reader, 256))
+		for _ in range(10):
+			next(blockStream)
+
+		self.assertLess(reader.Position, len(code))
+
+
+class Buffer(TestCase):
+	def test_Latin1Buffer(self):
+		buffer = Latin1Buffer(b"a\xe4-\n")
+
+		self.assertEqual(4, len(buffer))
+		self.assertEqual("\xe4", buffer[1])
+		self.assertEqual("a\xe4", buffer[0:2])
+		self.assertEqual("\xe4-\n", buffer[1:])
+		self.assertEqual(3, buffer.find("\n"))
+		self.assertEqual(-1, buffer.find("a", 1))
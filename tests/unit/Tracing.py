@@ -0,0 +1,51 @@
+from unittest                     import TestCase
+
+from pyVHDLParser                 import Debug
+from pyVHDLParser.Debug           import TraceEvent, EnableTracing, DisableTracing
+from pyVHDLParser.Token.Parser    import Tokenizer
+from pyVHDLParser.Blocks          import TokenToBlockParser
+
+from tests.unit.Common            import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+class Tracing(TestCase):
+	code = "entity e is\nend entity;\n"
+
+	def tearDown(self):
+		DisableTracing()
+
+	def test_Disabled(self):
+		self.assertFalse(Debug.TRACING)
+
+		events = []
+		EnableTracing(lambda event, parserState, *args: events.append(event))
+		DisableTracing()
+
+		for _ in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code)):
+			pass
+
+		self.assertEqual([], events)
+
+	def test_Enabled(self):
+		events = []
+		EnableTracing(lambda event, parserState, *args: events.append((event, args)))
+		self.assertTrue(Debug.TRACING)
+
+		for _ in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code)):
+			pass
+
+		kinds = {event for event, _ in events}
+		self.assertIn(TraceEvent.PushState, kinds)
+		self.assertIn(TraceEvent.PopState, kinds)
+		self.assertIn(TraceEvent.NewTokenMarker, kinds)
+		self.assertTrue(all(len(args) == 1 for event, args in events if event is TraceEvent.PushState))
@@ -0,0 +1,59 @@
+from unittest                   import TestCase
+
+from pyVHDLParser.Token         import StartOfDocumentToken, EndOfDocumentToken, TokenCategory, WordToken
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser
+
+from tests.unit.Common          import Initializer
+from tests.unit.Tokenizer.Engines import TokenizeAll, CollectTokens
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+class AttachedTrivia(TestCase):
+	code = "-- header\nlibrary ieee;  -- trailing\n\n  /* leading */ use ieee.std_logic_1164.all;\r\n\tentity e is\nend entity;  "
+
+	def test_SignificantTokensOnly(self):
+		for engine in Tokenizer.Engine:
+			with self.subTest(engine=engine):
+				tokens = list(Tokenizer.GetVHDLTokenizer(self.code, engine, attachTrivia=True))
+
+				self.assertIsInstance(tokens[0], StartOfDocumentToken)
+				self.assertIsInstance(tokens[-1], EndOfDocumentToken)
+				self.assertLess(len(tokens), 0.6 * len(TokenizeAll(self.code, engine)))
+				for token in tokens:
+					self.assertFalse(token.CATEGORY & TokenCategory.Trivia)
+
+				for previousToken, token in zip(tokens, tokens[1:]):
+					self.assertIs(token, previousToken.NextToken)
+					self.assertIs(previousToken, token.PreviousToken)
+
+	def test_LeadingAndTrailing(self):
+		tokens = {token.Value: token for token in Tokenizer.GetVHDLTokenizer(self.code, attachTrivia=True) if isinstance(token, WordToken)}
+
+		self.assertEqual(["-- header\n"], [token.Value for token in tokens["library"].LeadingTrivia])
+		self.assertEqual([" "], [token.Value for token in tokens["library"].TrailingTrivia])
+		semicolon = tokens["library"].NextToken.NextToken
+		self.assertEqual(";", semicolon.Value)
+		self.assertEqual(["  ", "-- trailing\n"], [token.Value for token in semicolon.TrailingTrivia])
+		self.assertEqual(["\n", "  ", "/* leading */", " "], [token.Value for token in tokens["use"].LeadingTrivia])
+
+	def test_Lossless(self):
+		for engine in Tokenizer.Engine:
+			with self.subTest(engine=engine):
+				expected = TokenizeAll(self.code, engine)
+				self.assertEqual(expected, CollectTokens(Tokenizer.ExpandTrivia(Tokenizer.GetVHDLTokenizer(self.code, engine, attachTrivia=True))))
+
+	def test_Blocks(self):
+		expected = [(block.__class__, block.Text) for block in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code))]
+		actual =   [(block.__class__, block.Text) for block in TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.code, attachTrivia=True))]
+
+		self.assertEqual(expected, actual)
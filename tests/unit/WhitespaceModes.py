@@ -0,0 +1,68 @@
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser, BlockCategory
+from pyVHDLParser.Blocks.Common import LinebreakBlock, EmptyLineBlock
+from pyVHDLParser.Groups        import BlockToGroupParser
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+WhitespaceMode = TokenToBlockParser.WhitespaceMode
+
+
+def Transform(code: str, whitespaceMode: WhitespaceMode) -> list:
+	return list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(code), whitespaceMode))
+
+
+def Significant(blocks: list) -> list:
+	return [(block.__class__, block.Text) for block in blocks if not (block.CATEGORY & BlockCategory.Whitespace)]
+
+
+class WhitespaceModes(TestCase):
+	code = "library ieee;  \n\n\n  use ieee.numeric_std.all;\n  -- comment\n\t\nlibrary   work ;\n"
+
+	def assertLinked(self, blocks: list):
+		for previousBlock, block in zip(blocks, blocks[1:]):
+			self.assertIs(block, previousBlock.NextBlock)
+			self.assertIs(previousBlock, block.PreviousBlock)
+
+	def test_Skip(self):
+		expected = Transform(self.code, WhitespaceMode.Emit)
+		actual =   Transform(self.code, WhitespaceMode.Skip)
+
+		self.assertEqual(Significant(expected), Significant(actual))
+		self.assertEqual([], [block for block in actual if block.CATEGORY & BlockCategory.Whitespace])
+		self.assertLinked(actual)
+
+	def test_Coalesce(self):
+		expected = Transform(self.code, WhitespaceMode.Emit)
+		actual =   Transform(self.code, WhitespaceMode.Coalesce)
+
+		self.assertEqual(Significant(expected), Significant(actual))
+		self.assertLess(len(actual), len(expected))
+		self.assertLinked(actual)
+
+		runs =    [block for block in actual if block.CATEGORY & BlockCategory.Whitespace]
+		self.assertEqual(["  \n\n\n  ", "\n  ", "\t\n", "\n"], [block.Text for block in runs])
+		self.assertIsInstance(runs[0], EmptyLineBlock)
+		self.assertIs(LinebreakBlock, type(runs[1]))
+		for previousBlock, block in zip(actual, actual[1:]):
+			self.assertFalse(previousBlock.CATEGORY & block.CATEGORY & BlockCategory.Whitespace)
+
+	def test_Groups(self):
+		code = "library ieee;\n\n  use ieee.numeric_std.all;\n"
+		for whitespaceMode in WhitespaceMode:
+			with self.subTest(whitespaceMode=whitespaceMode):
+				groups = list(BlockToGroupParser.Transform(iter(Transform(code, whitespaceMode))))
+				self.assertEqual(["library ieee;", "use ieee.numeric_std.all;"], [group.Text for group in groups if group.Text.strip() and "Whitespace" not in type(group).__name__])
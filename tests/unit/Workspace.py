@@ -0,0 +1,98 @@
+import pickle
+from concurrent.futures         import ThreadPoolExecutor
+from pathlib                    import Path
+from tempfile                   import TemporaryDirectory
+from unittest                   import TestCase
+
+from pyVHDLParser.Token.Parser  import Tokenizer
+from pyVHDLParser.Blocks        import TokenToBlockParser
+from pyVHDLParser.Columnar      import ColumnarDocument
+from pyVHDLParser.Cache         import ParseCache
+from pyVHDLParser.FastForward   import DesignUnitKind
+from pyVHDLParser.Workspace     import Workspace, ParseMode, ParseFile
+
+from tests.unit.Common          import Initializer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+def setUpModule():
+	i = Initializer()
+
+
+def Describe(result) -> list:
+	if isinstance(result, ColumnarDocument):
+		return [(token.__class__.__name__, str(token)) for token in result.GetTokens()] + [block.Text for block in result.GetBlocks()]
+	return repr(result)
+
+
+class Parallel(TestCase):
+	sources = {
+		"a.vhdl":         "library ieee;\nuse ieee.std_logic_1164.all;\n\nentity a is\nend entity;\n",
+		"b.vhdl":         "entity b is\nend entity;\n\narchitecture rtl of b is\nbegin\nend architecture;\n",
+		"sub/c.vhdl":     "package c is\nend package;\n",
+		"sub/broken.vhdl": "entity broken is\n  generic (\nend entity;\n"
+	}
+
+	def setUp(self):
+		self._directory = TemporaryDirectory()
+		self.root = Path(self._directory.name)
+		for name, code in self.sources.items():
+			file = self.root / name
+			file.parent.mkdir(exist_ok=True)
+			file.write_text(code)
+
+	def tearDown(self):
+		self._directory.cleanup()
+
+	def test_Globs(self):
+		workspace = Workspace([self.root / "a.vhdl", str(self.root / "**" / "*.vhdl")])
+		self.assertEqual(["a.vhdl", "b.vhdl", "sub/broken.vhdl", "sub/c.vhdl"], [file.relative_to(self.root).as_posix() for file in workspace.Files])
+
+	def test_Blocks(self):
+		workspace = Workspace([self.root / "a.vhdl", self.root / "sub" / "broken.vhdl"])
+		good, broken = workspace.Parse(ParseMode.Blocks, workers=2)
+
+		self.assertFalse(good.Failed)
+		self.assertIsInstance(good.Result, ColumnarDocument)
+		blocks = list(TokenToBlockParser.Transform(Tokenizer.GetVHDLTokenizer(self.sources["a.vhdl"])))
+		self.assertEqual([block.Text for block in blocks], [block.Text for block in good.Result.GetBlocks()])
+
+		self.assertTrue(broken.Failed)
+		self.assertIsNone(broken.Result)
+		self.assertEqual("pyVHDLParser.Blocks.BlockParserException", broken.ErrorClass)
+
+	def test_DesignUnits(self):
+		workspace = Workspace([self.root / "b.vhdl", self.root / "sub" / "c.vhdl"])
+		results =   workspace.Parse(ParseMode.DesignUnits, executor=ThreadPoolExecutor(2))
+
+		self.assertEqual([[DesignUnitKind.Entity, DesignUnitKind.Architecture], [DesignUnitKind.Package]], [[unit.Kind for unit in result.Result] for result in results])
+
+	def test_InProcess(self):
+		workspace = Workspace([str(self.root / "**" / "*.vhdl")])
+		self.assertEqual(
+			[(result.Path, result.ErrorClass) for result in workspace.Parse(ParseMode.Tokens, workers=2)],
+			[(result.Path, result.ErrorClass) for result in workspace.Parse(ParseMode.Tokens, workers=0)]
+		)
+
+	def test_Cache(self):
+		workspace = Workspace([self.root / "a.vhdl", self.root / "b.vhdl"])
+		cache =     ParseCache(self.root / "cache")
+		expected =  [Describe(result.Result) for result in workspace.Parse(workers=0)]
+
+		self.assertEqual(expected, [Describe(result.Result) for result in workspace.Parse(workers=2, cache=cache)])
+		self.assertEqual(2, len(list(cache.Directory.glob("*.entry"))))
+		self.assertEqual(expected, [Describe(result.Result) for result in workspace.Parse(workers=0, cache=cache)])
+
+	def test_Pickle(self):
+		for file in ("a.vhdl", "sub/broken.vhdl"):
+			for mode in ParseMode:
+				with self.subTest(file=file, mode=mode):
+					result = ParseFile(self.root / file, mode)
+					copy =   pickle.loads(pickle.dumps(result))
+					self.assertEqual(repr(result), repr(copy))
+					self.assertEqual(Describe(result.Result), Describe(copy.Result))